@@ -23,6 +23,10 @@ interface StatsSummary {
   daysLeftDistribution: Array<{ daysLeft: string; count: number; source: string }>;
 }
 
+// Optional URL of the stats_snapshot.json written by mini_tender.py. When set,
+// the "All" view shows the precomputed snapshot instead of aggregating here.
+const STATS_SNAPSHOT_URL = import.meta.env.VITE_STATS_SNAPSHOT_URL as string | undefined;
+
 const COLORS = ['#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', '#ec4899', '#06b6d4', '#eab308'];
 
 export const StatisticsPage: React.FC = () => {
@@ -30,8 +34,21 @@ export const StatisticsPage: React.FC = () => {
   const { addNotification } = useNotification();
   const [stats, setStats] = useState<StatsSummary | null>(null);
   const [viewMode, setViewMode] = useState<'all' | 'relevant'>('all');
+  const [snapshot, setSnapshot] = useState<StatsSummary | null>(null);
+
+  useEffect(() => {
+    if (!STATS_SNAPSHOT_URL) return;
+    fetch(STATS_SNAPSHOT_URL)
+      .then((res) => (res.ok ? res.json() : null))
+      .then((data: StatsSummary | null) => setSnapshot(data))
+      .catch(() => setSnapshot(null));
+  }, []);
 
   useEffect(() => {
+    if (viewMode === 'all' && snapshot) {
+      setStats(snapshot);
+      return;
+    }
     if (tenders.length > 0) {
       const filteredTenders = viewMode === 'relevant' ? tenders.filter((t) => t.marked_relevant) : tenders;
 
@@ -102,7 +119,7 @@ export const StatisticsPage: React.FC = () => {
         daysLeftDistribution,
       });
     }
-  }, [tenders, viewMode]);
+  }, [tenders, viewMode, snapshot]);
 
   const handleExportStats = () => {
     if (!stats) return;
@@ -5,13 +5,79 @@ import csv
 from datetime import datetime
 import time
 import re
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+import sqlite3
+import threading
+import queue
+import gzip
+import hashlib
+import heapq
+import mmap
+import struct
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+from urllib.parse import urljoin, urlsplit
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache
+from itertools import islice
+
+# Selenium is only needed for scraping. load_selenium() imports it on first
+# use so audits, exports and the menu start fast without a browser stack.
+class _SeleniumNotLoaded(Exception):
+    """Placeholder for Selenium exception types until load_selenium() runs."""
+
+
+webdriver = By = WebDriverWait = EC = Options = Keys = None
+TimeoutException = NoSuchElementException = _SeleniumNotLoaded
+
+
+def load_selenium():
+    """Import the Selenium modules into this module's globals (once)."""
+    global webdriver, By, WebDriverWait, EC, Options, Keys
+    global TimeoutException, NoSuchElementException
+    if webdriver is not None:
+        return
+    from selenium import webdriver as _webdriver
+    from selenium.webdriver.common.by import By as _By
+    from selenium.webdriver.support.ui import WebDriverWait as _WebDriverWait
+    from selenium.webdriver.support import expected_conditions as _EC
+    from selenium.webdriver.chrome.options import Options as _Options
+    from selenium.webdriver.common.keys import Keys as _Keys
+    from selenium.common.exceptions import (
+        TimeoutException as _TimeoutException,
+        NoSuchElementException as _NoSuchElementException,
+    )
+    By, WebDriverWait, EC, Options, Keys = _By, _WebDriverWait, _EC, _Options, _Keys
+    TimeoutException, NoSuchElementException = _TimeoutException, _NoSuchElementException
+    webdriver = _webdriver
+
+
+# The HTTP client modules are only needed by the browserless scraper.
+ssl = http = None
+
+
+def load_http():
+    """Import ssl and http.client into this module's globals (once)."""
+    global ssl, http
+    if http is None:
+        import ssl
+        import http.client
+
+
+# NumPy is optional: only the columnar analytics view (TenderColumns) uses it.
+np = None
+
+
+def load_numpy():
+    """Import NumPy into this module's globals; False if it isn't installed."""
+    global np
+    if np is None:
+        try:
+            import numpy as _np
+        except ImportError:
+            return False
+        np = _np
+    return True
+
 
 # Improved include/exclude lists for a hybrid filter
 INCLUDE_KEYWORDS = [
@@ -32,10 +98,734 @@ EXCLUDE_KEYWORDS = [
     "cement", "pavement", "asphalt"
 ]
 
+# Title words that on their own confirm an architecture-related tender
+STRONG_CONTEXT_KEYWORDS = [
+    "building", "hospital", "school", "campus", "office", "complex", "hall",
+    "housing", "facility", "center"
+]
+
+# High-confidence consultancy/design indicators
+HIGH_CONFIDENCE_KEYWORDS = [
+    "dpr", "feasibility", "master plan", "architect", "consult", "supervision", "design"
+]
+
+# How TenderManager persists new tenders:
+#   'json'  - append each insert to tenders.jsonl, then rewrite tenders.json
+#             in batches (every 100 inserts or 30 s) and clear the log
+#   'jsonl' - append each insert to tenders.jsonl and only fold the log back
+#             into tenders.json when compact_log() runs (end of each scrape)
+#   'sqlite' - keep tenders in tenders.db and query it with indexed SQL
+STORAGE_MODE = os.environ.get("TENDER_STORAGE_MODE", "json")
+
+# How seen keys are held:
+#   'set'         - Python sets saved as seen_keys.json (original behaviour)
+#   'fingerprint' - memory-mapped 64-bit hashes in seen_keys.fp (FingerprintIndex)
+SEEN_INDEX = os.environ.get("TENDER_SEEN_INDEX", "set")
+
+# Date formats found in stored deadlines / notice dates (scraped rows keep
+# Bolpatra's 'DD-MM-YYYY HH:MM', manual entries use 'YYYY-MM-DD').
+TENDER_DATE_FORMATS = [
+    "%Y-%m-%d %H:%M", "%d-%m-%Y %H:%M", "%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%Y/%m/%d"
+]
+
+
+def parse_tender_date(value):
+    """Parse a stored deadline/notice date; return a datetime or None."""
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    for fmt in TENDER_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=65536)
+def tender_epoch(value):
+    """parse_tender_date() as a POSIX timestamp (cached: dates repeat a lot)."""
+    dt = parse_tender_date(value)
+    return dt.timestamp() if dt is not None else None
+
+
+class KeywordMatcher:
+    """Precompiled matcher for the include/exclude keyword lists.
+
+    All single-word keywords are compiled into one regex alternation wrapped
+    in a lookahead, so one ``finditer`` over a word reports every keyword
+    inside it, overlaps included ('architect' and 'architectural'). Since a
+    keyword without spaces can never cross whitespace, each distinct word is
+    scanned once and its hits are memoized; the few multi-word keywords are
+    checked against the whole text. The resulting hit sets are exactly what
+    ``k in text`` reports for every keyword, so verdicts are unchanged.
+    """
+
+    max_cached_words = 200000
+
+    def __init__(self, include_keywords, exclude_keywords,
+                 strong_keywords=STRONG_CONTEXT_KEYWORDS,
+                 high_confidence_keywords=HIGH_CONFIDENCE_KEYWORDS):
+        self.include = tuple(include_keywords)
+        self.exclude = tuple(exclude_keywords)
+        self.include_set = frozenset(self.include)
+        self.exclude_set = frozenset(self.exclude)
+        self.strong_set = frozenset(strong_keywords)
+        self.high_confidence_set = frozenset(high_confidence_keywords)
+
+        terms = self.include_set | self.exclude_set | self.strong_set | self.high_confidence_set
+        words = sorted((t for t in terms if not any(c.isspace() for c in t)),
+                       key=lambda t: (-len(t), t))
+        self.phrases = tuple(sorted(t for t in terms if t not in words))
+        # Longest alternative first, so each position reports the longest
+        # keyword starting there; the shorter ones are found via _contained.
+        self._pattern = re.compile(
+            "(?=(" + "|".join(re.escape(t) for t in words) + "))"
+        )
+        self._contained = {
+            outer: tuple(inner for inner in words if outer.startswith(inner))
+            for outer in words
+        }
+        self._word_hits = {}
+
+    def word_hits(self, word):
+        """Return the frozenset of keywords found inside a single word."""
+        hits = self._word_hits.get(word)
+        if hits is None:
+            found = set()
+            contained = self._contained
+            for m in self._pattern.finditer(word):
+                found.update(contained[m.group(1)])
+            hits = frozenset(found)
+            if len(self._word_hits) >= self.max_cached_words:
+                self._word_hits.clear()
+            self._word_hits[word] = hits
+        return hits
+
+    def _title_verdict(self, hits):
+        """Apply the title-only rules to a precomputed hit set."""
+        # 1️⃣ Quick pre-filter
+        if not hits & self.include_set:
+            return False
+        if hits & self.exclude_set:
+            return False
+        # 2️⃣ Context reinforcement
+        if hits & self.strong_set:
+            return True
+        # 3️⃣ Catch high-confidence consultancy/design indicators
+        if hits & self.high_confidence_set:
+            return True
+        # 4️⃣ Hybrid heuristic: at least two positives, zero negatives
+        return sum(1 for k in self.include if k in hits) >= 2
+
+    def _hits(self, text, phrase_text=None):
+        """Keywords in the words of ``text`` plus phrases in ``phrase_text``."""
+        hits = set()
+        word_hits = self._word_hits
+        for word in text.split():
+            found = word_hits.get(word)
+            if found is None:
+                found = self.word_hits(word)
+            if found:
+                hits |= found
+        if phrase_text is None:
+            phrase_text = text
+        for phrase in self.phrases:
+            if phrase in phrase_text:
+                hits.add(phrase)
+        return hits
+
+    def is_architecture_related(self, title):
+        """Title-only verdict, identical to TenderManager.is_architecture_related."""
+        if not title:
+            return False
+        return self._title_verdict(self._hits(title.lower()))
+
+    def is_relevant(self, title, context=""):
+        """Hybrid verdict for title + context, scanning each word once."""
+        title_text = (title or "").strip().lower()
+        context_text = (context or "").strip().lower()
+
+        title_hits = self._hits(title_text)
+        if title_text and self._title_verdict(title_hits):
+            return True
+
+        combined = f"{title_text} {context_text}".strip()
+        if not combined:
+            return False
+        # Words never span the joining space, so only phrases need the
+        # combined text.
+        hits = title_hits | self._hits(context_text, combined)
+        if hits & self.exclude_set:
+            return False
+        return bool(hits & self.include_set)
+
+    def classify_many(self, items):
+        """Classify an iterable of titles or (title, context) pairs.
+
+        Returns a list of booleans in input order.
+        """
+        results = []
+        is_relevant = self.is_relevant
+        for item in items:
+            if isinstance(item, str):
+                results.append(is_relevant(item))
+            else:
+                title, context = item
+                results.append(is_relevant(title, context))
+        return results
+
+
+_keyword_matcher = None
+
+
+def get_keyword_matcher():
+    """Return the shared matcher, rebuilding it if the keyword lists changed."""
+    global _keyword_matcher
+    if (_keyword_matcher is None
+            or _keyword_matcher.include != tuple(INCLUDE_KEYWORDS)
+            or _keyword_matcher.exclude != tuple(EXCLUDE_KEYWORDS)):
+        _keyword_matcher = KeywordMatcher(INCLUDE_KEYWORDS, EXCLUDE_KEYWORDS)
+    return _keyword_matcher
+
+
+def rule_set_version(matcher):
+    """Short hash of a matcher's keyword lists; changes whenever a list does."""
+    rules = json.dumps([matcher.include, matcher.exclude,
+                        sorted(matcher.strong_set), sorted(matcher.high_confidence_set)])
+    return hashlib.blake2b(rules.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class RelevanceCache:
+    """Persisted relevance verdicts, keyed by a hash of title and context.
+
+    The file records the rule-set version it was built with; verdicts are
+    dropped whenever the keyword lists change, either on disk (load) or in
+    this process (the shared matcher was rebuilt).
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.matcher = None
+        self.version = None
+        self.verdicts = {}
+        self.dirty = False
+        self.loaded = False
+
+    @staticmethod
+    def key(title, context=""):
+        text = f"{title or ''}\x1f{context or ''}"
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+    def _sync_rules(self):
+        matcher = get_keyword_matcher()
+        if matcher is self.matcher:
+            return matcher
+        self.matcher = matcher
+        version = rule_set_version(matcher)
+        if not self.loaded:
+            self.loaded = True
+            self.load(version)
+        if version != self.version:
+            self.version = version
+            self.verdicts = {}
+            self.dirty = True
+        return matcher
+
+    def load(self, version):
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == version:
+                self.version = version
+                self.verdicts = data.get('verdicts', {})
+        except Exception as e:
+            print(f"⚠ Error loading relevance cache: {e}")
+
+    def save(self):
+        if not self.dirty:
+            return
+        try:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'verdicts': self.verdicts}, f)
+            self.dirty = False
+        except Exception as e:
+            print(f"⚠ Error saving relevance cache: {e}")
+
+    def classify_many(self, items, save=True):
+        """Like KeywordMatcher.classify_many, computing only unseen items.
+
+        New verdicts are written to disk unless ``save`` is False (then
+        call ``save()`` later, e.g. after a batch of inserts).
+        """
+        matcher = self._sync_rules()
+        results = []
+        misses = []
+        for item in items:
+            title, context = (item, "") if isinstance(item, str) else item
+            key = self.key(title, context)
+            verdict = self.verdicts.get(key)
+            if verdict is None:
+                misses.append((len(results), key, title, context))
+            results.append(verdict)
+        if misses:
+            verdicts = matcher.classify_many((title, context) for _, _, title, context in misses)
+            for (i, key, _, _), verdict in zip(misses, verdicts):
+                self.verdicts[key] = results[i] = 1 if verdict else 0
+            self.dirty = True
+            if save:
+                self.save()
+        return [bool(v) for v in results]
+
+class GroupCommit:
+    """Batch repeated saves of one file into occasional flushes.
+
+    Each change calls ``mark_dirty()``; ``save`` only runs once
+    ``max_pending`` changes have piled up or ``max_delay`` seconds have
+    passed since the first unsaved change. Call ``flush()`` at the end of a
+    run (ideally from a ``finally``) to write whatever is left.
+    """
+
+    def __init__(self, save, max_pending=100, max_delay=5.0):
+        self.save = save
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.pending = 0
+        self.first_pending_at = None
+
+    def mark_dirty(self):
+        """Record one unsaved change and flush if a threshold is reached."""
+        now = time.monotonic()
+        if self.first_pending_at is None:
+            self.first_pending_at = now
+        self.pending += 1
+        if self.pending >= self.max_pending or now - self.first_pending_at >= self.max_delay:
+            self.flush()
+
+    def flush(self):
+        """Save now if anything changed since the last save."""
+        if not self.pending:
+            return
+        self.save()
+        self.pending = 0
+        self.first_pending_at = None
+
+
+@contextmanager
+def atomic_path(filename):
+    """Yield a temp path next to filename; on success fsync it and rename it over filename.
+
+    Readers (and a crash at any point) see either the old file or the
+    complete new one, never a truncated mix.
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    tmp = os.path.join(directory, f".{os.path.basename(filename)}.tmp")
+    try:
+        yield tmp
+        with open(tmp, 'ab') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class WriteAheadLog:
+    """Append-only JSON Lines log of changes not yet in a snapshot file.
+
+    Each ``append`` is flushed and (with ``fsync=True``) synced to disk
+    before returning, so a record survives a crash right after the call.
+    ``records()`` skips a partial last line left by a crash mid-append,
+    and the first ``append`` after reopening truncates it away so the new
+    record starts on its own line; ``clear()`` drops the log once its
+    records are in the snapshot.
+    """
+
+    def __init__(self, filename, fsync=True):
+        self.filename = filename
+        self.fsync = fsync
+        self._file = None
+
+    def exists(self):
+        return os.path.exists(self.filename)
+
+    def _truncate_partial_tail(self):
+        """Cut a crash-torn last line back to the previous newline."""
+        with open(self.filename, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            end = size
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                if newline != -1:
+                    end = start + newline + 1
+                    break
+                end = start
+            f.truncate(end)
+            os.fsync(f.fileno())
+
+    def append(self, record):
+        if self._file is None:
+            if self.exists():
+                self._truncate_partial_tail()
+            self._file = open(self.filename, 'a', encoding='utf-8')
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def records(self):
+        if not self.exists():
+            return
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append can leave a partial last line
+                    print(f"⚠ Skipping unreadable line {line_no} in {self.filename}")
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def clear(self):
+        self.close()
+        if self.exists():
+            os.remove(self.filename)
+
+
+class _MappedFingerprints:
+    """Read-only sequence view of a sorted file of big-endian uint64s."""
+
+    def __init__(self, buf):
+        self.buf = buf
+
+    def __len__(self):
+        return len(self.buf) // 8
+
+    def __getitem__(self, i):
+        return struct.unpack_from('>Q', self.buf, i * 8)[0]
+
+    def __iter__(self):
+        for (value,) in struct.iter_unpack('>Q', self.buf):
+            yield value
+
+
+class FingerprintIndex:
+    """Set of seen keys stored as 64-bit hashes instead of strings.
+
+    Merged fingerprints live in ``filename`` as a sorted array of uint64s
+    that is memory-mapped and searched with bisect, so opening the index
+    costs the same whether it holds a thousand keys or ten million. New
+    keys go into an in-memory delta set; ``save()`` appends them to
+    ``filename + '.delta'`` and merges the delta into the sorted file once
+    it grows past ``merge_threshold``.
+
+    Supports ``add``, ``in`` and ``len`` like the set it replaces. Two
+    distinct keys sharing a 64-bit hash is possible but vanishingly rare
+    (~1 in 10^7 at a million keys); the cost is one skipped tender.
+    """
+
+    def __init__(self, filename, merge_threshold=10000):
+        self.filename = filename
+        self.delta_filename = filename + ".delta"
+        self.merge_threshold = merge_threshold
+        self.delta = set()
+        self.unsaved = []
+        self._file = None
+        self._mmap = None
+        self.merged = _MappedFingerprints(b"")
+        self._open()
+        if os.path.exists(self.delta_filename):
+            with open(self.delta_filename, 'rb') as f:
+                self.delta.update(v for (v,) in struct.iter_unpack('>Q', f.read()))
+
+    @staticmethod
+    def fingerprint(key):
+        return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def exists(self):
+        return os.path.exists(self.filename) or os.path.exists(self.delta_filename)
+
+    def _open(self):
+        if os.path.exists(self.filename) and os.path.getsize(self.filename):
+            self._file = open(self.filename, 'rb')
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.merged = _MappedFingerprints(self._mmap)
+
+    def close(self):
+        self.merged = _MappedFingerprints(b"")
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+    def _in_merged(self, fp):
+        i = bisect_left(self.merged, fp)
+        return i < len(self.merged) and self.merged[i] == fp
+
+    def __contains__(self, key):
+        fp = self.fingerprint(key)
+        return fp in self.delta or self._in_merged(fp)
+
+    def __len__(self):
+        return len(self.merged) + len(self.delta)
+
+    def add(self, key):
+        fp = self.fingerprint(key)
+        if fp not in self.delta and not self._in_merged(fp):
+            self.delta.add(fp)
+            self.unsaved.append(fp)
+
+    def update(self, keys):
+        for key in keys:
+            self.add(key)
+
+    def save(self):
+        """Persist new keys; merge into the sorted file if the delta is large."""
+        if len(self.delta) >= self.merge_threshold or not os.path.exists(self.filename):
+            self.merge()
+            return
+        if self.unsaved:
+            with open(self.delta_filename, 'ab') as f:
+                f.write(b"".join(struct.pack('>Q', fp) for fp in self.unsaved))
+                f.flush()
+                os.fsync(f.fileno())
+            self.unsaved = []
+
+    def merge(self):
+        """Fold the delta into the sorted file (streamed, so memory stays flat)."""
+        tmp = self.filename + ".tmp"
+        with open(tmp, 'wb') as out:
+            chunk = []
+            last = None
+            for fp in heapq.merge(self.merged, sorted(self.delta)):
+                if fp == last:
+                    continue
+                last = fp
+                chunk.append(struct.pack('>Q', fp))
+                if len(chunk) >= 65536:
+                    out.write(b"".join(chunk))
+                    chunk = []
+            out.write(b"".join(chunk))
+            out.flush()
+            os.fsync(out.fileno())
+        self.close()
+        os.replace(tmp, self.filename)
+        if os.path.exists(self.delta_filename):
+            os.remove(self.delta_filename)
+        self.delta = set()
+        self.unsaved = []
+        self._open()
+
+
+class _PipelineError:
+    """Carries an exception from a pipeline thread to the consumer."""
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+_PIPELINE_END = object()
+
+
+def pipelined(source, stages=(), maxsize=64):
+    """Iterate ``source`` in a producer thread, through ``stages`` threads.
+
+    Each stage is a function item -> item running in its own thread. The
+    threads are connected by bounded queues of ``maxsize`` items, so a
+    slow consumer holds the producer back (backpressure). Items come out
+    in source order. Closing the returned generator (e.g. ``break`` in
+    the caller) stops the producer before its next item and closes
+    ``source`` in the producer thread. An exception in any thread is
+    re-raised in the consumer.
+    """
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize) for _ in range(len(stages) + 1)]
+
+    def put(q, item):
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(q):
+        while True:
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                if stop.is_set():
+                    return _PIPELINE_END
+
+    def produce():
+        try:
+            for item in source:
+                if not put(queues[0], item):
+                    break
+        except Exception as e:
+            put(queues[0], _PipelineError(e))
+        finally:
+            close = getattr(source, 'close', None)
+            if close:
+                close()
+            put(queues[0], _PIPELINE_END)
+
+    def run_stage(fn, inq, outq):
+        while True:
+            item = get(inq)
+            if item is _PIPELINE_END or isinstance(item, _PipelineError):
+                put(outq, item)
+                return
+            try:
+                item = fn(item)
+            except Exception as e:
+                put(outq, _PipelineError(e))
+                return
+            if not put(outq, item):
+                return
+
+    threads = [threading.Thread(target=produce, daemon=True)]
+    threads += [
+        threading.Thread(target=run_stage, args=(fn, queues[i], queues[i + 1]), daemon=True)
+        for i, fn in enumerate(stages)
+    ]
+    for t in threads:
+        t.start()
+    try:
+        while True:
+            item = queues[-1].get()
+            if item is _PIPELINE_END:
+                return
+            if isinstance(item, _PipelineError):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        for t in threads:
+            t.join()
+
+
+class ScrapeMetrics:
+    """Per-phase timings and counters for one scrape run.
+
+    Phases are timed with ``with metrics.phase(name): ...``; repeated
+    phases accumulate (count, total and max seconds). With parallel workers
+    the totals are summed over all worker threads. ``report()`` returns
+    everything as a JSON-ready dict.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self.start = time.perf_counter()
+        self.elapsed = None
+        self.phases = {}  # name -> [count, total seconds, max seconds]
+        self.counters = Counter()
+        self.rows_per_page = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        with self.lock:
+            stats = self.phases.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] += n
+
+    def page_rows(self, page, rows):
+        with self.lock:
+            self.rows_per_page[str(page)] = rows
+
+    def finish(self):
+        self.elapsed = time.perf_counter() - self.start
+
+    def report(self):
+        elapsed = self.elapsed if self.elapsed is not None else time.perf_counter() - self.start
+        rows = list(self.rows_per_page.values())
+        return {
+            'started_at': self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            'elapsed_seconds': round(elapsed, 4),
+            'phases': {
+                name: {'count': c, 'total_seconds': round(total, 6), 'max_seconds': round(mx, 6)}
+                for name, (c, total, mx) in sorted(self.phases.items())
+            },
+            'counters': dict(self.counters),
+            'pages': len(rows),
+            'rows_per_page': self.rows_per_page,
+            'avg_rows_per_page': round(sum(rows) / len(rows), 2) if rows else 0,
+            'rows_per_second': round(self.counters['rows'] / elapsed, 2) if elapsed else 0,
+        }
+
+    def save(self, directory):
+        """Write the report as <directory>/scrape_<timestamp>.json; returns the path."""
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"scrape_{self.started_at.strftime('%Y%m%d_%H%M%S')}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.report(), f, indent=2)
+            return path
+        except Exception as e:
+            print(f"⚠ Error saving scrape metrics: {e}")
+            return None
+
+    def print_summary(self):
+        print("\n⏱ Scrape phases:")
+        for name, (count, total, mx) in sorted(self.phases.items(), key=lambda i: -i[1][1]):
+            print(f"   {name:<16} {count:>6}x  total {total:.2f}s  max {mx:.3f}s")
+
+
 class BolpatraScraper:
+    base_url = "https://bolpatra.gov.np/egp"
+
+    # CSS selectors for the listing table rows
+    ROWS_SELECTOR = "table#dashBoardBidResult tbody tr"
+
     def __init__(self, headless=True):
         self.headless = headless
         self.driver = None
+        # Listing page currently loaded (1-based)
+        self.current_page = None
+        # If set, every extracted page is saved here as page_NNN.json so the
+        # crawl can be replayed offline with ReplayScraper
+        self.record_dir = None
+        # Optional fixed pause between pages; navigation itself waits on
+        # page events, so this is only for politeness.
+        self.page_delay = 0.0
+        # wait name -> list of seconds spent in that wait
+        self.wait_timings = {}
+        # ScrapeMetrics for the current run, set by TenderManager.scrape_bolpatra
+        self.metrics = None
+        # Optional PageFingerprints: unchanged pages are skipped (or end the crawl)
+        self.page_fingerprints = None
+        # None, 'skipped' or 'stop' for the page last read by check_page
+        self.page_status = None
         
     # Checkpoint system removed: persistent de-duplication is handled via
     # TenderManager.seen_keys (seen_keys.json). The checkpoint functions were
@@ -44,6 +834,13 @@ class BolpatraScraper:
     
     def init_driver(self):
         """Initialize Chrome WebDriver with options."""
+        try:
+            load_selenium()
+        except ImportError as e:
+            print(f"✗ Selenium is not installed: {e}")
+            print("Install it with: pip install selenium")
+            return False
+
         chrome_options = Options()
         
         if self.headless:
@@ -66,6 +863,63 @@ class BolpatraScraper:
             print("Make sure ChromeDriver is installed: pip install webdriver-manager")
             return False
     
+    def phase(self, name):
+        """Time a block under name in self.metrics (no-op without metrics)."""
+        return self.metrics.phase(name) if self.metrics else nullcontext()
+
+    def check_page(self, rows):
+        """Fingerprint the current page's rows; True if it should not be parsed.
+
+        Sets page_status to 'skipped' or 'stop' (per the fingerprint
+        store's policy) when the page is unchanged since the last crawl.
+        """
+        self.page_status = None
+        store = self.page_fingerprints
+        if store is None or not rows:
+            return False
+        page = self.current_page or 1
+        if not store.observe(page, rows):
+            return False
+        self.page_status = 'stop' if store.policy == 'stop' else 'skipped'
+        if self.metrics:
+            self.metrics.count('pages_unchanged')
+        print(f"   Page {page} unchanged since the last crawl"
+              + (" - stopping" if self.page_status == 'stop' else " - skipped"))
+        return True
+
+    def timed_wait(self, name, condition, timeout=10):
+        """WebDriverWait(...).until(condition), recording the time under name."""
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout).until(condition)
+        finally:
+            self.wait_timings.setdefault(name, []).append(time.perf_counter() - start)
+
+    def wait_summary(self):
+        """Return {wait name: {'count', 'total', 'max'}} in seconds."""
+        return {
+            name: {'count': len(times), 'total': sum(times), 'max': max(times)}
+            for name, times in self.wait_timings.items()
+        }
+
+    def print_wait_summary(self):
+        if not self.wait_timings:
+            return
+        print("\n⏱ Navigation waits:")
+        for name, stats in sorted(self.wait_summary().items(), key=lambda i: -i[1]['total']):
+            print(f"   {name:<16} {stats['count']:>4}x  total {stats['total']:.2f}s  max {stats['max']:.2f}s")
+
+    @staticmethod
+    def rows_replaced(old_row, old_text):
+        """Wait condition: the first listing row went stale or changed text."""
+        def condition(driver):
+            try:
+                return old_row.text != old_text
+            except Exception:
+                # StaleElementReferenceException: the table was re-rendered
+                return True
+        return condition
+
     def close(self):
         """Close the browser."""
         if self.driver:
@@ -83,30 +937,9 @@ class BolpatraScraper:
             if not self.init_driver():
                 return
         
-        base_url = "https://bolpatra.gov.np/egp"
-        
         try:
-            print("\n📡 Connecting to Bolpatra...")
-            
-            # Always start from the main search page
-            self.driver.get(f"{base_url}/searchOpportunity")
-            time.sleep(3)  # Wait for page load
-            print("✓ Page loaded successfully")
-
-            # Try to find and click on "Published Bids" or similar
-            try:
-                # Look for the bid opportunities link
-                opportunities_link = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.LINK_TEXT, "Published bids"))
-                )
-                opportunities_link.click()
-                time.sleep(2)
-            except Exception:
-                # Alternative: direct navigation
-                self.driver.get(f"{base_url}/searchOpportunity")
-                time.sleep(3)
-            
-            print("✓ Navigated to tender listings")
+            with self.phase('page_navigation'):
+                self.open_listing()
             
             # Scrape all pages
             page = 1
@@ -115,6 +948,7 @@ class BolpatraScraper:
             
             while True:
                 print(f"\n📄 Scraping page {page}...")
+                self.current_page = page
                 tenders_on_page = 0
                 
                 # Get tenders one at a time
@@ -125,20 +959,26 @@ class BolpatraScraper:
                 
                 print(f"   Found {tenders_on_page} tenders on this page")
                 print(f"   Total tenders so far: {total_tenders}")
+                if self.page_status == 'stop':
+                    break
                 
                 # Handle pagination: try to go to the next page; stop when navigation fails
                 next_page = page + 1
                 if scrape_all_pages:
-                    if not self.go_to_next_page(next_page):
+                    with self.phase('page_navigation'):
+                        moved = self.go_to_next_page(next_page)
+                    if not moved:
                         print("   ✓ Reached last page or navigation failed")
                         break
                     page = next_page  # Update page number only after successful navigation
                 else:
                     break
                 
-                time.sleep(2)  # Be polite to the server
+                if self.page_delay:
+                    time.sleep(self.page_delay)  # Be polite to the server
             
             print(f"\n✓ Total tenders scraped: {total_tenders}")
+            self.print_wait_summary()
             
         except Exception as e:
             print(f"✗ Error during scraping: {e}")
@@ -146,48 +986,269 @@ class BolpatraScraper:
             import traceback
             traceback.print_exc()
             
-    def scrape_current_page(self):
-        """Scrape tenders from the current page, yielding them one at a time."""
+    def open_listing(self):
+        """Load the search page and navigate to the tender listings (page 1)."""
+        print("\n📡 Connecting to Bolpatra...")
+        
+        # Always start from the main search page
+        self.driver.get(f"{self.base_url}/searchOpportunity")
+        # Ready as soon as either the "Published bids" link or the listing shows up
         try:
-            # Wait for the main tender table
-            tender_table = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table#dashBoardBidResult"))
-            )
-            
-            # Find all tender rows
-            tender_rows = tender_table.find_elements(By.CSS_SELECTOR, "table#dashBoardBidResult tbody tr")
-            print(f"   Found {len(tender_rows)} tender rows")
-            
-            for row in tender_rows:
-                try:
-                    tender_data = self.parse_tender_row(row)
-                    if tender_data:
-                        yield tender_data  # Yield each tender as it's parsed
-                except Exception as e:
-                    print(f"   ⚠ Error parsing row: {str(e)}")
-                    continue
-            
-        except TimeoutException:
-            print("   Timeout waiting for tender table")
-        except Exception as e:
-            print(f"   Error scraping page: {e}")
-            
-        return  # Generator function ends here
-    
-    def parse_tender_row(self, row):
-        """Parse individual tender row."""
+            self.timed_wait("initial_load", lambda d: (
+                d.find_elements(By.LINK_TEXT, "Published bids")
+                or d.find_elements(By.CSS_SELECTOR, self.ROWS_SELECTOR)
+            ), timeout=15)
+        except Exception:
+            pass  # fall through to the direct-navigation fallback below
+        print("✓ Page loaded successfully")
+
+        # Try to find and click on "Published Bids" or similar
         try:
-            # Get all cells in the row
-            cells = row.find_elements(By.TAG_NAME, "td")
-            
-            # Known column indices (0-based)
-            SI_NO = 0
-            IFB_NO = 1
-            TITLE = 2
-            PUBLIC_ENTITY = 3
-            PROCUREMENT_TYPE = 4
-            STATUS = 5
-            NOTICE_DATE = 6
+            links = self.driver.find_elements(By.LINK_TEXT, "Published bids")
+            if links:
+                # Look for the bid opportunities link
+                opportunities_link = self.timed_wait(
+                    "link_clickable", EC.element_to_be_clickable((By.LINK_TEXT, "Published bids"))
+                )
+                opportunities_link.click()
+            self.timed_wait("listing_rows", EC.presence_of_element_located((By.CSS_SELECTOR, self.ROWS_SELECTOR)))
+        except Exception:
+            # Alternative: direct navigation
+            self.driver.get(f"{self.base_url}/searchOpportunity")
+            try:
+                self.timed_wait("listing_rows", EC.presence_of_element_located((By.CSS_SELECTOR, self.ROWS_SELECTOR)))
+            except Exception:
+                pass
+        
+        print("✓ Navigated to tender listings")
+
+    def new_worker(self):
+        """Create the scraper used by one parallel crawl worker."""
+        worker = type(self)(headless=self.headless)
+        worker.record_dir = self.record_dir
+        worker.metrics = self.metrics
+        worker.page_fingerprints = self.page_fingerprints
+        return worker
+
+    def scrape_tenders_parallel(self, workers=4, scrape_all_pages=True):
+        """
+        Scrape listing pages with a pool of browsers, yielding in page order.
+
+        Each worker runs its own WebDriver, claims the next unclaimed page
+        number, jumps to it with the pager and parses its rows. Pages are
+        yielded strictly in order (1, 2, 3, ...) so the caller sees the same
+        stream as scrape_tenders. The crawl ends at the first page that is
+        empty or cannot be reached; closing the generator early (e.g. a
+        'break' in the caller) stops the workers.
+        """
+        lock = threading.Condition()
+        state = {'next_page': 1, 'last_page': None if scrape_all_pages else 1}
+        pages = {}  # page -> list of tenders, or None when the page is missing
+        stop = threading.Event()
+
+        def claim_page():
+            with lock:
+                page = state['next_page']
+                if stop.is_set() or (state['last_page'] is not None and page > state['last_page']):
+                    return None
+                state['next_page'] += 1
+                return page
+
+        def publish(page, tenders):
+            with lock:
+                pages[page] = tenders
+                if tenders is None and (state['last_page'] is None or page - 1 < state['last_page']):
+                    state['last_page'] = page - 1
+                lock.notify_all()
+
+        def run_worker(worker_no):
+            scraper = self.new_worker()
+            page = None
+            try:
+                with scraper.phase('driver_startup'):
+                    started = scraper.init_driver()
+                if not started:
+                    return
+                with scraper.phase('page_navigation'):
+                    scraper.open_listing()
+                current = 1
+                while True:
+                    page = claim_page()
+                    if page is None:
+                        break
+                    if page != current:
+                        with scraper.phase('page_navigation'):
+                            moved = scraper.go_to_next_page(page)
+                    if page != current and not moved:
+                        publish(page, None)
+                        page = None
+                        break
+                    current = scraper.current_page = page
+                    print(f"\n📄 [worker {worker_no}] Scraping page {page}...")
+                    tenders = list(scraper.scrape_current_page())
+                    if scraper.page_status == 'skipped':
+                        # Unchanged page: nothing to yield, but the crawl goes on
+                        publish(page, [])
+                        page = None
+                        continue
+                    publish(page, tenders or None)
+                    page = None
+                    if not tenders:
+                        break
+            except Exception as e:
+                print(f"✗ [worker {worker_no}] Error during scraping: {e}")
+            finally:
+                # A page claimed but never delivered ends the crawl there
+                if page is not None and page not in pages:
+                    publish(page, None)
+                scraper.close()
+                with lock:
+                    state['running'] -= 1
+                    lock.notify_all()
+
+        state['running'] = workers
+        threads = [
+            threading.Thread(target=run_worker, args=(i + 1,), daemon=True)
+            for i in range(workers)
+        ]
+        for t in threads:
+            t.start()
+
+        total_tenders = 0
+        try:
+            page = 1
+            while True:
+                with lock:
+                    while page not in pages and state['running'] > 0:
+                        lock.wait()
+                    tenders = pages.pop(page, None)
+                if tenders is None:
+                    break
+                self.current_page = page
+                print(f"   Page {page}: {len(tenders)} tenders")
+                for tender in tenders:
+                    total_tenders += 1
+                    yield tender
+                page += 1
+            print(f"\n✓ Total tenders scraped: {total_tenders}")
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+
+    # Returns the listing table body as a 2D array of trimmed cell strings,
+    # replacing one WebDriver round-trip per row and per cell.
+    TABLE_ROWS_SCRIPT = """
+        var rows = document.querySelectorAll('table#dashBoardBidResult tbody tr');
+        return Array.prototype.map.call(rows, function (tr) {
+            return Array.prototype.map.call(tr.querySelectorAll('td'), function (td) {
+                return (td.innerText || td.textContent || '').trim();
+            });
+        });
+    """
+
+    def extract_table_rows(self):
+        """Fetch every listing row's cell texts with a single execute_script call."""
+        return self.driver.execute_script(self.TABLE_ROWS_SCRIPT) or []
+
+    # First link (detail page) of each listing row, or null
+    TABLE_LINKS_SCRIPT = """
+        var rows = document.querySelectorAll('table#dashBoardBidResult tbody tr');
+        return Array.prototype.map.call(rows, function (tr) {
+            var a = tr.querySelector('a[href]');
+            return a ? a.href : null;
+        });
+    """
+
+    def extract_row_links(self):
+        """Return the detail-page link of every listing row (None where absent)."""
+        return self.driver.execute_script(self.TABLE_LINKS_SCRIPT) or []
+
+    def wait_for_table(self):
+        """Wait for the listing table and return its element."""
+        return self.timed_wait(
+            "table", EC.presence_of_element_located((By.CSS_SELECTOR, "table#dashBoardBidResult"))
+        )
+
+    def record_page(self, rows):
+        """Save one page's extracted rows to record_dir for offline replay."""
+        os.makedirs(self.record_dir, exist_ok=True)
+        path = os.path.join(self.record_dir, f"page_{self.current_page or 1:03d}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rows, f, ensure_ascii=False)
+
+    def scrape_current_page(self):
+        """Scrape tenders from the current page, yielding them one at a time."""
+        try:
+            # Wait for the main tender table
+            with self.phase('table_wait'):
+                tender_table = self.wait_for_table()
+            
+            try:
+                with self.phase('row_extract'):
+                    rows = self.extract_table_rows()
+            except Exception as e:
+                # Fall back to reading the rows element by element
+                print(f"   ⚠ Bulk extraction failed ({e}); reading rows one by one")
+                rows = [
+                    [cell.text.strip() for cell in row.find_elements(By.TAG_NAME, "td")]
+                    for row in tender_table.find_elements(By.CSS_SELECTOR, "table#dashBoardBidResult tbody tr")
+                ]
+            print(f"   Found {len(rows)} tender rows")
+            if self.metrics:
+                self.metrics.page_rows(self.current_page or 1, len(rows))
+            if self.record_dir:
+                self.record_page(rows)
+            if self.check_page(rows):
+                return
+            try:
+                links = self.extract_row_links()
+            except Exception:
+                links = []  # detail links are optional
+            
+            for i, cells in enumerate(rows):
+                try:
+                    with self.phase('row_parse'):
+                        tender_data = self.parse_row_cells(cells)
+                    if tender_data:
+                        if i < len(links) and links[i]:
+                            tender_data['detail_url'] = urljoin(f"{self.base_url}/", links[i])
+                        yield tender_data  # Yield each tender as it's parsed
+                except Exception as e:
+                    print(f"   ⚠ Error parsing row: {str(e)}")
+                    continue
+            
+        except TimeoutException:
+            print("   Timeout waiting for tender table")
+        except Exception as e:
+            print(f"   Error scraping page: {e}")
+            
+        return  # Generator function ends here
+    
+    def parse_tender_row(self, row):
+        """Parse individual tender row (a WebDriver element)."""
+        try:
+            cells = row.find_elements(By.TAG_NAME, "td")
+            return self.parse_row_cells([cell.text.strip() for cell in cells])
+        except Exception as e:
+            return None
+
+    @classmethod
+    def parse_row_cells(cls, cells):
+        """Parse one listing row given as a list of cell strings.
+
+        Pure Python, so it can be tested without a browser. Returns the
+        tender dict, or None for rows that are not tenders.
+        """
+        try:
+            # Known column indices (0-based)
+            SI_NO = 0
+            IFB_NO = 1
+            TITLE = 2
+            PUBLIC_ENTITY = 3
+            PROCUREMENT_TYPE = 4
+            STATUS = 5
+            NOTICE_DATE = 6
             SUBMISSION_DATE = 7
             DAYS_LEFT = 8
 
@@ -195,39 +1256,35 @@ class BolpatraScraper:
                 return None
                 
             # Extract data using known positions
-            ifb = cells[IFB_NO].text.strip()
+            ifb = (cells[IFB_NO] or "").strip()
             if not ifb:
                 return None
             
             # Extract data using known positions
-            title = cells[TITLE].text.strip()
+            title = (cells[TITLE] or "").strip()
             if not title:
                 return None
                 
             # Get organization directly from its known column
-            public_entity_name = cells[PUBLIC_ENTITY].text.strip()
+            public_entity_name = (cells[PUBLIC_ENTITY] or "").strip()
 
             # Get notice/publication date and normalize it
-            notice_date_raw = cells[NOTICE_DATE].text.strip()
-            notice_date = self.normalize_date(notice_date_raw) if notice_date_raw else ""
+            notice_date_raw = (cells[NOTICE_DATE] or "").strip()
+            notice_date = cls.normalize_date(notice_date_raw) if notice_date_raw else ""
 
             # Get submission deadline directly from its column (may not be used)
-            deadline = cells[SUBMISSION_DATE].text.strip()
+            deadline = (cells[SUBMISSION_DATE] or "").strip()
             if deadline:
-                deadline = self.normalize_date(deadline)
+                deadline = cls.normalize_date(deadline)
 
             # Prefer the 'Days left' column value if present. It's a table column
             # that may contain 'Expired' or a number like '27 days'. Fall back to
             # computing from deadline if Days-left column is empty/unparseable.
             days_left = None
-            days_left_text = ""
-            try:
-                days_left_text = cells[DAYS_LEFT].text.strip()
-            except Exception:
-                days_left_text = ""
+            days_left_text = (cells[DAYS_LEFT] or "").strip()
 
             if days_left_text:
-                days_left = self.parse_days_left_text(days_left_text)
+                days_left = cls.parse_days_left_text(days_left_text)
 
             # Fallback: compute days left from deadline if parse failed
             if days_left is None and deadline:
@@ -238,7 +1295,7 @@ class BolpatraScraper:
                     days_left = None
             
             # Extract category/type from procurement type column
-            procurement_type = cells[PROCUREMENT_TYPE].text.strip().lower()
+            procurement_type = (cells[PROCUREMENT_TYPE] or "").strip().lower()
 
             return {
                 'ifb_no': ifb,
@@ -256,7 +1313,8 @@ class BolpatraScraper:
         except Exception as e:
             return None
     
-    def normalize_date(self, date_str):
+    @staticmethod
+    def normalize_date(date_str):
         """Convert various date formats to YYYY-MM-DD."""
         try:
             # Try different formats
@@ -271,123 +1329,1574 @@ class BolpatraScraper:
             return date_str
 
     @staticmethod
-    def parse_days_left_text(days_text: str):
-        """Parse the 'Days left' text from the table and return integer days.
+    def parse_days_left_text(days_text: str):
+        """Parse the 'Days left' text from the table and return integer days.
+
+        Examples handled:
+        '27', '27 days', '27 day(s)', 'Expired', 'Expired - 0', '-' -> returns -1
+        Returns an int or None if parsing fails.
+        """
+        if not days_text:
+            return None
+        t = days_text.strip().lower()
+        if 'expir' in t or 'expired' in t:
+            return -1
+        # Try to extract an integer
+        m = re.search(r"(\d+)", t)
+        if m:
+            try:
+                return int(m.group(1))
+            except:
+                return None
+        return None
+    
+    def go_to_next_page(self, next_page):
+        """Navigate to next page of tender listings."""
+        try:
+            
+            # Remember the current first row so we can tell when it is replaced
+            old_rows = self.driver.find_elements(By.CSS_SELECTOR, self.ROWS_SELECTOR)
+            old_row = old_rows[0] if old_rows else None
+            old_text = old_row.text if old_row is not None else None
+
+            # Find and clear the page input
+            goto_input = self.driver.find_element(By.CSS_SELECTOR, "table#pager tbody tr input.gotoPage")
+            goto_input.clear()
+            goto_input.send_keys(str(next_page))
+            
+            # Click the go button
+            gobutton = self.driver.find_element(By.CSS_SELECTOR, "table#pager tbody tr img.goto")
+
+            # Wait for any global overlay (modal/spinner) to disappear which can
+            # block clicks. Some pages show an overlay with id 'overlay' or class
+            # 'overlayCss'. Wait for invisibility if present.
+            try:
+                self.timed_wait("overlay", EC.invisibility_of_element_located((By.ID, "overlay")), timeout=8)
+            except Exception:
+                # ignore - overlay might not exist
+                pass
+
+            try:
+                self.timed_wait("overlay", EC.invisibility_of_element_located((By.CSS_SELECTOR, ".overlayCss")), timeout=8)
+            except Exception:
+                pass
+
+            # Scroll the button into view and use JS click to avoid interception
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", gobutton)
+            except Exception:
+                pass
+
+            try:
+                # JS click is more resilient to overlapping elements
+                self.driver.execute_script("arguments[0].click();", gobutton)
+            except Exception:
+                # Fall back to normal click
+                gobutton.click()
+            
+            # Wait for the page to load and verify we're on the right page
+            try:
+                # The old rows must be replaced before the new ones count;
+                # otherwise the previous page would be parsed again.
+                if old_row is not None:
+                    self.timed_wait("page_change", self.rows_replaced(old_row, old_text))
+                # Wait for table to load
+                self.timed_wait(
+                    "listing_rows", EC.presence_of_element_located((By.CSS_SELECTOR, self.ROWS_SELECTOR))
+                )
+                
+                print(f"✅ Successfully navigated to page {next_page}")
+                return True
+                
+            except TimeoutException:
+                print(f"⚠ Page {next_page} appears to be empty or failed to load")
+                return False
+                
+        except Exception as e:
+            print(f"⚠ Failed to navigate to page {next_page}: {str(e)}")
+            return False
+
+    def get_tender_details(self, tender_url):
+        """Get detailed information about a specific tender.
+
+        Navigates this scraper's driver, so use a separate scraper (see
+        DetailEnricher) rather than the one crawling the listing.
+        """
+        try:
+            self.driver.get(tender_url)
+            
+            # Scrape additional details from detail page
+            description_elem = self.timed_wait(
+                "detail_page", EC.presence_of_element_located((By.CSS_SELECTOR, ".description, .detail"))
+            )
+            description = description_elem.text.strip()
+            documents = [
+                {'name': a.text.strip(), 'url': a.get_attribute('href')}
+                for a in self.driver.find_elements(By.CSS_SELECTOR, "a[href]")
+                if is_document_link(a.get_attribute('href'))
+            ]
+            
+            return {'description': description, 'documents': documents}
+            
+        except Exception as e:
+            return {}
+
+
+def feed_html(handler, html):
+    """Run html through the stdlib HTMLParser, calling handler's handle_* methods.
+
+    html.parser is imported on first use so importing this module stays fast.
+    """
+    from html.parser import HTMLParser
+    parser = HTMLParser(convert_charrefs=True)
+    for name in ("handle_starttag", "handle_startendtag", "handle_endtag", "handle_data"):
+        if hasattr(handler, name):
+            setattr(parser, name, getattr(handler, name))
+    parser.feed(html)
+    parser.close()
+    return handler
+
+
+class ListingTableParser:
+    """Collect the cell texts of table#dashBoardBidResult body rows from HTML."""
+
+    def __init__(self, table_id="dashBoardBidResult"):
+        self.table_id = table_id
+        self.rows = []
+        self._table_depth = 0  # >0 while inside the target table
+        self._in_body = False
+        self._row = None
+        self._cell = None
+        # First link of each collected row (None where the row has none)
+        self.links = []
+        self._link = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            if self._table_depth:
+                self._table_depth += 1
+            elif dict(attrs).get("id") == self.table_id:
+                self._table_depth = 1
+            return
+        if not self._table_depth:
+            return
+        if tag == "tbody":
+            self._in_body = True
+        elif tag == "tr" and self._in_body and self._row is None:
+            self._row = []
+            self._link = None
+        elif tag == "td" and self._row is not None and self._cell is None:
+            self._cell = []
+        elif tag == "a" and self._row is not None and self._link is None:
+            self._link = dict(attrs).get("href")
+        elif tag == "br" and self._cell is not None:
+            self._cell.append(" ")
+
+    def handle_endtag(self, tag):
+        if not self._table_depth:
+            return
+        if tag == "table":
+            self._table_depth -= 1
+        elif tag == "tbody":
+            self._in_body = False
+        elif tag == "td" and self._cell is not None:
+            self._row.append(" ".join("".join(self._cell).split()))
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            self.rows.append(self._row)
+            self.links.append(self._link)
+            self._row = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def parse_listing_html(html, with_links=False):
+    """Return the listing rows of a Bolpatra results page as lists of cell strings.
+
+    With ``with_links=True`` returns ``(rows, links)``, links holding each
+    row's first href (or None).
+    """
+    parser = feed_html(ListingTableParser(), html)
+    return (parser.rows, parser.links) if with_links else parser.rows
+
+
+DOCUMENT_EXTENSIONS = ('.pdf', '.doc', '.docx', '.xls', '.xlsx', '.zip', '.rar')
+
+
+def is_document_link(href):
+    """True for links to downloadable tender documents."""
+    return bool(href) and urlsplit(href).path.lower().endswith(DOCUMENT_EXTENSIONS)
+
+
+class DetailPageParser:
+    """Collect the description text and document links of a tender detail page."""
+
+    def __init__(self):
+        self.description = []
+        self.documents = []
+        self._depth = 0  # >0 while inside a .description / .detail element
+        self._link = None
+
+    # Elements without an end tag; they must not change the nesting depth
+    VOID_TAGS = {"br", "hr", "img", "input", "meta", "link", "wbr", "col", "source"}
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            self.handle_startendtag(tag, attrs)
+            return
+        attrs = dict(attrs)
+        if self._depth:
+            self._depth += 1
+        elif {"description", "detail"} & set((attrs.get("class") or "").split()):
+            self._depth = 1
+        if tag == "a" and is_document_link(attrs.get("href")):
+            self._link = {'name': [], 'url': attrs["href"]}
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == "br" and self._depth:
+            self.description.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS:
+            return
+        if tag == "a" and self._link is not None:
+            self._link['name'] = " ".join("".join(self._link['name']).split())
+            self.documents.append(self._link)
+            self._link = None
+        if self._depth:
+            self._depth -= 1
+
+    def handle_data(self, data):
+        if self._depth:
+            self.description.append(data)
+        if self._link is not None:
+            self._link['name'].append(data)
+
+
+def parse_detail_html(html, base_url=None):
+    """Return {'description', 'documents'} parsed from a detail page ({} if neither)."""
+    parser = feed_html(DetailPageParser(), html)
+    description = " ".join("".join(parser.description).split())
+    documents = [
+        {'name': d['name'], 'url': urljoin(base_url, d['url']) if base_url else d['url']}
+        for d in parser.documents
+    ]
+    if not description and not documents:
+        return {}
+    return {'description': description, 'documents': documents}
+
+
+class HttpSession:
+    """Small keep-alive HTTP client: one pooled connection per host, plus cookies.
+
+    Uses only the standard library so the browserless scraper adds no
+    dependencies.
+    """
+
+    def __init__(self, timeout=30, verify_ssl=True, user_agent=None):
+        load_http()
+        self.timeout = timeout
+        self.headers = {
+            "User-Agent": user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+        }
+        self.cookies = {}
+        self._connections = {}
+        self._ssl_context = ssl.create_default_context()
+        if not verify_ssl:
+            self._ssl_context.check_hostname = False
+            self._ssl_context.verify_mode = ssl.CERT_NONE
+
+    def _connection(self, scheme, netloc):
+        conn = self._connections.get((scheme, netloc))
+        if conn is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, timeout=self.timeout, context=self._ssl_context)
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            self._connections[(scheme, netloc)] = conn
+        return conn
+
+    def _drop(self, scheme, netloc):
+        conn = self._connections.pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def get(self, url, max_redirects=5):
+        """GET a URL and return the decoded body text."""
+        for _ in range(max_redirects + 1):
+            parts = urlsplit(url)
+            path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+            headers = dict(self.headers)
+            if self.cookies:
+                headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+
+            # A pooled connection may have been closed by the server; retry once
+            for attempt in (1, 2):
+                conn = self._connection(parts.scheme, parts.netloc)
+                try:
+                    conn.request("GET", path, headers=headers)
+                    resp = conn.getresponse()
+                    body = resp.read()
+                    break
+                except (http.client.HTTPException, OSError):
+                    self._drop(parts.scheme, parts.netloc)
+                    if attempt == 2:
+                        raise
+
+            for cookie in resp.headers.get_all("Set-Cookie") or []:
+                name, _, rest = cookie.partition("=")
+                self.cookies[name.strip()] = rest.split(";", 1)[0]
+            if resp.will_close:
+                self._drop(parts.scheme, parts.netloc)
+
+            if resp.status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+                url = urljoin(url, resp.getheader("Location"))
+                continue
+            if resp.status >= 400:
+                raise http.client.HTTPException(f"HTTP {resp.status} for {url}")
+            if resp.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return body.decode(resp.headers.get_content_charset() or "utf-8", errors="replace")
+        raise http.client.HTTPException(f"Too many redirects for {url}")
+
+    def close(self):
+        for conn in self._connections.values():
+            conn.close()
+        self._connections = {}
+
+
+class BolpatraHttpScraper:
+    """Browserless Bolpatra scraper with the same interface as BolpatraScraper.
+
+    Listing pages are fetched over a pooled keep-alive HTTP session and the
+    results table is parsed straight from the HTML, so no Chrome process is
+    needed. Pages are requested from ``listing_url`` (formatted with
+    ``base_url`` and ``page``) until a page has no rows or repeats the
+    previous one.
+    """
+
+    base_url = BolpatraScraper.base_url
+    listing_url = "{base_url}/searchOpportunity?currentPageIndex={page}"
+    phase = BolpatraScraper.phase
+    check_page = BolpatraScraper.check_page
+
+    def __init__(self, headless=True, base_url=None, verify_ssl=True):
+        # headless is accepted (and ignored) so the class can stand in for
+        # BolpatraScraper wherever that is constructed
+        self.headless = headless
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+        self.verify_ssl = verify_ssl
+        self.session = None
+        self.current_page = None
+        self.metrics = None
+        self.page_fingerprints = None
+        self.page_status = None
+
+    def init_driver(self):
+        """Open the HTTP session (there is no browser to start)."""
+        self.session = HttpSession(verify_ssl=self.verify_ssl)
+        return True
+
+    def close(self):
+        if self.session:
+            self.session.close()
+            self.session = None
+
+    def page_url(self, page):
+        return self.listing_url.format(base_url=self.base_url, page=page)
+
+    def fetch_page(self, page):
+        """Download one listing page; returns (rows, detail links)."""
+        return parse_listing_html(self.session.get(self.page_url(page)), with_links=True)
+
+    def new_worker(self):
+        """A scraper with its own HTTP session (e.g. for DetailEnricher threads)."""
+        worker = type(self)(headless=self.headless, base_url=self.base_url, verify_ssl=self.verify_ssl)
+        worker.metrics = self.metrics
+        worker.page_fingerprints = self.page_fingerprints
+        return worker
+
+    def get_tender_details(self, tender_url):
+        """Fetch a detail page and return its description and documents."""
+        if not self.session:
+            self.init_driver()
+        try:
+            return parse_detail_html(self.session.get(tender_url), base_url=tender_url)
+        except Exception:
+            return {}
+
+    def scrape_tenders(self, scrape_all_pages=True):
+        """Yield tender dictionaries one at a time, page by page."""
+        if not self.session:
+            self.init_driver()
+
+        page = 1
+        total_tenders = 0
+        previous_rows = None
+        try:
+            print("\n📡 Connecting to Bolpatra (HTTP)...")
+            while True:
+                print(f"\n📄 Scraping page {page}...")
+                with self.phase('page_navigation'):
+                    rows, links = self.fetch_page(page)
+                if not rows or rows == previous_rows:
+                    print("   ✓ Reached last page")
+                    break
+                previous_rows = rows
+                self.current_page = page
+                if self.metrics:
+                    self.metrics.page_rows(page, len(rows))
+                if self.check_page(rows):
+                    if self.page_status == 'stop':
+                        break
+                    page += 1
+                    continue
+
+                tenders_on_page = 0
+                for cells, link in zip(rows, links):
+                    with self.phase('row_parse'):
+                        tender = BolpatraScraper.parse_row_cells(cells)
+                    if tender and link:
+                        tender['detail_url'] = urljoin(self.page_url(page), link)
+                    if tender:
+                        tenders_on_page += 1
+                        total_tenders += 1
+                        yield tender
+                print(f"   Found {tenders_on_page} tenders on this page")
+
+                if not scrape_all_pages:
+                    break
+                page += 1
+
+            print(f"\n✓ Total tenders scraped: {total_tenders}")
+        except Exception as e:
+            print(f"✗ Error during scraping: {e}")
+            print("   💡 Tip: Run again to retry; persistent seen-keys will avoid duplicate saves.")
+
+
+class ReplayScraper(BolpatraScraper):
+    """Offline BolpatraScraper that replays recorded listing pages.
+
+    ``source`` is either a directory of recorded pages - ``page_NNN.json``
+    row arrays (as written by ``record_dir``) or saved ``*.html`` listing
+    pages - or a list of pages given directly as row arrays. Pages run
+    through the real scrape_current_page / parse_row_cells code, and the
+    scraper can be handed to TenderManager.scrape_bolpatra(scraper=...) to
+    exercise the real processing loop with no browser or network.
+    """
+
+    def __init__(self, source, headless=True):
+        super().__init__(headless=headless)
+        self.source = source
+        self.pages = None
+
+    def new_worker(self):
+        worker = type(self)(self.source, headless=self.headless)
+        worker.record_dir = self.record_dir
+        worker.metrics = self.metrics
+        worker.page_fingerprints = self.page_fingerprints
+        return worker
+
+    @staticmethod
+    def load_pages(source):
+        """Return the list of pages (each a list of cell-string rows) in a source."""
+        if not isinstance(source, str):
+            return [list(page) for page in source]
+
+        def page_number(name):
+            digits = re.findall(r"\d+", name)
+            return int(digits[-1]) if digits else 0
+
+        pages = []
+        names = [n for n in os.listdir(source) if n.endswith((".json", ".html", ".htm"))]
+        for name in sorted(names, key=page_number):
+            with open(os.path.join(source, name), encoding="utf-8") as f:
+                if name.endswith(".json"):
+                    pages.append(json.load(f))
+                else:
+                    pages.append(parse_listing_html(f.read()))
+        return pages
+
+    def init_driver(self):
+        """Load the recorded pages (there is no browser to start)."""
+        self.pages = self.load_pages(self.source)
+        return True
+
+    def close(self):
+        pass
+
+    def open_listing(self):
+        self.current_page = 1
+
+    def wait_for_table(self):
+        if not self.pages or not self.pages[0]:
+            return None
+        return self.pages
+
+    def extract_table_rows(self):
+        return self.pages[self.current_page - 1] if self.current_page <= len(self.pages) else []
+
+    def extract_row_links(self):
+        return []  # recorded pages hold cell texts only
+
+    def get_tender_details(self, tender_url):
+        return {}
+
+    def go_to_next_page(self, next_page):
+        if next_page > len(self.pages) or not self.pages[next_page - 1]:
+            return False
+        self.current_page = next_page
+        return True
+
+
+class DetailCache:
+    """Detail-page results on disk, keyed by ifb_no, each kept for ``ttl`` seconds.
+
+    Thread-safe, since DetailEnricher workers read and fill it concurrently.
+    Empty results (failed fetches) are not cached, so they are retried.
+    """
+
+    def __init__(self, filename, ttl=7 * 24 * 3600):
+        self.filename = filename
+        self.ttl = ttl
+        self.entries = {}  # ifb_no -> {'fetched': epoch seconds, 'details': {...}}
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except Exception as e:
+            print(f"⚠ Error loading detail cache: {e}")
+
+    def get(self, ifb_no, now=None):
+        """Cached details for ifb_no, or None when missing or expired."""
+        now = time.time() if now is None else now
+        with self.lock:
+            entry = self.entries.get(ifb_no)
+        if entry and now - entry.get('fetched', 0) < self.ttl:
+            return entry.get('details')
+        return None
+
+    def put(self, ifb_no, details, now=None):
+        if not ifb_no or not details:
+            return
+        with self.lock:
+            self.entries[ifb_no] = {'fetched': time.time() if now is None else now, 'details': details}
+            self.dirty = True
+
+    def save(self, now=None):
+        """Write the cache (dropping expired entries) if anything changed."""
+        now = time.time() if now is None else now
+        with self.lock:
+            if not self.dirty:
+                return
+            self.entries = {
+                k: v for k, v in self.entries.items() if now - v.get('fetched', 0) < self.ttl
+            }
+            try:
+                with atomic_path(self.filename) as tmp, open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f, ensure_ascii=False)
+                self.dirty = False
+            except Exception as e:
+                print(f"⚠ Error saving detail cache: {e}")
+
+
+class DetailEnricher:
+    """Fetch tender detail pages on a pool of worker threads.
+
+    Each thread lazily starts its own scraper from ``scraper_factory`` (a
+    browser or HTTP session per thread), so the driver crawling the
+    listing is never navigated away. Results are cached by ifb_no in
+    ``cache``; tenders with a fresh cache entry or without a
+    ``detail_url`` never reach a worker. ``submit`` returns a Future of
+    the details dict ({} when nothing could be fetched).
+    """
+
+    def __init__(self, scraper_factory, cache, workers=2, metrics=None):
+        self.scraper_factory = scraper_factory
+        self.cache = cache
+        self.metrics = metrics
+        from concurrent.futures import ThreadPoolExecutor
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="detail")
+        self._local = threading.local()
+        self._scrapers = []
+        self._lock = threading.Lock()
+
+    def _scraper(self):
+        if not hasattr(self._local, 'scraper'):
+            scraper = self.scraper_factory()
+            with self._lock:
+                self._scrapers.append(scraper)
+            # None marks a thread whose scraper failed to start
+            self._local.scraper = scraper if scraper.init_driver() else None
+        return self._local.scraper
+
+    def _fetch(self, ifb_no, url):
+        scraper = self._scraper()
+        if scraper is None:
+            return {}
+        with self.metrics.phase('detail_fetch') if self.metrics else nullcontext():
+            details = scraper.get_tender_details(url) or {}
+        if self.metrics:
+            self.metrics.count('detail_fetches')
+        self.cache.put(ifb_no, details)
+        return details
+
+    def submit(self, tender):
+        ifb_no = tender.get('ifb_no')
+        cached = self.cache.get(ifb_no) if ifb_no else None
+        if cached is not None or not tender.get('detail_url'):
+            if cached is not None and self.metrics:
+                self.metrics.count('detail_cache_hits')
+            from concurrent.futures import Future
+            done = Future()
+            done.set_result(cached or {})
+            return done
+        return self.pool.submit(self._fetch, ifb_no, tender['detail_url'])
+
+    def enrich(self, tenders):
+        """Fetch details for tenders (in parallel) and merge them in place."""
+        futures = [self.submit(t) for t in tenders]
+        for tender, future in zip(tenders, futures):
+            merge_details(tender, future.result())
+        return tenders
+
+    def close(self):
+        """Wait for running fetches, close every worker scraper and save the cache."""
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        for scraper in self._scrapers:
+            try:
+                scraper.close()
+            except Exception:
+                pass
+        self._scrapers = []
+        self.cache.save()
+
+
+def merge_details(tender, details):
+    """Copy non-empty detail fields into the tender; returns the tender."""
+    tender.update({k: v for k, v in (details or {}).items() if v})
+    return tender
+
+
+def tokenize(text):
+    """Split text into lower-case alphanumeric tokens."""
+    return re.findall(r"[a-z0-9]+", (text or "").lower())
+
+
+def keyword_text(tender):
+    """The text keyword search runs over: title and description."""
+    return f"{tender.get('title') or ''} {tender.get('description') or ''}"
+
+
+def parse_keyword_query(query):
+    """Parse a keyword query into OR-groups of AND-ed (token, is_prefix) terms.
+
+    'design hospital' -> both words; 'school OR college' -> either;
+    'archit*' -> any word starting with 'archit'.
+    """
+    groups = [[]]
+    for word in query.split():
+        if word.lower() == "or":
+            groups.append([])
+            continue
+        if word.lower() == "and":
+            continue
+        is_prefix = word.endswith("*")
+        tokens = tokenize(word)
+        for i, token in enumerate(tokens):
+            groups[-1].append((token, is_prefix and i == len(tokens) - 1))
+    return [g for g in groups if g]
+
+
+class InvertedIndex:
+    """In-memory token -> tender-id index for keyword search.
+
+    Ids are positions in TenderManager.tenders. A sorted vocabulary makes
+    prefix terms a bisect plus a short scan instead of a pass over every
+    tender.
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self.vocabulary = []
+
+    def add(self, doc_id, text):
+        for token in set(tokenize(text)):
+            ids = self.postings.get(token)
+            if ids is None:
+                ids = self.postings[token] = set()
+                insort(self.vocabulary, token)
+            ids.add(doc_id)
+
+    def clear(self):
+        self.postings = {}
+        self.vocabulary = []
+
+    def _term_ids(self, token, is_prefix):
+        if not is_prefix:
+            return self.postings.get(token, set())
+        ids = set()
+        i = bisect_left(self.vocabulary, token)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(token):
+            ids |= self.postings[self.vocabulary[i]]
+            i += 1
+        return ids
+
+    def search(self, query):
+        """Return the sorted ids matching a parse_keyword_query() query."""
+        matches = set()
+        for group in parse_keyword_query(query):
+            # Intersect smallest posting lists first
+            sets = sorted((self._term_ids(t, p) for t, p in group), key=len)
+            ids = set(sets[0])
+            for other in sets[1:]:
+                if not ids:
+                    break
+                ids &= other
+            matches |= ids
+        return sorted(matches)
+
+
+class SortedDateIndex:
+    """Tender positions ordered by a parsed date, for range queries.
+
+    Each date string is parsed once when its tender is added; queries
+    bisect the sorted epochs instead of re-parsing every record. Tenders
+    with a missing or unparseable date are not indexed.
+    """
+
+    def __init__(self):
+        self.epochs = []
+        self.positions = []
+
+    def __len__(self):
+        return len(self.epochs)
+
+    def clear(self):
+        self.epochs = []
+        self.positions = []
+
+    def build(self, values):
+        """Index (position, date string) pairs in one sort."""
+        pairs = sorted(
+            (epoch, position) for position, value in values
+            if (epoch := tender_epoch(value)) is not None
+        )
+        self.epochs = [epoch for epoch, _ in pairs]
+        self.positions = [position for _, position in pairs]
+
+    def add(self, position, value):
+        epoch = tender_epoch(value)
+        if epoch is None:
+            return
+        i = bisect_right(self.epochs, epoch)
+        self.epochs.insert(i, epoch)
+        self.positions.insert(i, position)
+
+    def between(self, after=None, before=None):
+        """Positions dated within [after, before] (datetimes, either optional), earliest first."""
+        lo = 0 if after is None else bisect_left(self.epochs, after.timestamp())
+        hi = len(self.epochs) if before is None else bisect_right(self.epochs, before.timestamp())
+        return self.positions[lo:hi]
+
+    def after(self, date):
+        return self.between(after=date)
+
+    def before(self, date):
+        return self.between(before=date)
+
+
+# Words ignored in the top-keyword counts (same list as the frontend's extractKeywords)
+STATS_STOP_WORDS = frozenset("""
+the a an and or but in on at to for of with by from as is was are be been have has do
+does did will would could should may might must can this that these those i you he she
+it we they all each every both such no not only very too than if just about
+""".split())
+
+
+def days_left_bucket(days_left):
+    """Bucket label for a days_left value, matching the frontend chart."""
+    if not isinstance(days_left, (int, float)):
+        return 'Unknown'
+    if days_left <= 0:
+        return '0 days'
+    if days_left <= 5:
+        return '1-5 days'
+    if days_left <= 15:
+        return '6-15 days'
+    if days_left <= 30:
+        return '16-30 days'
+    return '30+ days'
+
+
+class TenderStats:
+    """Archive statistics kept up to date on every insert.
+
+    ``add()`` is called once per stored tender and ``clear()`` when the
+    archive is emptied, so displaying the numbers never rescans the
+    archive. ``snapshot()`` uses the field names of the frontend's
+    StatsSummary so the saved file can be read by both.
+    """
+
+    URGENT_DAYS = 5
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.total = 0
+        self.relevant = 0
+        self.urgent = 0
+        self.days_left_sum = 0
+        self.days_left_count = 0
+        self.by_source = Counter()
+        self.by_type = Counter()
+        self.by_organization = Counter()
+        self.by_province = Counter()
+        self.by_days_left = {}
+        self.keywords = Counter()
+
+    def add(self, tender, relevant):
+        self.total += 1
+        self.relevant += 1 if relevant else 0
+        days_left = tender.get('days_left')
+        if isinstance(days_left, (int, float)):
+            self.days_left_sum += days_left
+            self.days_left_count += 1
+            self.urgent += 1 if days_left <= self.URGENT_DAYS else 0
+        source = tender.get('source', 'Unknown')
+        self.by_source[source] += 1
+        self.by_type[tender.get('Procurement Type') or tender.get('category') or 'Unknown'] += 1
+        self.by_organization[tender.get('organization') or 'Unknown'] += 1
+        province = tender.get('province')
+        if province and province != 'Not specified':
+            self.by_province[province] += 1
+        bucket = self.by_days_left.setdefault(days_left_bucket(days_left), Counter())
+        bucket[source] += 1
+        self.keywords.update(
+            word for word in re.findall(r"\w+", (tender.get('title') or '').lower())
+            if len(word) >= 4 and word not in STATS_STOP_WORDS and not word.isdigit()
+        )
+
+    def snapshot(self):
+        return {
+            'generatedAt': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'totalTenders': self.total,
+            'relevantTenders': self.relevant,
+            'urgentTenders': self.urgent,
+            'avgDaysLeft': round(self.days_left_sum / self.days_left_count) if self.days_left_count else 0,
+            'organizationCounts': dict(self.by_organization),
+            'typeCounts': dict(self.by_type),
+            'sourceCounts': dict(self.by_source),
+            'provinceCounts': dict(self.by_province),
+            'keywordCounts': [{'keyword': k, 'count': n} for k, n in self.keywords.most_common(10)],
+            'daysLeftDistribution': [
+                {'daysLeft': bucket, 'count': n, 'source': source}
+                for bucket, sources in self.by_days_left.items()
+                for source, n in sources.items()
+            ],
+        }
+
+    def save(self, filename):
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"⚠ Error saving stats snapshot: {e}")
+
+
+def as_number(value):
+    """Amount / days-left value as a float, or None ('1,200,000' is accepted)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.replace(',', '').strip())
+        except ValueError:
+            return None
+    return None
+
+
+class TenderColumns:
+    """Columnar NumPy view of a list of tenders for vectorized analytics.
+
+    Numeric fields (amount, days_left, deadline epoch) become float arrays
+    with NaN for missing values; categorical fields become integer codes
+    into a per-column ``categories`` list. Filters return boolean masks
+    that can be combined with ``&`` / ``|`` and turned back into tenders
+    with ``select()``. Requires NumPy (see load_numpy()).
+    """
+
+    NUMERIC = ('amount', 'days_left', 'deadline')
+    CATEGORICAL = {
+        'organization': lambda t: t.get('organization') or 'Unknown',
+        'procurement_type': lambda t: t.get('Procurement Type') or t.get('category') or 'Unknown',
+        'source': lambda t: t.get('source') or 'Unknown',
+        'province': lambda t: t.get('province') or 'Not specified',
+    }
+    DAYS_LEFT_EDGES = (0, 5, 15, 30)
+    DAYS_LEFT_LABELS = ('0 days', '1-5 days', '6-15 days', '16-30 days', '30+ days')
+
+    def __init__(self, tenders):
+        if not load_numpy():
+            raise ImportError("TenderColumns requires numpy (pip install numpy)")
+        self.tenders = list(tenders)
+        nan = float('nan')
+
+        def numeric(values):
+            return np.array([nan if v is None else v for v in values], dtype=np.float64)
+
+        self.amount = numeric(as_number(t.get('amount')) for t in self.tenders)
+        self.days_left = numeric(as_number(t.get('days_left')) for t in self.tenders)
+        self.deadline = numeric(tender_epoch(t.get('deadline')) for t in self.tenders)
+        self.codes = {}
+        self.categories = {}
+        for name, get in self.CATEGORICAL.items():
+            lookup = {}
+            codes = [lookup.setdefault(get(t), len(lookup)) for t in self.tenders]
+            self.codes[name] = np.array(codes, dtype=np.int32)
+            self.categories[name] = list(lookup)
+
+    def __len__(self):
+        return len(self.tenders)
+
+    def between(self, column, low=None, high=None):
+        """Mask of rows whose numeric column lies in [low, high] (NaN never matches)."""
+        values = getattr(self, column)
+        mask = ~np.isnan(values)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+        return mask
+
+    def deadline_between(self, after=None, before=None):
+        return self.between('deadline',
+                            after.timestamp() if after else None,
+                            before.timestamp() if before else None)
+
+    def equals(self, column, value):
+        """Mask of rows whose categorical column equals value."""
+        try:
+            code = self.categories[column].index(value)
+        except ValueError:
+            return np.zeros(len(self), dtype=bool)
+        return self.codes[column] == code
+
+    def counts(self, column, mask=None):
+        """{category: count} over the masked rows (vectorized group-by)."""
+        codes = self.codes[column] if mask is None else self.codes[column][mask]
+        counts = np.bincount(codes, minlength=len(self.categories[column]))
+        return {self.categories[column][i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def days_left_buckets(self, mask=None):
+        """Tender counts per days-left bucket, labelled like days_left_bucket()."""
+        values = self.days_left if mask is None else self.days_left[mask]
+        known = values[~np.isnan(values)]
+        buckets = np.bincount(np.searchsorted(self.DAYS_LEFT_EDGES, known, side='left'),
+                              minlength=len(self.DAYS_LEFT_LABELS))
+        result = {label: int(n) for label, n in zip(self.DAYS_LEFT_LABELS, buckets) if n}
+        if len(values) > len(known):
+            result['Unknown'] = int(len(values) - len(known))
+        return result
+
+    def select(self, mask):
+        """The tenders for a boolean mask, in archive order."""
+        return [self.tenders[i] for i in np.flatnonzero(mask)]
+
+
+# Column order for CSV / NDJSON exports; fields outside it are not exported
+EXPORT_FIELDS = [
+    'ifb_no', 'title', 'organization', 'Procurement Type', 'category', 'province',
+    'amount', 'deadline', 'notice date', 'days_left', 'source', 'scraped_date', 'description',
+]
+
+EXPORT_FORMATS = {
+    'csv': '.csv', 'csv.gz': '.csv.gz', 'ndjson': '.ndjson', 'ndjson.gz': '.ndjson.gz',
+}
+
+
+class TenderExporter:
+    """Stream tenders to CSV or NDJSON with a fixed schema.
+
+    Rows are written as the input iterable yields them, so neither the
+    tenders nor a field-name set are ever built up in memory. A filename
+    ending in ``.gz`` is gzip-compressed; ``.ndjson`` / ``.jsonl`` files
+    get one JSON object per line, anything else is CSV.
+    """
+
+    def __init__(self, fields=EXPORT_FIELDS):
+        self.fields = list(fields)
+
+    @staticmethod
+    def all_fields(tenders):
+        """EXPORT_FIELDS followed by every other key used by tenders (for full snapshots)."""
+        extra = set()
+        for tender in tenders:
+            extra.update(tender.keys())
+        return EXPORT_FIELDS + sorted(extra.difference(EXPORT_FIELDS))
+
+    @staticmethod
+    def csv_row(tender):
+        # Lists and dicts (e.g. documents) go in as JSON so they can be read back
+        return {k: json.dumps(v, ensure_ascii=False) if isinstance(v, (list, dict)) else v
+                for k, v in tender.items()}
+
+    @staticmethod
+    def open_output(filename):
+        if filename.endswith('.gz'):
+            return gzip.open(filename, 'wt', newline='', encoding='utf-8')
+        return open(filename, 'w', newline='', encoding='utf-8')
+
+    def write(self, tenders, filename):
+        """Write tenders to filename; returns the number of rows written."""
+        base = filename[:-3] if filename.endswith('.gz') else filename
+        count = 0
+        with self.open_output(filename) as f:
+            if base.endswith(('.ndjson', '.jsonl')):
+                for tender in tenders:
+                    f.write(json.dumps({k: tender.get(k) for k in self.fields}, ensure_ascii=False))
+                    f.write('\n')
+                    count += 1
+            else:
+                writer = csv.DictWriter(f, fieldnames=self.fields, extrasaction='ignore')
+                writer.writeheader()
+                for tender in tenders:
+                    writer.writerow(self.csv_row(tender))
+                    count += 1
+        return count
+
+
+class ExportWatermark:
+    """Remembers how far into the (append-only) archive each export got.
+
+    The mark is the archive position after the last exported tender plus
+    that tender's key, so an archive that was cleared or rewritten since
+    is detected and exported in full again.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.marks = {}
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    self.marks = json.load(f)
+            except Exception as e:
+                print(f"⚠ Error loading export state: {e}")
+
+    def start(self, name, tenders, key_func):
+        """Position to resume export `name` from (0 if unknown or stale)."""
+        mark = self.marks.get(name)
+        if not mark or not 0 < mark['position'] <= len(tenders):
+            return 0
+        last = tenders[mark['position'] - 1]
+        if key_func(last) != mark['last_key']:
+            return 0
+        return mark['position']
+
+    def advance(self, name, tenders, key_func):
+        if not len(tenders):
+            self.marks.pop(name, None)
+        else:
+            self.marks[name] = {
+                'position': len(tenders),
+                'last_key': key_func(tenders[len(tenders) - 1]),
+                'exported_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        try:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump(self.marks, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"⚠ Error saving export state: {e}")
+
+
+class CrawlState:
+    """High-water mark of previous crawls, persisted as JSON.
+
+    Tracks the newest notice date (and that tender's IFB number) seen by
+    any crawl so the next run knows where the previous one left off.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.newest_notice_date = None  # 'YYYY-MM-DD HH:MM'
+        self.newest_ifb_no = None
+        self.last_run = None
+        self.load()
+
+    def load(self):
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.newest_notice_date = data.get('newest_notice_date')
+            self.newest_ifb_no = data.get('newest_ifb_no')
+            self.last_run = data.get('last_run')
+        except Exception as e:
+            print(f"⚠ Error loading crawl state: {e}")
+
+    def observe(self, tender):
+        """Advance the mark if this tender is newer than anything seen so far."""
+        dt = parse_tender_date(tender.get('notice date'))
+        if dt is None:
+            return
+        iso = dt.strftime("%Y-%m-%d %H:%M")
+        if self.newest_notice_date is None or iso > self.newest_notice_date:
+            self.newest_notice_date = iso
+            self.newest_ifb_no = tender.get('ifb_no')
+
+    def save(self):
+        self.last_run = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with open(self.filename, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'newest_notice_date': self.newest_notice_date,
+                    'newest_ifb_no': self.newest_ifb_no,
+                    'last_run': self.last_run,
+                }, f, indent=2)
+        except Exception as e:
+            print(f"⚠ Error saving crawl state: {e}")
+
+
+class StopPolicy:
+    """Rule that ends an incremental crawl early.
+
+    scrape_bolpatra calls ``reset(state)`` once with the previous run's
+    CrawlState, then ``check(tender, page, seen)`` for every scraped row
+    before processing it. Returning a string stops the crawl; the string
+    is printed as the reason.
+    """
+
+    def reset(self, state):
+        pass
+
+    def check(self, tender, page, seen):
+        return None
+
+
+class StopAfterConsecutiveSeen(StopPolicy):
+    """Stop after K already-seen rows in a row."""
+
+    def __init__(self, k=20):
+        self.k = k
+        self.streak = 0
+
+    def reset(self, state):
+        self.streak = 0
+
+    def check(self, tender, page, seen):
+        self.streak = self.streak + 1 if seen else 0
+        if self.streak >= self.k:
+            return f"{self.k} consecutive rows were already seen"
+        return None
+
+
+class StopAfterFullySeenPage(StopPolicy):
+    """Stop once a whole listing page turned out to be already seen."""
+
+    def __init__(self):
+        self.page = None
+        self.rows = 0
+        self.seen_rows = 0
+
+    def reset(self, state):
+        self.page, self.rows, self.seen_rows = None, 0, 0
+
+    def check(self, tender, page, seen):
+        if page != self.page:
+            finished_page = self.page
+            fully_seen = finished_page is not None and self.rows and self.seen_rows == self.rows
+            self.page, self.rows, self.seen_rows = page, 0, 0
+            if fully_seen:
+                return f"every row on page {finished_page} was already seen"
+        self.rows += 1
+        self.seen_rows += 1 if seen else 0
+        return None
+
+
+class StopAtHighWaterMark(StopPolicy):
+    """Stop at the first seen row at or below the previous run's high-water mark."""
+
+    def __init__(self):
+        self.mark_date = None
+        self.mark_ifb = None
+
+    def reset(self, state):
+        self.mark_date = state.newest_notice_date
+        self.mark_ifb = state.newest_ifb_no
+
+    def check(self, tender, page, seen):
+        if self.mark_ifb and tender.get('ifb_no') == self.mark_ifb:
+            return f"reached the previous high-water mark ({self.mark_ifb})"
+        if seen and self.mark_date:
+            dt = parse_tender_date(tender.get('notice date'))
+            if dt and dt.strftime("%Y-%m-%d %H:%M") <= self.mark_date:
+                return f"reached listings published before {self.mark_date}"
+        return None
+
+
+class PageFingerprints:
+    """Hash of each listing page's extracted rows, with the keys it produced.
+
+    Persisted per page number. ``observe(page, rows)`` is called by the
+    scraper before parsing and reports whether the page is unchanged: same
+    hash as last time and every recorded key still seen (``is_seen``). The
+    new hash is only stored once the caller has processed the whole page
+    and calls ``commit(page, keys)``, so a crawl that stops mid-page never
+    marks that page as done. ``policy`` is 'skip' (leave unchanged pages
+    out and go on) or 'stop' (end the crawl at the first unchanged page).
+    """
+
+    def __init__(self, filename, policy='skip', is_seen=None):
+        if policy not in ('skip', 'stop'):
+            raise ValueError(f"Unknown unchanged-page policy: {policy}")
+        self.filename = filename
+        self.policy = policy
+        self.is_seen = is_seen
+        self.pages = {}  # str(page) -> {'hash': ..., 'keys': [...]}
+        self.pending = {}  # page -> hash observed this crawl, not yet committed
+        self.lock = threading.Lock()
+        self.dirty = False
+        self.load()
+
+    @staticmethod
+    def digest(rows):
+        data = json.dumps(rows, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+    def load(self):
+        if not os.path.exists(self.filename):
+            return
+        try:
+            with open(self.filename, 'r', encoding='utf-8') as f:
+                self.pages = json.load(f)
+        except Exception as e:
+            print(f"⚠ Error loading page fingerprints: {e}")
+
+    def observe(self, page, rows):
+        """Remember this page's hash; True if the page is unchanged since it was committed."""
+        digest = self.digest(rows)
+        with self.lock:
+            self.pending[page] = digest
+            entry = self.pages.get(str(page))
+        if not entry or entry.get('hash') != digest:
+            return False
+        is_seen = self.is_seen
+        return is_seen is None or all(is_seen(key) for key in entry.get('keys', []))
+
+    def commit(self, page, keys):
+        """Store the hash observed for a fully processed page along with its keys."""
+        with self.lock:
+            digest = self.pending.pop(page, None)
+            if digest is None:
+                return
+            self.pages[str(page)] = {'hash': digest, 'keys': list(keys)}
+            self.dirty = True
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            try:
+                with atomic_path(self.filename) as tmp, open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(self.pages, f, ensure_ascii=False)
+                self.dirty = False
+            except Exception as e:
+                print(f"⚠ Error saving page fingerprints: {e}")
+
+
+def incremental_stop_policies(seen_streak=20):
+    """The stop policies used for a daily incremental crawl."""
+    return [StopAtHighWaterMark(), StopAfterFullySeenPage(), StopAfterConsecutiveSeen(seen_streak)]
+
+
+class SQLiteTenderStore:
+    """SQLite-backed tender archive that behaves like the tenders list.
+
+    The ``tenders`` table mirrors the Supabase schema in
+    frontend/supabase/migration/*_create_tenders_schema.sql, with the full
+    tender dict kept in ``data`` so records round-trip unchanged. Iteration
+    streams rows from a cursor, so callers written for a list (``len``,
+    ``for t in ...``, ``append``) work without loading the archive into RAM,
+    while the ``search_*`` methods run as indexed SQL. The dedup lookups
+    (``contains_*``) may also run on scraper worker threads; those get a
+    read connection of their own, since a sqlite3 connection is tied to
+    the thread that opened it.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tenders (
+            id INTEGER PRIMARY KEY,
+            tender_key TEXT UNIQUE NOT NULL,
+            ifb_no TEXT UNIQUE,
+            title TEXT NOT NULL,
+            organization TEXT NOT NULL,
+            deadline TEXT,
+            procurement_type TEXT,
+            notice_date TEXT,
+            province TEXT,
+            source TEXT NOT NULL DEFAULT 'Manual',
+            days_left INTEGER,
+            scraped_date TEXT,
+            marked_relevant INTEGER DEFAULT 0,
+            amount REAL,
+            category TEXT,
+            description TEXT,
+            keywords TEXT,
+            data TEXT NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE INDEX IF NOT EXISTS idx_tenders_ifb_no ON tenders(ifb_no);
+        CREATE INDEX IF NOT EXISTS idx_tenders_organization ON tenders(organization);
+        CREATE INDEX IF NOT EXISTS idx_tenders_deadline ON tenders(deadline);
+        CREATE INDEX IF NOT EXISTS idx_tenders_days_left ON tenders(days_left);
+        CREATE INDEX IF NOT EXISTS idx_tenders_province ON tenders(province);
+        CREATE INDEX IF NOT EXISTS idx_tenders_amount ON tenders(amount);
+    """
+
+    def __init__(self, filename, key_func):
+        self.filename = filename
+        self.key_func = key_func
+        self.conn = sqlite3.connect(filename)
+        self.conn.executescript(self.SCHEMA)
+        self._add_keywords_column()
+        self._owner = threading.get_ident()
+        self._local = threading.local()
+
+    def _read_conn(self):
+        """The main connection on its own thread, a per-thread one elsewhere."""
+        if threading.get_ident() == self._owner:
+            return self.conn
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.filename)
+        return conn
+
+    @staticmethod
+    def _keywords(tender):
+        """Space-delimited tokens (with leading/trailing space) for token matching."""
+        return f" {' '.join(tokenize(keyword_text(tender)))} "
+
+    def _add_keywords_column(self):
+        """Add and fill the keywords column in databases created before it existed."""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(tenders)")}
+        if "keywords" in columns:
+            return
+        with self.conn:
+            self.conn.execute("ALTER TABLE tenders ADD COLUMN keywords TEXT")
+            rows = self.conn.execute("SELECT id, data FROM tenders").fetchall()
+            self.conn.executemany(
+                "UPDATE tenders SET keywords = ? WHERE id = ?",
+                ((self._keywords(json.loads(data)), row_id) for row_id, data in rows),
+            )
+
+    @staticmethod
+    def _to_iso(value):
+        """Normalize a date string so ISO text order equals time order."""
+        dt = parse_tender_date(value)
+        return dt.strftime("%Y-%m-%d %H:%M") if dt else None
 
-        Examples handled:
-        '27', '27 days', '27 day(s)', 'Expired', 'Expired - 0', '-' -> returns -1
-        Returns an int or None if parsing fails.
-        """
-        if not days_text:
-            return None
-        t = days_text.strip().lower()
-        if 'expir' in t or 'expired' in t:
-            return -1
-        # Try to extract an integer
-        m = re.search(r"(\d+)", t)
-        if m:
-            try:
-                return int(m.group(1))
-            except:
-                return None
-        return None
-    
-    def go_to_next_page(self, next_page):
-        """Navigate to next page of tender listings."""
-        try:
-            
-            # Find and clear the page input
-            goto_input = self.driver.find_element(By.CSS_SELECTOR, "table#pager tbody tr input.gotoPage")
-            goto_input.clear()
-            goto_input.send_keys(str(next_page))
-            time.sleep(1)  # Brief pause after typing
-            
-            # Click the go button
-            gobutton = self.driver.find_element(By.CSS_SELECTOR, "table#pager tbody tr img.goto")
+    def _row_values(self, tender):
+        amount = tender.get('amount')
+        return (
+            self.key_func(tender.get('title'), tender.get('organization'),
+                          tender.get('notice date') or tender.get('scraped_date')),
+            tender.get('ifb_no') or None,
+            tender.get('title') or "",
+            tender.get('organization') or "",
+            self._to_iso(tender.get('deadline')),
+            tender.get('Procurement Type'),
+            self._to_iso(tender.get('notice date')),
+            tender.get('province'),
+            tender.get('source') or 'Manual',
+            tender.get('days_left') if isinstance(tender.get('days_left'), int) else None,
+            tender.get('scraped_date'),
+            float(amount) if isinstance(amount, (int, float)) else None,
+            tender.get('category'),
+            tender.get('description'),
+            self._keywords(tender),
+            json.dumps(tender, ensure_ascii=False),
+        )
 
-            # Wait for any global overlay (modal/spinner) to disappear which can
-            # block clicks. Some pages show an overlay with id 'overlay' or class
-            # 'overlayCss'. Wait for invisibility if present.
-            try:
-                WebDriverWait(self.driver, 8).until(
-                    EC.invisibility_of_element_located((By.ID, "overlay"))
-                )
-            except Exception:
-                # ignore - overlay might not exist
-                pass
+    _INSERT = """
+        INSERT OR IGNORE INTO tenders (
+            tender_key, ifb_no, title, organization, deadline, procurement_type,
+            notice_date, province, source, days_left, scraped_date, amount,
+            category, description, keywords, data
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
 
-            try:
-                WebDriverWait(self.driver, 8).until(
-                    EC.invisibility_of_element_located((By.CSS_SELECTOR, ".overlayCss"))
-                )
-            except Exception:
-                pass
+    def append(self, tender):
+        """Insert one tender; returns False if its key or ifb_no already exists."""
+        with self.conn:
+            cur = self.conn.execute(self._INSERT, self._row_values(tender))
+        return cur.rowcount == 1
 
-            # Scroll the button into view and use JS click to avoid interception
-            try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", gobutton)
-            except Exception:
-                pass
+    def extend(self, tenders):
+        """Insert many tenders in a single transaction."""
+        with self.conn:
+            self.conn.executemany(self._INSERT, (self._row_values(t) for t in tenders))
 
-            try:
-                # JS click is more resilient to overlapping elements
-                self.driver.execute_script("arguments[0].click();", gobutton)
-            except Exception:
-                # Fall back to normal click
-                gobutton.click()
-            
-            # Wait for the page to load and verify we're on the right page
-            try:
-                # Wait for table to load
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "table#dashBoardBidResult tbody tr"))
-                )
-                
-                
-                print(f"✅ Successfully navigated to page {next_page}")
-                return True
-                
-            except TimeoutException:
-                print(f"⚠ Page {next_page} appears to be empty or failed to load")
-                return False
-                
-        except Exception as e:
-            print(f"⚠ Failed to navigate to page {next_page}: {str(e)}")
-            return False
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM tenders")
 
-    def get_tender_details(self, tender_url):
-        """Get detailed information about a specific tender."""
-        try:
-            self.driver.get(tender_url)
-            time.sleep(2)
-            
-            # Scrape additional details from detail page
-            # This would include full description, documents, etc.
-            description_elem = self.driver.find_element(By.CSS_SELECTOR, ".description, .detail")
-            description = description_elem.text.strip()
-            
-            return {'description': description}
-            
-        except Exception as e:
-            return {}
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM tenders").fetchone()[0]
+
+    def __bool__(self):
+        return self.conn.execute("SELECT 1 FROM tenders LIMIT 1").fetchone() is not None
+
+    def _select(self, where="1", params=()):
+        cur = self.conn.execute(f"SELECT data FROM tenders WHERE {where} ORDER BY id", params)
+        for (data,) in cur:
+            yield json.loads(data)
+
+    def __iter__(self):
+        return self._select()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        row = self.conn.execute(
+            "SELECT data FROM tenders ORDER BY id LIMIT 1 OFFSET ?", (index,)
+        ).fetchone()
+        if row is None:
+            raise IndexError("tender index out of range")
+        return json.loads(row[0])
+
+    def contains_key(self, key):
+        """Indexed dedup lookup by tender key."""
+        return self._read_conn().execute(
+            "SELECT 1 FROM tenders WHERE tender_key = ?", (key,)
+        ).fetchone() is not None
+
+    def contains_ifb(self, ifb_no):
+        """Indexed dedup lookup by IFB number."""
+        return self._read_conn().execute(
+            "SELECT 1 FROM tenders WHERE ifb_no = ?", (ifb_no,)
+        ).fetchone() is not None
+
+    def search_text(self, columns, term):
+        """Case-insensitive substring match on any of the given columns."""
+        where = " OR ".join(f"instr(lower(coalesce({c}, '')), ?) > 0" for c in columns)
+        return list(self._select(where, (term.lower(),) * len(columns)))
+
+    def search_keywords(self, query):
+        """Run a parse_keyword_query() query with the same token rules as InvertedIndex.
+
+        The keywords column is " tok1 tok2 ... ", so ' tok ' matches a whole
+        token and ' tok' a token prefix.
+        """
+        group_sql = []
+        params = []
+        for group in parse_keyword_query(query):
+            terms = []
+            for token, is_prefix in group:
+                terms.append("instr(keywords, ?) > 0")
+                params.append(f" {token}" if is_prefix else f" {token} ")
+            group_sql.append("(" + " AND ".join(terms) + ")")
+        if not group_sql:
+            return []
+        return list(self._select(" OR ".join(group_sql), params))
+
+    def search_amount(self, min_amount, max_amount):
+        return list(self._select("amount BETWEEN ? AND ?", (min_amount, max_amount)))
+
+    def search_deadline(self, after=None, before=None):
+        """Tenders whose deadline falls in [after, before] (datetimes, either optional)."""
+        clauses = ["deadline IS NOT NULL"]
+        params = []
+        if after is not None:
+            clauses.append("deadline >= ?")
+            params.append(after.strftime("%Y-%m-%d %H:%M"))
+        if before is not None:
+            clauses.append("deadline <= ?")
+            params.append(before.strftime("%Y-%m-%d %H:%M"))
+        return list(self._select(" AND ".join(clauses), params))
+
+    def close(self):
+        self.conn.close()
 
 
 class TenderManager:
-    def __init__(self):
+    def __init__(self, storage_mode=None, seen_index=None):
+        self.storage_mode = storage_mode or STORAGE_MODE
+        if self.storage_mode not in ("json", "jsonl", "sqlite"):
+            raise ValueError(f"Unknown storage mode: {self.storage_mode}")
+        self.seen_index = seen_index or SEEN_INDEX
+        if self.seen_index not in ("set", "fingerprint"):
+            raise ValueError(f"Unknown seen-key index: {self.seen_index}")
         self.json_filename = "tenders.json"
+        self.jsonl_filename = "tenders.jsonl"
+        self.db_filename = "tenders.db"
+        self.crawl_state_file = "crawl_state.json"
+        self.detail_cache_file = "detail_cache.json"
+        self.page_fingerprints_file = "page_fingerprints.json"
+        self.relevance_cache = RelevanceCache("relevance_cache.json")
+        self.stats_snapshot_file = "stats_snapshot.json"
+        self.stats = TenderStats()
+        self._columns = None
         self.csv_filename = "tenders.csv"
+        self.export_state_file = "export_state.json"
+        self.metrics_dir = "scrape_reports"
+        self.last_metrics = None
         self.seen_keys_file = "seen_keys.json"
         self.non_relevant_seen_file = "non_relevant_seen_keys.json"
-        self.seen_keys = set()
-        self.non_relevant_seen_keys = set()
+        self.seen_keys = self._new_seen_set(self.seen_keys_file)
+        self.non_relevant_seen_keys = self._new_seen_set(self.non_relevant_seen_file)
+        # Write-ahead logs: new tenders (tenders.jsonl) and seen keys not yet
+        # in their snapshot files; both are replayed on startup
+        self.tender_log = WriteAheadLog(self.jsonl_filename)
+        self.seen_log = WriteAheadLog("seen_keys.wal")
+        # Seen-key files are rewritten in (large) batches; the log covers
+        # everything marked since the last checkpoint
+        self.seen_keys_commit = GroupCommit(self.checkpoint_seen_keys, max_pending=1000, max_delay=30.0)
+        self.non_relevant_commit = self.seen_keys_commit
+        # json mode: inserts go to the tender log and tenders.json is
+        # rewritten (folding the log in) once per batch, not per insert
+        self.snapshot_commit = GroupCommit(self.compact_log, max_pending=100, max_delay=30.0)
         self.tenders = []
         self.scraper = None
+        # title + description tokens -> positions in self.tenders
+        self.keyword_index = InvertedIndex()
+        # parsed deadline / notice date -> positions in self.tenders
+        self.deadline_index = SortedDateIndex()
+        self.notice_date_index = SortedDateIndex()
         self.load_data()
         # load or build persisted seen-keys to avoid duplicates across runs
         self.load_seen_keys()
+        self.replay_seen_log()
     
     def load_data(self):
-        """Load tenders from JSON or CSV, prioritizing JSON."""
+        """Load tenders from JSON or CSV, prioritizing JSON.
+
+        Tenders appended to the JSON Lines log since the last compaction are
+        loaded on top of the snapshot, whatever the current storage mode.
+        """
+        if self.storage_mode == "sqlite":
+            self.load_sqlite()
+            self.rebuild_indexes()
+            return
+
+        has_log = self.tender_log.exists()
         # Try loading from JSON first
         if os.path.exists(self.json_filename):
             print(f"📂 Loading data from {self.json_filename}...")
@@ -396,13 +2905,75 @@ class TenderManager:
         elif os.path.exists(self.csv_filename):
             print(f"📂 Loading data from {self.csv_filename}...")
             self.tenders = self.load_from_csv()
-        # If neither exists, use defaults
+        # A log on its own is a complete archive
+        elif has_log:
+            self.tenders = []
+        # If nothing exists, use defaults
         else:
             print("📂 No existing data found, starting with defaults...")
             self.tenders = self.get_default_tenders()
+
+        if has_log:
+            print(f"📂 Replaying appended tenders from {self.jsonl_filename}...")
+            # A crash after writing the snapshot but before dropping the log
+            # leaves tenders in both; keep one copy
+            known = {self._tender_key(t) for t in self.tenders}
+            for tender in self.load_from_jsonl():
+                key = self._tender_key(tender)
+                if key not in known:
+                    known.add(key)
+                    self.tenders.append(tender)
         
         print(f"✓ Loaded {len(self.tenders)} tender(s)")
+        self.rebuild_indexes()
+
+    def rebuild_indexes(self):
+        """Rebuild the in-memory search indexes from self.tenders."""
+        self.keyword_index.clear()
+        self.deadline_index.clear()
+        self.notice_date_index.clear()
+        self._columns = None
+        self.rebuild_stats()
+        if self.storage_mode == "sqlite":
+            # Searches run as SQL; only the statistics live in memory
+            return
+        for i, tender in enumerate(self.tenders):
+            self.keyword_index.add(i, keyword_text(tender))
+        self.deadline_index.build((i, t.get('deadline')) for i, t in enumerate(self.tenders))
+        self.notice_date_index.build((i, t.get('notice date')) for i, t in enumerate(self.tenders))
+
+    def rebuild_stats(self, chunk_size=5000):
+        """Recount self.stats in one streamed pass (the SQLite store is never loaded whole)."""
+        self.stats.clear()
+        tenders = iter(self.tenders)
+        while chunk := list(islice(tenders, chunk_size)):
+            verdicts = self.relevance_cache.classify_many((t.get('title') or '' for t in chunk), save=False)
+            for tender, relevant in zip(chunk, verdicts):
+                self.stats.add(tender, relevant)
+        self.relevance_cache.save()
+
+    def _index_tender(self, position, tender):
+        self.keyword_index.add(position, keyword_text(tender))
+        self.deadline_index.add(position, tender.get('deadline'))
+        self.notice_date_index.add(position, tender.get('notice date'))
     
+    def load_sqlite(self):
+        """Open tenders.db, importing the JSON/CSV archive on first use."""
+        store = SQLiteTenderStore(self.db_filename, self._make_key)
+        if not store:
+            if os.path.exists(self.json_filename):
+                print(f"📂 Importing {self.json_filename} into {self.db_filename}...")
+                store.extend(self.load_from_json())
+            elif os.path.exists(self.csv_filename):
+                print(f"📂 Importing {self.csv_filename} into {self.db_filename}...")
+                store.extend(self.load_from_csv())
+        if self.tender_log.exists():
+            print(f"📂 Importing appended tenders from {self.jsonl_filename}...")
+            store.extend(self.load_from_jsonl())
+            self.tender_log.clear()
+        self.tenders = store
+        print(f"✓ {len(self.tenders)} tender(s) in {self.db_filename}")
+
     def load_from_json(self):
         """Load tenders from JSON file."""
         try:
@@ -412,6 +2983,15 @@ class TenderManager:
             print(f"⚠ Error loading JSON: {e}")
             return self.get_default_tenders()
     
+    def load_from_jsonl(self):
+        """Load tenders from the JSON Lines log (one tender per line)."""
+        tenders = []
+        try:
+            tenders.extend(self.tender_log.records())
+        except Exception as e:
+            print(f"⚠ Error loading JSONL: {e}")
+        return tenders
+
     def load_from_csv(self):
         """Load tenders from CSV file."""
         try:
@@ -419,12 +2999,19 @@ class TenderManager:
             with open(self.csv_filename, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    # Convert amount to float
+                    # Lists and dicts were written as JSON
+                    for k, v in row.items():
+                        if v and v[0] in '[{':
+                            try:
+                                row[k] = json.loads(v)
+                            except ValueError:
+                                pass
+                    # Convert amount to float; an empty cell means no amount
                     if 'amount' in row:
                         try:
                             row['amount'] = float(row['amount'])
-                        except:
-                            row['amount'] = 0
+                        except (TypeError, ValueError):
+                            row['amount'] = None
                     tenders.append(row)
             return tenders
         except Exception as e:
@@ -443,8 +3030,17 @@ class TenderManager:
         p = (pub_date or "").strip().lower()
         return f"{t}|||{o}|||{p}"
 
+    def _new_seen_set(self, json_file):
+        """Empty seen-key container for the configured index type."""
+        if self.seen_index == "fingerprint":
+            return FingerprintIndex(os.path.splitext(json_file)[0] + ".fp")
+        return set()
+
     def load_seen_keys(self):
         """Load persisted seen-keys from disk or build from loaded tenders."""
+        if self.seen_index == "fingerprint":
+            self.load_fingerprint_keys()
+            return
         try:
             if os.path.exists(self.seen_keys_file):
                 with open(self.seen_keys_file, 'r', encoding='utf-8') as f:
@@ -465,40 +3061,129 @@ class TenderManager:
         # If file not present or failed to load, build from currently loaded tenders
         self.seen_keys = set()
         self.non_relevant_seen_keys = set()
-        for t in self.tenders:
+        self.rebuild_seen_keys()
+
+    def load_fingerprint_keys(self):
+        """Open the fingerprint indexes, importing the JSON key files once."""
+        pairs = ((self.seen_keys, self.seen_keys_file),
+                 (self.non_relevant_seen_keys, self.non_relevant_seen_file))
+        if all(index.exists() for index, _ in pairs):
+            print(f"✓ Opened {len(self.seen_keys)} + {len(self.non_relevant_seen_keys)} seen-key fingerprints")
+            return
+        if not os.path.exists(self.seen_keys_file):
+            self.rebuild_seen_keys()
+            return
+        for index, json_file in pairs:
+            if os.path.exists(json_file):
+                try:
+                    with open(json_file, 'r', encoding='utf-8') as f:
+                        index.update(json.load(f))
+                except Exception as e:
+                    print(f"⚠ Error importing {json_file}: {e}")
+            index.merge()
+        print(f"✓ Imported {len(self.seen_keys)} + {len(self.non_relevant_seen_keys)} seen keys into fingerprint indexes")
+
+    def rebuild_seen_keys(self):
+        """Fill the (empty) seen-key sets from the loaded tenders and save them."""
+        tenders = list(self.tenders)
+        try:
+            verdicts = self.relevance_cache.classify_many(
+                (t.get('title') or '', t.get('description') or '') for t in tenders
+            )
+        except Exception:
+            # if any error, put everything into seen_keys to avoid reprocessing
+            verdicts = [True] * len(tenders)
+        for t, relevant in zip(tenders, verdicts):
             key = self._make_key(t.get('title'), t.get('organization'), t.get('notice date') or t.get('scraped_date'))
             # decide where to put the key based on relevancy
-            try:
-                if self.is_relevant_tender(t.get('title'), t.get('description', '')):
-                    self.seen_keys.add(key)
-                else:
-                    self.non_relevant_seen_keys.add(key)
-            except Exception:
-                # if any error, put into seen_keys to avoid reprocessing
+            if relevant:
                 self.seen_keys.add(key)
+            else:
+                self.non_relevant_seen_keys.add(key)
         # persist the rebuilt keys
         self.save_seen_keys()
         self.save_non_relevant_seen_keys()
 
     def save_seen_keys(self):
-        """Persist the seen-keys set to disk."""
+        """Persist the seen-keys set to disk; returns True on success."""
         try:
-            with open(self.seen_keys_file, 'w', encoding='utf-8') as f:
+            if isinstance(self.seen_keys, FingerprintIndex):
+                self.seen_keys.save()
+                return True
+            with atomic_path(self.seen_keys_file) as tmp, open(tmp, 'w', encoding='utf-8') as f:
                 json.dump(list(self.seen_keys), f, indent=2, ensure_ascii=False)
             # small confirmation
             # print(f"✓ Saved {len(self.seen_keys)} seen keys to {self.seen_keys_file}")
+            return True
         except Exception as e:
             print(f"⚠ Error saving seen keys: {e}")
+            return False
 
     def save_non_relevant_seen_keys(self):
-        """Persist the non-relevant seen-keys set to disk."""
+        """Persist the non-relevant seen-keys set to disk; returns True on success."""
         try:
-            with open(self.non_relevant_seen_file, 'w', encoding='utf-8') as f:
+            if isinstance(self.non_relevant_seen_keys, FingerprintIndex):
+                self.non_relevant_seen_keys.save()
+                return True
+            with atomic_path(self.non_relevant_seen_file) as tmp, open(tmp, 'w', encoding='utf-8') as f:
                 json.dump(list(self.non_relevant_seen_keys), f, indent=2, ensure_ascii=False)
             # print(f"✓ Saved {len(self.non_relevant_seen_keys)} non-relevant seen keys to {self.non_relevant_seen_file}")
+            return True
         except Exception as e:
             print(f"⚠ Error saving non-relevant seen keys: {e}")
+            return False
     
+    def is_seen(self, key):
+        """True if the key was seen before (relevant, non-relevant or stored)."""
+        if key in self.seen_keys or key in self.non_relevant_seen_keys:
+            return True
+        # The database is authoritative even if the seen-key files were lost
+        return self.storage_mode == "sqlite" and self.tenders.contains_key(key)
+
+    def mark_seen(self, key, relevant=True):
+        """Add a key to the right seen set.
+
+        The key is logged (fsync'd) right away; the key files themselves
+        are rewritten in batches by checkpoint_seen_keys().
+        """
+        self.seen_log.append({'key': key, 'relevant': relevant})
+        if relevant:
+            self.seen_keys.add(key)
+        else:
+            self.non_relevant_seen_keys.add(key)
+        self.seen_keys_commit.mark_dirty()
+
+    def flush_seen_keys(self):
+        """Write any seen keys still waiting in a batch."""
+        self.seen_keys_commit.flush()
+
+    def checkpoint_seen_keys(self):
+        """Save both seen-key files, then drop the seen-key log they now cover.
+
+        If either save fails the log is kept, so the keys are replayed on
+        the next start.
+        """
+        saved = self.save_seen_keys()
+        saved = self.save_non_relevant_seen_keys() and saved
+        if saved:
+            self.seen_log.clear()
+        return saved
+
+    def replay_seen_log(self):
+        """Re-apply seen keys logged after the last checkpoint (e.g. before a crash)."""
+        if not self.seen_log.exists():
+            return
+        replayed = 0
+        for record in self.seen_log.records():
+            key = record.get('key')
+            if not key:
+                continue
+            target = self.seen_keys if record.get('relevant', True) else self.non_relevant_seen_keys
+            target.add(key)
+            replayed += 1
+        print(f"📂 Replayed {replayed} seen key(s) from {self.seen_log.filename}")
+        self.checkpoint_seen_keys()
+
     def save_to_json(self):
         """Save tenders to JSON file."""
         try:
@@ -508,35 +3193,76 @@ class TenderManager:
             if self.tenders:
                 print(f"   Sample tender being saved: {self.tenders[0]['title']}")
             
-            with open(self.json_filename, "w", encoding='utf-8') as f:
-                json.dump(self.tenders, f, indent=2, ensure_ascii=False)
+            with atomic_path(self.json_filename) as tmp, open(tmp, "w", encoding='utf-8') as f:
+                json.dump(list(self.tenders), f, indent=2, ensure_ascii=False)
             
             # Verify the save by checking file size
             file_size = os.path.getsize(self.json_filename)
             print(f"✓ Saved to {self.json_filename} (Size: {file_size} bytes)")
+
+            # The snapshot now holds every logged tender
+            self.tender_log.clear()
             
         except Exception as e:
             print(f"✗ Error saving JSON: {e}")
             import traceback
             traceback.print_exc()
     
+    def append_to_log(self, tender):
+        """Append a single tender to the JSON Lines log (fsync'd); returns True on success."""
+        try:
+            self.tender_log.append(tender)
+            return True
+        except Exception as e:
+            print(f"✗ Error appending to {self.jsonl_filename}: {e}")
+            return False
+
+    def compact_log(self):
+        """Fold the JSON Lines log back into the JSON snapshot."""
+        if self.tender_log.exists():
+            self.save_to_json()
+
+    def insert_tender(self, tender):
+        """Add a tender to memory and persist it according to storage_mode.
+
+        In json and jsonl mode the tender is logged before it is added to
+        memory; tenders.json catches up in batches (json) or on compaction
+        (jsonl). If the log cannot be written the snapshot is saved at once.
+        Returns False if the database already held the tender (sqlite mode).
+        """
+        if self.storage_mode == "sqlite":
+            if self.tenders.append(tender) is False:
+                return False  # key or ifb_no already stored
+        else:
+            logged = self.append_to_log(tender)
+            self.tenders.append(tender)
+        self._columns = None
+        relevant = self.relevance_cache.classify_many([tender.get('title') or ''], save=False)[0]
+        self.stats.add(tender, relevant)
+        if self.storage_mode == "sqlite":
+            return True
+        self._index_tender(len(self.tenders) - 1, tender)
+        if not logged:
+            self.save_to_json()
+        elif self.storage_mode == "json":
+            self.snapshot_commit.mark_dirty()
+        return True
+
+    def clear_tenders(self):
+        """Remove all tenders from memory (and the database in sqlite mode)."""
+        self.tenders.clear()
+        self.rebuild_indexes()
+
     def save_to_csv(self):
         """Save tenders to CSV file."""
         try:
             if not self.tenders:
                 print("⚠ No tenders to save")
                 return
-            
-            # Get all possible fields
-            fieldnames = set()
-            for tender in self.tenders:
-                fieldnames.update(tender.keys())
-            fieldnames = sorted(fieldnames)
-            
-            with open(self.csv_filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self.tenders)
+            # The snapshot keeps every field; EXPORT_FIELDS only fixes the order
+            exporter = TenderExporter(TenderExporter.all_fields(self.tenders))
+            with atomic_path(self.csv_filename) as tmp:
+                exporter.write(self.tenders, tmp)
             print(f"✓ Saved to {self.csv_filename}")
         except Exception as e:
             print(f"✗ Error saving CSV: {e}")
@@ -551,6 +3277,12 @@ class TenderManager:
             self.save_to_json()
         if format in ['csv', 'both']:
             self.save_to_csv()
+        self.save_stats_snapshot()
+
+    def save_stats_snapshot(self):
+        """Write the running statistics to stats_snapshot.json."""
+        self.stats.save(self.stats_snapshot_file)
+        self.relevance_cache.save()
     
     def get_default_tenders(self):
         """Return default sample tenders."""
@@ -572,52 +3304,55 @@ class TenderManager:
     @staticmethod
     def is_architecture_related(title: str) -> bool:
         """Improved architecture-related tender filter (title-only)."""
-        if not title:
-            return False
-        text = title.lower()
-
-        # 1️⃣ Quick pre-filter
-        if not any(k in text for k in INCLUDE_KEYWORDS):
-            return False
-        if any(k in text for k in EXCLUDE_KEYWORDS):
-            return False
-
-        # 2️⃣ Context reinforcement
-        strong_contexts = ["building", "hospital", "school", "campus", "office", "complex", "hall", "housing", "facility", "center"]
-        if any(ctx in text for ctx in strong_contexts):
-            return True
-
-        # 3️⃣ Catch high-confidence consultancy/design indicators
-        if any(k in text for k in ["dpr", "feasibility", "master plan", "architect", "consult", "supervision", "design"]):
-            return True
-
-        # 4️⃣ Hybrid heuristic: at least two positives, zero negatives
-        matches = [k for k in INCLUDE_KEYWORDS if k in text]
-        return len(matches) >= 2
+        return get_keyword_matcher().is_architecture_related(title)
 
 
     @staticmethod
     def is_relevant_tender(title: str, context: str = "") -> bool:
         """Hybrid relevancy check combining title + optional context."""
-        title_text = (title or "").strip().lower()
-        context_text = (context or "").strip().lower()
+        return get_keyword_matcher().is_relevant(title, context)
 
-        if TenderManager.is_architecture_related(title_text):
-            return True
+    @staticmethod
+    def classify_many(items):
+        """Batch relevancy check over titles or (title, context) pairs."""
+        return get_keyword_matcher().classify_many(items)
 
-        combined = f"{title_text} {context_text}".strip()
-        if not combined:
-            return False
-        if any(ex in combined for ex in EXCLUDE_KEYWORDS):
-            return False
-        return any(inc in combined for inc in INCLUDE_KEYWORDS)
+    def relevant_tenders(self, tenders=None):
+        """Return the tenders (default: all) that pass the relevance filter."""
+        if tenders is None:
+            tenders = self.tenders
+        tenders = list(tenders)
+        verdicts = self.relevance_cache.classify_many(
+            (t['title'], t.get('description', '')) for t in tenders
+        )
+        return [t for t, ok in zip(tenders, verdicts) if ok]
     
-    def scrape_bolpatra(self, headless=True):
+    def scrape_bolpatra(self, headless=True, workers=1, backend="selenium", scraper=None,
+                        stop_policies=None, quiet=False, pipeline=False, queue_size=64,
+                        enrich_details=False, detail_workers=2, unchanged_pages=None):
         """
-        Scrape ALL available tenders from Bolpatra using Selenium.
+        Scrape ALL available tenders from Bolpatra.
 
         Args:
             headless: Run browser in headless mode (default: True)
+            workers: Number of browsers crawling pages in parallel (default: 1)
+            backend: 'selenium' (Chrome) or 'http' (browserless, see BolpatraHttpScraper)
+            scraper: Use this scraper instance instead (e.g. a ReplayScraper)
+            stop_policies: StopPolicy objects for an incremental crawl, e.g.
+                incremental_stop_policies(); by default every page is visited
+            quiet: Skip the per-tender progress lines
+            pipeline: Run the scraper and relevance checks in their own threads
+                (see pipelined()) so browser navigation overlaps processing
+            queue_size: Rows buffered between pipeline stages
+            enrich_details: Fetch the detail page of each tender that passes the
+                relevance filter (on detail_workers separate scrapers, cached
+                in detail_cache.json) and re-check relevance with its description
+            unchanged_pages: 'skip' or 'stop' to leave out listing pages whose rows
+                are identical to the last crawl (see PageFingerprints), or to end
+                the crawl at the first one; by default every page is parsed
+
+        Phase timings and counters end up in self.last_metrics and are saved
+        as a JSON report under scrape_reports/.
 
         Note:
             Checkpoint/resume behavior was removed in favor of a persistent
@@ -629,16 +3364,72 @@ class TenderManager:
         print("\n🔍 Scraping ALL available pages...")
         # Note: checkpoint system removed; persistent seen-keys avoid duplicates across runs
         
+        scraped = None
+        rows = None
+        enricher = None
+        fingerprints = None
+        metrics = self.last_metrics = ScrapeMetrics()
+        log = (lambda *args, **kwargs: None) if quiet else print
+        crawl_state = CrawlState(self.crawl_state_file)
+        stop_policies = stop_policies or []
+        for policy in stop_policies:
+            policy.reset(crawl_state)
         try:
-            self.scraper = BolpatraScraper(headless=headless)
-            
-            if not self.scraper.init_driver():
+            if scraper is not None:
+                self.scraper = scraper
+            elif backend == "http":
+                self.scraper = BolpatraHttpScraper()
+            else:
+                self.scraper = BolpatraScraper(headless=headless)
+            self.scraper.metrics = metrics
+            if unchanged_pages:
+                fingerprints = PageFingerprints(self.page_fingerprints_file, unchanged_pages, self.is_seen)
+                self.scraper.page_fingerprints = fingerprints
+
+            if workers > 1 and hasattr(self.scraper, "scrape_tenders_parallel"):
+                # Each worker starts its own browser; results arrive in page order
+                scraped = self.scraper.scrape_tenders_parallel(workers=workers)
+            elif not self._start_scraper(metrics):
                 print("\n✗ Failed to initialize browser")
                 print("Install ChromeDriver: pip install webdriver-manager")
                 print("Then add to your code:")
                 print("  from webdriver_manager.chrome import ChromeDriverManager")
                 print("  webdriver.Chrome(ChromeDriverManager().install())")
                 return 0
+            else:
+                scraped = self.scraper.scrape_tenders(scrape_all_pages=True)
+
+            if enrich_details:
+                factory = getattr(self.scraper, 'new_worker', None) or (lambda: BolpatraScraper(headless=headless))
+                enricher = DetailEnricher(factory, DetailCache(self.detail_cache_file),
+                                          workers=detail_workers, metrics=metrics)
+            # (tender, key, future) awaiting details, settled in scrape order
+            pending = deque()
+            # Their keys: not marked seen until settled, but already taken
+            pending_keys = set()
+
+            def prepare(item):
+                """Key and (in pipeline mode) relevance for one (page, tender)."""
+                page, tender = item
+                key = self._make_key(
+                    tender.get('title'),
+                    tender.get('organization'),
+                    tender.get('notice date') or tender.get('scraped_date')
+                )
+                is_relevant = None
+                if pipeline:
+                    with metrics.phase('classification'):
+                        is_relevant = self.is_relevant_tender(
+                            tender.get('title', ''), self._relevance_context(tender))
+                return page, tender, key, is_relevant
+
+            # Record each tender's page as it leaves the scraper: in pipeline
+            # mode the scraper is already further ahead by the time we process it
+            paged = ((getattr(self.scraper, 'current_page', None), t) for t in scraped)
+            if pipeline:
+                rows = pipelined(paged, stages=[prepare], maxsize=queue_size)
+            else:
+                rows = map(prepare, paged)
             
             # Stream scraped tenders from the scraper generator. We iterate
             # directly so that each tender can be processed and saved to disk
@@ -649,69 +3440,136 @@ class TenderManager:
             relevant_count = 0
 
             stopped_early = False
-            for tender in self.scraper.scrape_tenders(scrape_all_pages=True):
+            stop_reason = None
+            # Page being processed and its keys, for the page fingerprints
+            current_page, page_keys = None, []
+
+            def settle(block):
+                """Save (or reject) enriched tenders whose details have arrived."""
+                nonlocal added, duplicates
+                while pending and (block or pending[0][2].done()):
+                    tender, key, future = pending.popleft()
+                    pending_keys.discard(key)
+                    merge_details(tender, future.result())
+                    if tender.get('description') and not self.is_relevant_tender(
+                            tender.get('title', ''), self._relevance_context(tender)):
+                        log(f"   Rejected after reading details (marked seen): {tender.get('title','')[:60]}...")
+                        metrics.count('rejected_by_details')
+                        with metrics.phase('persistence'):
+                            self.mark_seen(key, relevant=False)
+                        continue
+                    with metrics.phase('persistence'):
+                        inserted = self.insert_tender(tender)
+                        self.mark_seen(key)
+                    if not inserted:
+                        log(f"\n↺ Duplicate tender (already stored): {tender.get('title','')[:60]}...")
+                        duplicates += 1
+                        metrics.count('duplicates')
+                        continue
+                    log(f"\n✓ New relevant tender found: {tender.get('title','')[:60]}...")
+                    added += 1
+                    metrics.count('added')
+
+            # Persistent key per tender: title|org|notice_date
+            for page, tender, key, is_relevant in rows:
                 total_scraped += 1
+                metrics.count('rows')
+                if fingerprints is not None and page != current_page:
+                    # A new page started, so the previous one was fully processed
+                    if current_page is not None:
+                        fingerprints.commit(current_page, page_keys)
+                    current_page, page_keys = page, []
+                page_keys.append(key)
 
-                # Create a persistent key for the tender (title|org|notice_date)
-                key = self._make_key(
-                    tender.get('title'),
-                    tender.get('organization'),
-                    tender.get('notice date') or tender.get('scraped_date')
-                )
+                with metrics.phase('dedup_lookup'):
+                    seen = self.is_seen(key) or key in pending_keys
+
+                # Incremental crawl: stop once the policies say we've caught up
+                for policy in stop_policies:
+                    stop_reason = policy.check(tender, page, seen)
+                    if stop_reason:
+                        break
+                if stop_reason:
+                    break
+                crawl_state.observe(tender)
 
-                # If the key exists in either seen set, skip
-                if key in self.seen_keys or key in self.non_relevant_seen_keys:
-                    print(f"\n↺ Duplicate tender (seen before): {tender.get('title','')[:60]}...")
+                # If the key exists in either seen set (or the database), skip
+                if seen:
+                    log(f"\n↺ Duplicate tender (seen before): {tender.get('title','')[:60]}...")
                     duplicates += 1
+                    metrics.count('duplicates')
                     continue
 
-                # Build context for relevancy checking
-                context_text = (
-                    str(tender.get('description', '')) + " " + str(tender.get('organization', ''))
-                ).strip()
-
-                # Check relevancy
-                is_relevant = self.is_relevant_tender(tender.get('title', ''), context_text)
+                # Check relevancy (already done by the pipeline stage)
+                if is_relevant is None:
+                    with metrics.phase('classification'):
+                        is_relevant = self.is_relevant_tender(
+                            tender.get('title', ''), self._relevance_context(tender))
 
                 # DAYS LEFT FILTER: decide behavior based on days_left
                 days_left_val = tender.get('days_left')
 
                 if not is_relevant:
                     # Non-relevant: persist to non-relevant seen keys for audit
-                    print(f"   Non-relevant tender (marked seen): {tender.get('title','')[:60]}...")
-                    self.non_relevant_seen_keys.add(key)
-                    self.save_non_relevant_seen_keys()
+                    log(f"   Non-relevant tender (marked seen): {tender.get('title','')[:60]}...")
+                    metrics.count('non_relevant')
+                    with metrics.phase('persistence'):
+                        self.mark_seen(key, relevant=False)
                     continue
 
                 # At this point the tender is relevant
                 relevant_count += 1
+                metrics.count('relevant')
 
                 # If days_left is unknown or <=7, mark as seen (do not save).
                 if days_left_val is None:
-                    print(f"   Relevant but unknown deadline, marking as seen (not saved): {tender.get('title','')[:60]}...")
-                    self.seen_keys.add(key)
-                    self.save_seen_keys()
+                    log(f"   Relevant but unknown deadline, marking as seen (not saved): {tender.get('title','')[:60]}...")
+                    metrics.count('unknown_deadline')
+                    with metrics.phase('persistence'):
+                        self.mark_seen(key)
                     continue
 
                 if days_left_val <= 7:
                     print(f"   Found relevant tender with days_left={days_left_val} <= 7; marking as seen and ending scrape: {tender.get('title','')[:60]}...")
-                    self.seen_keys.add(key)
-                    self.save_seen_keys()
+                    self.mark_seen(key)
                     stopped_early = True
+                    metrics.count('stopped_early')
                     break
 
+                # Details are fetched off the crawl's thread; the tender is
+                # saved once they arrive (not marked seen until then)
+                if enricher is not None:
+                    pending.append((tender, key, enricher.submit(tender)))
+                    pending_keys.add(key)
+                    settle(block=False)
+                    continue
+
                 # Save the tender (days_left > 7)
-                self.tenders.append(tender)
-                print(f"\n✓ New relevant tender found: {tender.get('title','')[:60]}...")
-                print(f"   Current tenders in memory: {len(self.tenders)}")
-                self.save_to_json()
-                # Persist seen key for this relevant tender
-                self.seen_keys.add(key)
-                self.save_seen_keys()
+                with metrics.phase('persistence'):
+                    inserted = self.insert_tender(tender)
+                    # Persist seen key for this relevant tender
+                    self.mark_seen(key)
+                if not inserted:
+                    # The database already holds its ifb_no under another key
+                    log(f"\n↺ Duplicate tender (already stored): {tender.get('title','')[:60]}...")
+                    duplicates += 1
+                    metrics.count('duplicates')
+                    continue
+                log(f"\n✓ New relevant tender found: {tender.get('title','')[:60]}...")
+                log(f"   Current tenders in memory: {len(self.tenders)}")
                 added += 1
+                metrics.count('added')
+            else:
+                # No early stop: the last page was processed completely too
+                if fingerprints is not None and current_page is not None:
+                    fingerprints.commit(current_page, page_keys)
             
+            settle(block=True)
             if stopped_early:
                 print("\n⚠ Stopped early due to encountering a tender with days_left <= 7")
+            if stop_reason:
+                print(f"\n⏹ Incremental crawl stopped: {stop_reason}")
+                metrics.count('stopped_by_policy')
 
             print(f"\n{'='*60}")
             print(f"📊 SCRAPING RESULTS:")
@@ -731,18 +3589,47 @@ class TenderManager:
             traceback.print_exc()
             return 0
         finally:
+            # Runs on errors and Ctrl-C too, so batched keys are never lost
+            with metrics.phase('persistence'):
+                self.flush_seen_keys()
+            crawl_state.save()
+            if fingerprints is not None:
+                fingerprints.save()
+            self.save_stats_snapshot()
+            if pipeline and rows is not None:
+                # Stops the producer thread before the scraper is closed
+                rows.close()
+            if scraped is not None:
+                # Stops the page crawl (and any parallel workers) after an early stop
+                scraped.close()
+            if enricher is not None:
+                enricher.close()
             if self.scraper:
                 self.scraper.close()
+            self.compact_log()
+            metrics.finish()
+            metrics.print_summary()
+            report_path = metrics.save(self.metrics_dir)
+            if report_path:
+                print(f"📝 Scrape metrics written to {report_path}")
+
+    @staticmethod
+    def _relevance_context(tender):
+        """Description + organization, the context used when scraping."""
+        return (
+            str(tender.get('description', '')) + " " + str(tender.get('organization', ''))
+        ).strip()
+
+    def _start_scraper(self, metrics):
+        with metrics.phase('driver_startup'):
+            return self.scraper.init_driver()
     
     def view_all_tenders(self, filter_relevant=True):
         """Display all tenders."""
         display_tenders = self.tenders
         
         if filter_relevant:
-            display_tenders = [
-                t for t in self.tenders 
-                if self.is_relevant_tender(t['title'], t.get('description', ''))
-            ]
+            display_tenders = self.relevant_tenders()
         
         if not display_tenders:
             print("\nNo tenders found matching criteria.")
@@ -767,6 +3654,55 @@ class TenderManager:
                 print(f"    URL: {tender['url']}")
             print()
     
+    def find_by_province(self, term):
+        if self.storage_mode == "sqlite":
+            return self.tenders.search_text(["province"], term)
+        return [t for t in self.tenders if term in t.get('province', '').lower()]
+
+    def find_by_keyword(self, query):
+        """Keyword search: words are AND-ed, 'OR' separates alternatives, 'x*' is a prefix."""
+        if self.storage_mode == "sqlite":
+            return self.tenders.search_keywords(query)
+        return [self.tenders[i] for i in self.keyword_index.search(query)]
+
+    def find_by_organization(self, term):
+        if self.storage_mode == "sqlite":
+            return self.tenders.search_text(["organization"], term)
+        return [t for t in self.tenders if term in t['organization'].lower()]
+
+    def columns(self):
+        """Columnar NumPy view of the tenders (rebuilt after changes), or None without NumPy."""
+        if self._columns is None and load_numpy():
+            self._columns = TenderColumns(self.tenders)
+        return self._columns
+
+    def find_by_amount(self, min_amt, max_amt):
+        if self.storage_mode == "sqlite":
+            return self.tenders.search_amount(min_amt, max_amt)
+        columns = self.columns()
+        if columns is not None:
+            return columns.select(columns.between('amount', min_amt, max_amt))
+        return [t for t in self.tenders
+                if (amount := as_number(t.get('amount'))) is not None and min_amt <= amount <= max_amt]
+
+    def find_by_deadline(self, after=None, before=None):
+        """Tenders with a deadline in [after, before], soonest first."""
+        if self.storage_mode == "sqlite":
+            return self.tenders.search_deadline(after=after, before=before)
+        return [self.tenders[i] for i in self.deadline_index.between(after, before)]
+
+    def find_by_deadline_after(self, search_date):
+        return self.find_by_deadline(after=search_date)
+
+    def find_by_notice_date(self, after=None, before=None):
+        """Tenders published in [after, before], oldest first (not stored in sqlite mode)."""
+        return [self.tenders[i] for i in self.notice_date_index.between(after, before)]
+
+    def find_by_category(self, category):
+        if self.storage_mode == "sqlite":
+            return self.tenders.search_text(["category"], category)
+        return [t for t in self.tenders if category.lower() in t.get('category', '').lower()]
+
     def search_tenders(self):
         """Search tenders with multiple criteria."""
         print("\n--- Search Tenders ---")
@@ -774,7 +3710,7 @@ class TenderManager:
         print("2. By Title/Keyword")
         print("3. By Organization")
         print("4. By Amount Range")
-        print("5. By Deadline (after date)")
+        print("5. By Deadline (date range)")
         print("6. By Category")
         
         choice = input("Choose search type: ").strip()
@@ -783,48 +3719,45 @@ class TenderManager:
         
         if choice == "1":
             term = input("Enter province: ").strip().lower()
-            results = [t for t in self.tenders if term in t.get('province', '').lower()]
+            results = self.find_by_province(term)
         
         elif choice == "2":
-            term = input("Enter keyword: ").strip().lower()
-            results = [t for t in self.tenders if term in t['title'].lower() or 
-                    term in t.get('description', '').lower()]
+            term = input("Enter keyword(s) (use OR for alternatives, * for prefix): ").strip().lower()
+            results = self.find_by_keyword(term)
         
         elif choice == "3":
             term = input("Enter organization: ").strip().lower()
-            results = [t for t in self.tenders if term in t['organization'].lower()]
+            results = self.find_by_organization(term)
         
         elif choice == "4":
             try:
                 min_amt = float(input("Enter minimum amount: "))
                 max_amt = float(input("Enter maximum amount: "))
-                results = [t for t in self.tenders if min_amt <= t['amount'] <= max_amt]
+                results = self.find_by_amount(min_amt, max_amt)
             except ValueError:
                 print("Invalid amount entered.")
                 return
         
         elif choice == "5":
             date_str = input("Enter deadline (YYYY-MM-DD): ").strip()
+            end_str = input("Enter end date (YYYY-MM-DD, blank for no limit): ").strip()
             try:
                 search_date = datetime.strptime(date_str, "%Y-%m-%d")
-                results = [
-                    t for t in self.tenders 
-                    if t['deadline'] != 'Not specified' and
-                    datetime.strptime(t['deadline'], "%Y-%m-%d") >= search_date
-                ]
+                end_date = None
+                if end_str:
+                    # Include deadlines at any time on the end date
+                    end_date = datetime.strptime(end_str, "%Y-%m-%d").replace(hour=23, minute=59)
+                results = self.find_by_deadline(after=search_date, before=end_date)
             except ValueError:
                 print("Invalid date format.")
                 return
         
         elif choice == "6":
             category = input("Enter category (Consultancy/Goods/Works): ").strip()
-            results = [t for t in self.tenders if category.lower() in t.get('category', '').lower()]
+            results = self.find_by_category(category)
         
         # Filter for relevant tenders
-        results = [t for t in results if self.is_relevant_tender(
-            t['title'], 
-            t.get('description', '')
-        )]
+        results = self.relevant_tenders(results)
         
         if results:
             print(f"\n✓ Found {len(results)} matching tender(s):\n")
@@ -894,42 +3827,69 @@ class TenderManager:
             print("\n↺ This tender appears to be a duplicate and was not added.")
             return
 
-        self.tenders.append(new_tender)
         # Persist only to JSON for now (CSV can be enabled if desired)
-        self.save_to_json()
+        if not self.insert_tender(new_tender):
+            print("\n↺ This tender is already stored and was not added.")
+            return
+        self.snapshot_commit.flush()
         # update seen keys and persist
         self.seen_keys.add(key)
         self.save_seen_keys()
+        self.save_stats_snapshot()
         print("\n✓ Tender added and saved to JSON!")
     
-    def export_to_csv(self):
-        """Export relevant tenders to a timestamped CSV file."""
-        filename = f"tenders_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        relevant_tenders = [
-            t for t in self.tenders 
-            if self.is_relevant_tender(t['title'], t.get('description', ''))
-        ]
-        
-        if not relevant_tenders:
-            print("\n⚠ No relevant tenders to export")
-            return
-        
+    def _tender_key(self, tender):
+        return self._make_key(tender.get('title'), tender.get('organization'),
+                              tender.get('notice date') or tender.get('scraped_date'))
+
+    def iter_relevant(self, tenders, batch_size=1000):
+        """Yield the relevant tenders from an iterable, classifying in batches."""
+        tenders = iter(tenders)
+        while True:
+            batch = list(islice(tenders, batch_size))
+            if not batch:
+                return
+            verdicts = self.relevance_cache.classify_many(
+                (t['title'], t.get('description', '')) for t in batch
+            )
+            yield from (t for t, ok in zip(batch, verdicts) if ok)
+
+    def export_to_csv(self, fmt='csv', since_last=False, filename=None):
+        """Export relevant tenders to a timestamped file.
+
+        Args:
+            fmt: 'csv', 'csv.gz', 'ndjson' or 'ndjson.gz'
+            since_last: Only export tenders added since the last export in
+                this format (tracked in export_state.json)
+            filename: Output path (default: tenders_export_<timestamp>.<fmt>)
+        """
+        if fmt not in EXPORT_FORMATS:
+            print(f"\n✗ Unknown export format: {fmt}")
+            return 0
+        if filename is None:
+            filename = f"tenders_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}{EXPORT_FORMATS[fmt]}"
+
+        watermark = ExportWatermark(self.export_state_file)
+        start = watermark.start(fmt, self.tenders, self._tender_key) if since_last else 0
+        if start >= len(self.tenders) and since_last:
+            print("\n⚠ No new tenders since the last export")
+            return 0
+
         try:
-            # Get all possible fields
-            fieldnames = set()
-            for tender in relevant_tenders:
-                fieldnames.update(tender.keys())
-            fieldnames = sorted(fieldnames)
-            
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(relevant_tenders)
-            
-            print(f"\n✓ Exported {len(relevant_tenders)} tenders to {filename}")
+            count = TenderExporter().write(
+                self.iter_relevant(islice(self.tenders, start, None)), filename
+            )
+            self.relevance_cache.save()
+            watermark.advance(fmt, self.tenders, self._tender_key)
+            if not count:
+                os.remove(filename)
+                print("\n⚠ No relevant tenders to export")
+                return 0
+            print(f"\n✓ Exported {count} tenders to {filename}")
+            return count
         except Exception as e:
             print(f"\n✗ Error exporting: {e}")
+            return 0
     
     def choose_save_format(self):
         """Let user choose save format."""
@@ -950,8 +3910,8 @@ class TenderManager:
             print("Invalid choice.")
 
 
-def main():
-    """Main program loop."""
+def main(quiet=False):
+    """Main program loop (quiet: no per-tender lines while scraping)."""
     tm = TenderManager()
     
     print("\n" + "="*70)
@@ -966,7 +3926,7 @@ def main():
         print("2. Search tenders")
         print("3. Add tender manually")
         print("4. 🌐 Scrape tenders from Bolpatra (Auto - All Pages)")
-        print("5. Export to CSV (timestamped)")
+        print("5. Export relevant tenders (CSV/NDJSON, timestamped)")
         print("6. View all tenders (including non-relevant)")
         print("7. clear tenders")
         print("8. Save current data")
@@ -987,9 +3947,24 @@ def main():
         elif choice == "4":
             print("\n🌐 Starting automatic web scraper...")
             print("⏳ This will scrape ALL available pages automatically...")
-            headless = input("Run browser in headless mode? (y/n, default=y): ").lower() != 'n'
+            use_http = input("Use browserless HTTP scraper? (y/n, default=n): ").lower() == 'y'
+            incremental = input("Incremental crawl (stop once already-seen listings are reached)? (y/n, default=n): ").lower() == 'y'
+            headless, workers = True, 1
+            if not use_http:
+                headless = input("Run browser in headless mode? (y/n, default=y): ").lower() != 'n'
+                workers = input("Parallel browsers (default=1): ").strip()
+                workers = int(workers) if workers.isdigit() and int(workers) > 0 else 1
+            enrich = input("Fetch detail pages of relevant tenders? (y/n, default=n): ").lower() == 'y'
+            unchanged_pages = 'stop' if incremental else None
+            if not incremental and input("Skip listing pages unchanged since the last crawl? (y/n, default=n): ").lower() == 'y':
+                unchanged_pages = 'skip'
             
-            count = tm.scrape_bolpatra(headless=headless)
+            count = tm.scrape_bolpatra(
+                headless=headless, workers=workers, backend="http" if use_http else "selenium",
+                stop_policies=incremental_stop_policies() if incremental else None,
+                quiet=quiet, pipeline=True, enrich_details=enrich,
+                unchanged_pages=unchanged_pages,
+            )
             
             if count > 0:
                 print(f"\n✓ Successfully added {count} new relevant tender(s)!")
@@ -998,7 +3973,9 @@ def main():
                 print("\n⚠ No new relevant tenders found or scraping failed.")
         
         elif choice == "5":
-            tm.export_to_csv()
+            fmt = input("Format (csv/csv.gz/ndjson/ndjson.gz, default=csv): ").strip() or "csv"
+            since_last = input("Only tenders added since the last export? (y/n, default=n): ").lower() == 'y'
+            tm.export_to_csv(fmt=fmt, since_last=since_last)
         
         elif choice == "6":
             tm.view_all_tenders(filter_relevant=False)
@@ -1008,7 +3985,7 @@ def main():
                 "Are you sure you want to clear ALL tenders from memory? (y/n): "
             ).lower()
             if confirm == 'y':
-                tm.tenders = []
+                tm.clear_tenders()
                 tm.save_data(format='both')
                 print("\n✓ All tenders cleared from memory and saved.")
             else:
@@ -1018,14 +3995,11 @@ def main():
             tm.choose_save_format()
         
         elif choice == "9":
-            total = len(tm.tenders)
-            relevant = len([t for t in tm.tenders if tm.is_relevant_tender(t['title'])])
-            
-            # Calculate by source
-            sources = {}
-            for t in tm.tenders:
-                source = t.get('source', 'Unknown')
-                sources[source] = sources.get(source, 0) + 1
+            # Counters are maintained on insert; nothing is rescanned here
+            total = tm.stats.total
+            relevant = tm.stats.relevant
+            sources = tm.stats.by_source
+            tm.save_stats_snapshot()
             
             print(f"\n📊 Statistics:")
             print(f"{'='*50}")
@@ -1048,4 +4022,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    parser = argparse.ArgumentParser(description="Tender management system")
+    parser.add_argument("--quiet", action="store_true",
+                        help="don't print a line per tender while scraping")
+    main(quiet=parser.parse_args().quiet)
\ No newline at end of file
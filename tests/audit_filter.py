@@ -1,19 +1,41 @@
+import argparse
+import gzip
 import json
-from mini_tender import TenderManager
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mini_tender import TenderManager, get_keyword_matcher
 
 """
 Simple audit harness: runs the hybrid filter over tenders.json and prints a
 summary of which entries are accepted (relevant) or rejected (non-relevant).
-Also writes `audit_results.json` with details for later tuning.
+Also writes `audit_results.json` (or --out) with details for later tuning:
+
+    python tests/audit_filter.py [input.json] [--out results.json]
+
+For large archives use streaming mode, which reads the input incrementally,
+classifies chunks across a process pool and writes JSON Lines:
+
+    python tests/audit_filter.py --stream [input.json|.jsonl|.gz] [--workers N]
 """
 
-def run_audit():
+
+def audit_context(t):
+    return (t.get('description') or '') + ' ' + (t.get('organization') or '')
+
+
+def run_audit(input_path=None, out_file='audit_results.json'):
     tm = TenderManager()
+    input_path = input_path or tm.json_filename
     try:
-        with open(tm.json_filename, 'r', encoding='utf-8') as f:
+        with open(input_path, 'r', encoding='utf-8') as f:
             tenders = json.load(f)
     except Exception as e:
-        print(f"Failed to load {tm.json_filename}: {e}")
+        print(f"Failed to load {input_path}: {e}")
         return
 
     results = []
@@ -40,12 +62,128 @@ def run_audit():
     print(f"Accepted (relevant): {accepted}")
     print(f"Rejected (non-relevant): {rejected}")
 
-    out_file = 'audit_results.json'
     with open(out_file, 'w', encoding='utf-8') as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
 
     print(f"Wrote detailed results to {out_file}")
 
 
+def open_input(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def iter_json_array(f, buffer_size=1 << 16):
+    """Yield the objects of a top-level JSON array without loading it whole."""
+    decoder = json.JSONDecoder()
+    buf = ''
+    i = 0
+    started = False
+    while True:
+        # Skip whitespace and separators, reading more input as needed
+        while i < len(buf) and (buf[i] in ' \t\r\n,' or (buf[i] == '[' and not started)):
+            started = started or buf[i] == '['
+            i += 1
+        if i >= len(buf):
+            chunk = f.read(buffer_size)
+            if not chunk:
+                return
+            buf, i = buf[i:] + chunk, 0
+            continue
+        if buf[i] == ']':
+            return
+        try:
+            obj, end = decoder.raw_decode(buf, i)
+        except json.JSONDecodeError:
+            chunk = f.read(buffer_size)
+            if not chunk:
+                raise
+            buf, i = buf[i:] + chunk, 0
+            continue
+        yield obj
+        i = end
+        if i > buffer_size:
+            buf, i = buf[i:], 0
+
+
+def iter_records(path):
+    """Stream tender dicts from a JSON array or a JSON Lines file (optionally .gz)."""
+    with open_input(path) as f:
+        base = path[:-3] if path.endswith('.gz') else path
+        if base.endswith(('.jsonl', '.ndjson')):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from iter_json_array(f)
+
+
+def classify_chunk(chunk):
+    """Worker: classify (index, tender) pairs; returns audit rows in input order."""
+    is_relevant = get_keyword_matcher().is_relevant
+    rows = []
+    for i, t in chunk:
+        title = t.get('title') or ''
+        rows.append({
+            'index': i,
+            'title': title,
+            'organization': t.get('organization', ''),
+            'relevant': bool(is_relevant(title, audit_context(t))),
+            'days_left': t.get('days_left'),
+        })
+    return rows
+
+
+def run_streaming_audit(path='tenders.json', out_file='audit_results.jsonl',
+                        workers=None, chunk_size=2000, report_every=50000):
+    """Audit a large archive with bounded memory; returns (accepted, rejected)."""
+    workers = workers or os.cpu_count() or 1
+    records = enumerate(iter_records(path), 1)
+    accepted = rejected = 0
+    next_report = report_every
+
+    def write(rows, out):
+        nonlocal accepted, rejected, next_report
+        for row in rows:
+            out.write(json.dumps(row, ensure_ascii=False) + '\n')
+            if row['relevant']:
+                accepted += 1
+            else:
+                rejected += 1
+        if accepted + rejected >= next_report:
+            next_report += report_every
+            print(f"  {accepted + rejected} checked: {accepted} accepted, {rejected} rejected")
+
+    with open(out_file, 'w', encoding='utf-8') as out, ProcessPoolExecutor(workers) as pool:
+        # Keep at most 2 chunks per worker in flight and write in input order
+        pending = []
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if chunk:
+                pending.append(pool.submit(classify_chunk, chunk))
+            if pending and (len(pending) >= 2 * workers or not chunk):
+                write(pending.pop(0).result(), out)
+            if not chunk and not pending:
+                break
+
+    print(f"Total tenders checked: {accepted + rejected}")
+    print(f"Accepted (relevant): {accepted}")
+    print(f"Rejected (non-relevant): {rejected}")
+    print(f"Wrote detailed results to {out_file}")
+    return accepted, rejected
+
+
 if __name__ == '__main__':
-    run_audit()
+    parser = argparse.ArgumentParser(description='Audit the relevance filter over a tender archive')
+    parser.add_argument('input', nargs='?', default='tenders.json')
+    parser.add_argument('--stream', action='store_true', help='parallel streaming audit (JSON Lines output)')
+    parser.add_argument('--out', help='results file (default: audit_results.json, '
+                                      'or audit_results.jsonl with --stream)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=2000)
+    args = parser.parse_args()
+    if args.stream:
+        run_streaming_audit(args.input, args.out or 'audit_results.jsonl', args.workers, args.chunk_size)
+    else:
+        run_audit(args.input, args.out or 'audit_results.json')
@@ -0,0 +1,143 @@
+"""
+Relevance filter benchmark: accuracy against the labels we already have and
+classification throughput.
+
+Labeled corpus (one label per distinct title):
+  seen_keys.json                   relevant
+  non_relevant_seen_keys.json      not relevant
+  relevant_from_non_relevant.json  relevant (manual corrections, if present)
+  audit_results.json               the recorded verdict, for titles not above
+
+The labels are earlier verdicts (plus any corrections), so precision and
+recall measure how far the current INCLUDE_KEYWORDS / EXCLUDE_KEYWORDS rules
+drift from them; the confusion examples show where.
+
+Throughput classifies synthetic titles (words resampled from the corpus)
+with a fresh KeywordMatcher, so the per-word cache starts cold.
+
+Run from the repository root:
+
+    python tests/bench_relevance.py [--sizes 1000,100000,1000000] [--examples N]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import mini_tender
+from mini_tender import KeywordMatcher
+
+LABEL_FILES = [
+    ('seen_keys.json', True),
+    ('non_relevant_seen_keys.json', False),
+    ('relevant_from_non_relevant.json', True),
+]
+
+
+def load_json(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def build_corpus(root=ROOT):
+    """Return ({title: label}, number of titles whose sources disagreed)."""
+    labels = {}
+    conflicts = 0
+    for name, label in LABEL_FILES:
+        for key in load_json(os.path.join(root, name)) or []:
+            title = key.split('|||')[0].strip().lower()
+            if not title:
+                continue
+            if title in labels and labels[title] != label:
+                conflicts += 1
+            # Later files win: corrections override the original verdict
+            labels[title] = label
+    for row in load_json(os.path.join(root, 'audit_results.json')) or []:
+        title = (row.get('title') or '').strip().lower()
+        if title and title not in labels:
+            labels[title] = bool(row.get('relevant'))
+    return labels, conflicts
+
+
+def evaluate(labels, matcher):
+    predicted = dict(zip(labels, matcher.classify_many(list(labels))))
+    confusion = {'tp': [], 'fp': [], 'fn': [], 'tn': []}
+    for title, label in labels.items():
+        guess = predicted[title]
+        confusion[('t' if guess == label else 'f') + ('p' if guess else 'n')].append(title)
+    return confusion
+
+
+def report_accuracy(labels, conflicts, matcher, examples):
+    confusion = evaluate(labels, matcher)
+    c = {k: len(v) for k, v in confusion.items()}
+    precision = c['tp'] / (c['tp'] + c['fp']) if c['tp'] + c['fp'] else 0.0
+    recall = c['tp'] / (c['tp'] + c['fn']) if c['tp'] + c['fn'] else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    accuracy = (c['tp'] + c['tn']) / len(labels) if labels else 0.0
+
+    print(f"\nRelevance filter accuracy ({len(labels)} labeled titles, {conflicts} conflicting labels)")
+    print("=" * 60)
+    print(f"  TP {c['tp']:>6}   FP {c['fp']:>6}")
+    print(f"  FN {c['fn']:>6}   TN {c['tn']:>6}")
+    print(f"  precision {precision:.3f}   recall {recall:.3f}   F1 {f1:.3f}   accuracy {accuracy:.3f}")
+    for kind, title in (('fp', 'False positives (accepted, labeled not relevant)'),
+                        ('fn', 'False negatives (rejected, labeled relevant)')):
+        if confusion[kind]:
+            print(f"\n  {title}:")
+            for t in sorted(confusion[kind])[:examples]:
+                print(f"    - {t[:90]}")
+    print("=" * 60)
+    return {'precision': precision, 'recall': recall, 'f1': f1, 'accuracy': accuracy, **c}
+
+
+def synthetic_titles(labels, n, seed=0):
+    """n titles of 4-12 words drawn from the corpus vocabulary."""
+    rng = random.Random(seed)
+    vocab = sorted({w for title in labels for w in title.split()}) or ['design']
+    return [' '.join(rng.choices(vocab, k=rng.randint(4, 12))) for _ in range(n)]
+
+
+def report_throughput(labels, sizes):
+    print("\nClassification throughput (fresh matcher per run)")
+    print("=" * 60)
+    print(f"{'titles':>10}{'seconds':>12}{'titles/sec':>16}{'relevant':>12}")
+    results = []
+    for n in sizes:
+        titles = synthetic_titles(labels, n)
+        matcher = KeywordMatcher(mini_tender.INCLUDE_KEYWORDS, mini_tender.EXCLUDE_KEYWORDS)
+        start = time.perf_counter()
+        relevant = sum(matcher.classify_many(titles))
+        elapsed = time.perf_counter() - start
+        rate = n / elapsed if elapsed else float('inf')
+        results.append((n, elapsed, rate))
+        print(f"{n:>10,}{elapsed:>12.3f}{rate:>16,.0f}{relevant:>12,}")
+    print("=" * 60)
+    return results
+
+
+def run_benchmark(sizes=(1000, 100000, 1000000), examples=10, root=ROOT):
+    labels, conflicts = build_corpus(root)
+    matcher = KeywordMatcher(mini_tender.INCLUDE_KEYWORDS, mini_tender.EXCLUDE_KEYWORDS)
+    accuracy = report_accuracy(labels, conflicts, matcher, examples)
+    throughput = report_throughput(labels, sizes)
+    return accuracy, throughput
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', default='1000,100000,1000000',
+                        help='comma-separated synthetic corpus sizes (default 1k,100k,1M)')
+    parser.add_argument('--examples', type=int, default=10,
+                        help='confusion examples to print per class (default 10)')
+    args = parser.parse_args()
+    run_benchmark([int(s) for s in args.sizes.split(',') if s], args.examples)
@@ -0,0 +1,143 @@
+"""
+Offline scrape pipeline benchmark: replays recorded listing pages and reports
+rows/second for each stage, with no browser or network.
+
+Stages:
+  html_extract        parse_listing_html on the saved listing pages
+  parse_row_cells     the pure row parser
+  parse_tender_row    the WebElement wrapper, fed fake elements (needs selenium)
+  scrape_current_page the scraper's page loop via ReplayScraper
+  scrape_bolpatra     the full processing loop (dedup, relevance, persistence)
+                      in a temporary directory
+  scrape_bolpatra[pipe] the same loop with pipeline=True (scraper and relevance
+                      checks in their own threads)
+
+Run from the repository root:
+
+    python tests/bench_scrape_pipeline.py [fixture_dir] [--copies N]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import mini_tender
+from mini_tender import BolpatraScraper, ReplayScraper, TenderManager, parse_listing_html
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class FakeCell:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeRow:
+    def __init__(self, cells):
+        self.cells = [FakeCell(c) for c in cells]
+
+    def find_elements(self, by, value):
+        return self.cells
+
+
+def synthetic_pages(pages, copies):
+    """Repeat the recorded pages with unique titles/IFBs so nothing is a duplicate."""
+    out = []
+    for copy in range(copies):
+        for page in pages:
+            new_page = []
+            for cells in page:
+                cells = list(cells)
+                if len(cells) >= 9:
+                    cells[1] = f"{cells[1]}-{copy}"
+                    cells[2] = f"{cells[2]} #{copy}"
+                    cells[8] = "30 days"  # keep the days-left stop out of the way
+                new_page.append(cells)
+            out.append(new_page)
+    return [p for p in out if p]
+
+
+def timed(label, rows, fn, results):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    elapsed = time.perf_counter() - start
+    results.append((label, rows, elapsed))
+
+
+def run_benchmark(fixture_dir=FIXTURES, copies=20):
+    html_pages = []
+    for name in sorted(os.listdir(fixture_dir)):
+        if name.endswith(('.html', '.htm')):
+            with open(os.path.join(fixture_dir, name), encoding='utf-8') as f:
+                html_pages.append(f.read())
+
+    pages = synthetic_pages(ReplayScraper.load_pages(fixture_dir), copies)
+    rows = [cells for page in pages for cells in page]
+    results = []
+    # Warm up strptime and the relevance matcher so the first stage isn't penalized
+    for cells in rows[:5]:
+        tender = BolpatraScraper.parse_row_cells(cells)
+        if tender:
+            TenderManager.is_relevant_tender(tender['title'], tender['organization'])
+
+    if html_pages:
+        html_rows = sum(len(parse_listing_html(h)) for h in html_pages) * copies
+        timed('html_extract', html_rows,
+              lambda: [parse_listing_html(h) for _ in range(copies) for h in html_pages], results)
+
+    timed('parse_row_cells', len(rows),
+          lambda: [BolpatraScraper.parse_row_cells(r) for r in rows], results)
+
+    try:
+        mini_tender.load_selenium()
+        fake_rows = [FakeRow(r) for r in rows]
+        scraper = BolpatraScraper()
+        timed('parse_tender_row', len(rows),
+              lambda: [scraper.parse_tender_row(r) for r in fake_rows], results)
+    except ImportError:
+        print("(selenium not installed: skipping parse_tender_row)")
+
+    timed('scrape_current_page', len(rows),
+          lambda: list(ReplayScraper(pages).scrape_tenders()), results)
+
+    for label, pipeline in (('scrape_bolpatra', False), ('scrape_bolpatra[pipe]', True)):
+        workdir = tempfile.mkdtemp(prefix='bench_scrape_')
+        cwd = os.getcwd()
+        try:
+            os.chdir(workdir)
+            with open('tenders.json', 'w', encoding='utf-8') as f:
+                json.dump([], f)
+            with contextlib.redirect_stdout(io.StringIO()):
+                tm = TenderManager()
+            timed(label, len(rows),
+                  lambda: tm.scrape_bolpatra(scraper=ReplayScraper(pages), pipeline=pipeline), results)
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\nScrape pipeline benchmark ({len(pages)} pages, {len(rows)} rows)")
+    print("=" * 60)
+    print(f"{'stage':<22}{'rows':>8}{'seconds':>12}{'rows/sec':>16}")
+    for label, n, elapsed in results:
+        rate = n / elapsed if elapsed else float('inf')
+        print(f"{label:<22}{n:>8}{elapsed:>12.4f}{rate:>16,.0f}")
+    print("=" * 60)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('fixture_dir', nargs='?', default=FIXTURES)
+    parser.add_argument('--copies', type=int, default=20,
+                        help='replay the recorded pages this many times (default 20)')
+    args = parser.parse_args()
+    run_benchmark(args.fixture_dir, args.copies)
@@ -0,0 +1,52 @@
+"""
+Startup benchmark: how long does `import mini_tender` take, and how much of
+the old cost was Selenium?
+
+Each measurement runs in a fresh interpreter so nothing is cached in
+sys.modules. Run from the repository root:
+
+    python tests/bench_startup.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SNIPPETS = {
+    'python (baseline)': 'pass',
+    'import mini_tender': 'import mini_tender',
+    'import mini_tender + selenium': 'import mini_tender; mini_tender.load_selenium()',
+}
+
+
+def time_snippet(code, runs):
+    """Best-of-N wall time in ms for running code in a new interpreter."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                       stdout=subprocess.DEVNULL)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmark(runs=5):
+    results = {name: time_snippet(code, runs) for name, code in SNIPPETS.items()}
+    base = results['python (baseline)']
+
+    print(f"\nStartup time (best of {runs} runs)")
+    print("=" * 55)
+    for name, ms in results.items():
+        print(f"{name:<32} {ms:8.1f} ms  (+{ms - base:.1f} ms)")
+    saved = results['import mini_tender + selenium'] - results['import mini_tender']
+    print("=" * 55)
+    print(f"Deferred by lazy Selenium import: {saved:.1f} ms per start")
+    return results
+
+
+if __name__ == '__main__':
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,34 @@
+"""
+Shared fixtures: a throwaway tender archive and a Bolpatra listing-row factory.
+"""
+
+import json
+
+import pytest
+
+from mini_tender import TenderManager
+
+
+def listing_row(n, title, days_left=30, org='City Office', notice='01-11-2025 10:00'):
+    """One listing row as scraped cell strings (IFB/00n, consultancy, published)."""
+    return [str(n), f'IFB/{n:03d}', title, org, 'Consultancy NCB', 'Published',
+            notice, '31-12-2025 12:00', f'{days_left} days']
+
+
+@pytest.fixture
+def row():
+    """The listing_row factory."""
+    return listing_row
+
+
+@pytest.fixture
+def archive(tmp_path, monkeypatch):
+    """Work in tmp_path; archive(tenders, **kwargs) writes tenders.json and returns a TenderManager."""
+    monkeypatch.chdir(tmp_path)
+
+    def make(tenders=(), **kwargs):
+        with open('tenders.json', 'w', encoding='utf-8') as f:
+            json.dump(list(tenders), f)
+        return TenderManager(**kwargs)
+
+    return make
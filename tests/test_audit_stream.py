@@ -0,0 +1,35 @@
+"""
+Streaming audit mode of tests/audit_filter.py: incremental JSON array
+reading and the process-pool classifier must agree with the plain audit.
+"""
+
+import io
+import json
+import os
+
+from audit_filter import audit_context, iter_json_array, run_streaming_audit
+from mini_tender import TenderManager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_iter_json_array_with_tiny_buffer():
+    data = [{'title': 'a, [b]', 'n': i} for i in range(5)]
+    text = ' \n' + json.dumps(data, indent=2) + '\n'
+    assert list(iter_json_array(io.StringIO(text), buffer_size=7)) == data
+    assert list(iter_json_array(io.StringIO('[]'))) == []
+
+
+def test_streaming_audit_matches_sequential(tmp_path):
+    with open(os.path.join(ROOT, 'tenders.json'), encoding='utf-8') as f:
+        tenders = json.load(f)
+    out = str(tmp_path / 'audit.jsonl')
+    accepted, rejected = run_streaming_audit(os.path.join(ROOT, 'tenders.json'), out,
+                                             workers=2, chunk_size=37)
+
+    with open(out, encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+    assert [r['index'] for r in rows] == list(range(1, len(tenders) + 1))
+    expected = [TenderManager.is_relevant_tender(t.get('title', ''), audit_context(t)) for t in tenders]
+    assert [r['relevant'] for r in rows] == expected
+    assert (accepted, rejected) == (sum(expected), len(expected) - sum(expected))
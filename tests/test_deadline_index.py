@@ -0,0 +1,43 @@
+"""
+Deadline / notice-date range queries answered from SortedDateIndex,
+for both the scraper's 'DD-MM-YYYY HH:MM' and manual 'YYYY-MM-DD' dates.
+"""
+
+from datetime import datetime
+
+from mini_tender import SortedDateIndex
+
+
+def tender(title, deadline, notice='01-11-2025 10:00'):
+    return {'title': title, 'organization': 'City Office', 'deadline': deadline,
+            'notice date': notice, 'description': '', 'category': 'Consultancy'}
+
+
+def test_index_bisects_mixed_formats_and_skips_unparseable():
+    index = SortedDateIndex()
+    index.build(enumerate(['31-12-2025 12:00', '2025-11-15', 'Not specified', '05-12-2025 09:00']))
+    assert len(index) == 3
+    assert index.after(datetime(2025, 12, 1)) == [3, 0]
+    assert index.before(datetime(2025, 12, 1)) == [1]
+    assert index.between(datetime(2025, 11, 15), datetime(2025, 12, 5, 9, 0)) == [1, 3]
+    index.add(4, '2025-12-01')
+    assert index.between(datetime(2025, 11, 20), datetime(2025, 12, 2)) == [4]
+
+
+def test_manager_deadline_queries_with_scraped_dates(archive):
+    tm = archive([
+        tender('Design of hall', '31-12-2025 12:00'),
+        tender('Design of ward', 'Not specified'),
+        tender('Design of park', '10-11-2025 12:00', notice='20-10-2025 10:00'),
+    ], storage_mode='json')
+    assert [t['title'] for t in tm.find_by_deadline_after(datetime(2025, 11, 1))] == [
+        'Design of park', 'Design of hall']
+    assert [t['title'] for t in tm.find_by_deadline(before=datetime(2025, 12, 1))] == ['Design of park']
+
+    tm.insert_tender(tender('Design of school', '2025-12-20'))
+    assert [t['title'] for t in tm.find_by_deadline(datetime(2025, 12, 1), datetime(2025, 12, 25))] == [
+        'Design of school']
+    assert [t['title'] for t in tm.find_by_notice_date(before=datetime(2025, 10, 31))] == ['Design of park']
+
+    tm.clear_tenders()
+    assert tm.find_by_deadline() == []
@@ -0,0 +1,137 @@
+"""
+Detail-page enrichment: link capture, detail parsing, the ifb_no-keyed
+DetailCache with its TTL, and DetailEnricher inside scrape_bolpatra.
+"""
+
+import json
+import threading
+import time
+
+from mini_tender import (DetailCache, DetailEnricher, ReplayScraper, parse_detail_html,
+                         parse_listing_html)
+
+LISTING = """
+<table id="dashBoardBidResult"><tbody>
+  <tr><td>1</td><td><a href="/egp/viewBid?id=7">IFB/7</a></td><td>Design of hall</td></tr>
+  <tr><td>2</td><td>IFB/8</td><td>Supply of rice</td></tr>
+</tbody></table>
+"""
+
+DETAIL = """
+<html><body><div class="panel detail">Full <b>scope</b> of work:<br>design of hall
+<img src="x.png"> and supervision</div>
+<a href="/docs/bid.pdf">Bidding document</a> <a href="/help">Help</a></body></html>
+"""
+
+
+def test_listing_links_and_detail_page_parsing():
+    rows, links = parse_listing_html(LISTING, with_links=True)
+    assert [r[1] for r in rows] == ['IFB/7', 'IFB/8']
+    assert links == ['/egp/viewBid?id=7', None]
+
+    details = parse_detail_html(DETAIL, base_url='https://bolpatra.gov.np/egp/viewBid?id=7')
+    assert details['description'] == 'Full scope of work: design of hall and supervision'
+    assert details['documents'] == [{'name': 'Bidding document', 'url': 'https://bolpatra.gov.np/docs/bid.pdf'}]
+    assert parse_detail_html('<p>nothing here</p>') == {}
+
+
+def test_detail_cache_ttl_and_persistence(tmp_path):
+    path = str(tmp_path / 'detail_cache.json')
+    cache = DetailCache(path, ttl=100)
+    cache.put('IFB/1', {'description': 'x'}, now=1000)
+    cache.put('IFB/2', {}, now=1000)  # failed fetch: not cached
+    assert cache.get('IFB/1', now=1050) == {'description': 'x'}
+    assert cache.get('IFB/1', now=1200) is None
+    assert cache.get('IFB/2', now=1000) is None
+    cache.save(now=1050)
+    assert DetailCache(path, ttl=100).get('IFB/1', now=1050) == {'description': 'x'}
+
+
+class FakeDetailScraper:
+    instances = []
+
+    def __init__(self):
+        self.fetched = []
+        self.threads = set()
+        FakeDetailScraper.instances.append(self)
+
+    def init_driver(self):
+        return True
+
+    def get_tender_details(self, url):
+        self.fetched.append(url)
+        self.threads.add(threading.get_ident())
+        return {'description': f'details of {url}'}
+
+    def close(self):
+        self.closed = True
+
+
+def test_enricher_uses_cache_and_one_scraper_per_thread(tmp_path):
+    FakeDetailScraper.instances = []
+    cache = DetailCache(str(tmp_path / 'detail_cache.json'))
+    cache.put('IFB/0', {'description': 'cached'})
+    enricher = DetailEnricher(FakeDetailScraper, cache, workers=3)
+    tenders = [{'ifb_no': f'IFB/{i}', 'detail_url': f'u{i}'} for i in range(10)]
+    tenders.append({'ifb_no': 'IFB/99'})  # no link: nothing to fetch
+    enricher.enrich(tenders)
+    enricher.close()
+
+    assert tenders[0]['description'] == 'cached'
+    assert tenders[5]['description'] == 'details of u5'
+    assert 'description' not in tenders[-1]
+    fetched = [u for s in FakeDetailScraper.instances for u in s.fetched]
+    assert sorted(fetched) == sorted(f'u{i}' for i in range(1, 10))
+    assert 1 <= len(FakeDetailScraper.instances) <= 3
+    assert all(len(s.threads) == 1 and s.closed for s in FakeDetailScraper.instances)
+    assert DetailCache(cache.filename).get('IFB/9') == {'description': 'details of u9'}
+
+
+class DetailReplayScraper(ReplayScraper):
+    DETAILS = {
+        'IFB/001': 'Architectural design and supervision of the new ward block',
+        'IFB/002': 'Routine road maintenance for one year',
+    }
+
+    def extract_row_links(self):
+        return [f'/egp/detail/{cells[1]}' for cells in self.extract_table_rows()]
+
+    def get_tender_details(self, url):
+        return {'description': self.DETAILS[url.rsplit('/detail/', 1)[1]]}
+
+
+def test_scrape_enriches_relevant_tenders_and_rechecks_them(archive, row):
+    tm = archive(storage_mode='json')
+    pages = [[row(1, 'Architectural design of ward block'), row(2, 'Consulting services'),
+              row(3, 'Supply of medicine')]]
+    added = tm.scrape_bolpatra(scraper=DetailReplayScraper(pages), enrich_details=True, quiet=True)
+
+    assert added == 1
+    [saved] = tm.tenders
+    assert saved['description'] == DetailReplayScraper.DETAILS['IFB/001']
+    assert saved['detail_url'].endswith('/egp/detail/IFB/001')
+    # The description showed 'Consulting services' is road maintenance
+    assert any(k.startswith('consulting services') for k in tm.non_relevant_seen_keys)
+    counters = tm.last_metrics.report()['counters']
+    assert counters['rejected_by_details'] == 1
+    assert counters['detail_fetches'] == 2
+    with open('detail_cache.json', encoding='utf-8') as f:
+        assert set(json.load(f)) == {'IFB/001', 'IFB/002'}
+
+
+class SlowDetailReplay(ReplayScraper):
+    def extract_row_links(self):
+        return [f'/egp/detail/{cells[1]}' for cells in self.extract_table_rows()]
+
+    def get_tender_details(self, url):
+        time.sleep(0.2)
+        return {'description': 'Architectural design and supervision'}
+
+
+def test_row_repeated_while_details_pending_is_a_duplicate(archive, row):
+    tm = archive(storage_mode='json')
+    repeated = row(1, 'Architectural design of ward block')
+    pages = [[repeated], [repeated, row(2, 'Supply of medicine')]]
+    assert tm.scrape_bolpatra(scraper=SlowDetailReplay(pages), enrich_details=True, quiet=True) == 1
+    assert [t['ifb_no'] for t in tm.tenders] == ['IFB/001']
+    assert tm.last_metrics.report()['counters']['duplicates'] == 1
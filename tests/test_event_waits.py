@@ -0,0 +1,62 @@
+"""
+Tests for the condition-based waits that replaced fixed sleeps in the scraper.
+"""
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from mini_tender import BolpatraScraper, load_selenium
+
+
+class FakeRow:
+    def __init__(self, text):
+        self._text = text
+        self.stale = False
+
+    @property
+    def text(self):
+        if self.stale:
+            raise RuntimeError("stale element reference")
+        return self._text
+
+
+def test_rows_replaced_detects_stale_or_changed_rows():
+    row = FakeRow("1 IFB/001 Design of school")
+    condition = BolpatraScraper.rows_replaced(row, row.text)
+    assert not condition(None)
+    row._text = "31 IFB/031 Design of hall"
+    assert condition(None)
+
+    row = FakeRow("same")
+    condition = BolpatraScraper.rows_replaced(row, "same")
+    row.stale = True
+    assert condition(None)
+
+
+def test_timed_wait_records_each_wait():
+    load_selenium()
+    scraper = BolpatraScraper()
+    scraper.driver = object()
+    calls = []
+
+    def ready_on_third_poll(driver):
+        calls.append(1)
+        return len(calls) >= 3
+
+    assert scraper.timed_wait("table", lambda d: True) is True
+    scraper.timed_wait("table", ready_on_third_poll, timeout=5)
+    summary = scraper.wait_summary()
+    assert summary["table"]["count"] == 2
+    assert summary["table"]["max"] < 5
+
+
+def test_timed_wait_records_timeouts_too():
+    load_selenium()
+    from selenium.common.exceptions import TimeoutException
+
+    scraper = BolpatraScraper()
+    scraper.driver = object()
+    with pytest.raises(TimeoutException):
+        scraper.timed_wait("overlay", lambda d: False, timeout=0.1)
+    assert scraper.wait_summary()["overlay"]["count"] == 1
@@ -0,0 +1,57 @@
+"""
+FingerprintIndex: seen keys as sorted, memory-mapped 64-bit hashes with an
+in-memory delta, and TenderManager's opt-in 'fingerprint' seen-key mode.
+"""
+
+import json
+import os
+
+from mini_tender import FingerprintIndex, TenderManager
+
+
+def keys(n, prefix='title'):
+    return [f'{prefix} {i}|||org {i % 7}|||01-11-2025 10:00' for i in range(n)]
+
+
+def test_add_contains_len_across_delta_and_merge(tmp_path):
+    path = str(tmp_path / 'seen.fp')
+    index = FingerprintIndex(path, merge_threshold=50)
+    index.update(keys(30))
+    index.add(keys(1)[0])
+    assert len(index) == 30 and keys(30)[-1] in index and 'unknown' not in index
+
+    index.save()  # first save creates the sorted file
+    assert os.path.getsize(path) == 30 * 8 and not index.delta
+    index.update(keys(40, 'more'))
+    index.save()  # below the threshold: appended to the delta file
+    assert os.path.getsize(path + '.delta') == 40 * 8
+
+    reopened = FingerprintIndex(path, merge_threshold=50)
+    assert len(reopened) == 70
+    assert all(k in reopened for k in keys(30) + keys(40, 'more'))
+    reopened.update(keys(20, 'last'))
+    reopened.save()  # delta reached the threshold: merged
+    assert not os.path.exists(path + '.delta')
+    merged = list(reopened.merged)
+    assert merged == sorted(merged) and len(merged) == 90
+    assert keys(20, 'last')[5] in FingerprintIndex(path)
+
+
+def test_manager_imports_json_keys_once(archive):
+    with open('seen_keys.json', 'w', encoding='utf-8') as f:
+        json.dump(keys(5), f)
+    with open('non_relevant_seen_keys.json', 'w', encoding='utf-8') as f:
+        json.dump(keys(3, 'other'), f)
+
+    tm = archive(seen_index='fingerprint')
+    assert len(tm.seen_keys) == 5 and len(tm.non_relevant_seen_keys) == 3
+    assert tm.is_seen(keys(3, 'other')[2])
+
+    tm.mark_seen('new|||org|||date')
+    tm.mark_seen('skip|||org|||date', relevant=False)
+    tm.flush_seen_keys()
+
+    os.remove('seen_keys.json')  # no longer consulted once imported
+    again = TenderManager(seen_index='fingerprint')
+    assert again.is_seen('new|||org|||date') and again.is_seen('skip|||org|||date')
+    assert len(again.seen_keys) == 6
@@ -0,0 +1,42 @@
+"""
+Tests for batched (group-commit) persistence of the seen-key files.
+"""
+
+import json
+
+from mini_tender import GroupCommit
+
+
+def test_group_commit_flushes_on_size_threshold():
+    saves = []
+    commit = GroupCommit(lambda: saves.append(1), max_pending=3, max_delay=3600)
+    commit.mark_dirty()
+    commit.mark_dirty()
+    assert saves == []
+    commit.mark_dirty()
+    assert saves == [1]
+    commit.flush()  # nothing pending
+    assert saves == [1]
+
+
+def test_group_commit_flushes_on_time_threshold():
+    saves = []
+    commit = GroupCommit(lambda: saves.append(1), max_pending=1000, max_delay=0)
+    commit.mark_dirty()
+    assert saves == [1]
+
+
+def test_mark_seen_batches_until_flush(archive):
+    tm = archive()
+
+    for i in range(10):
+        tm.mark_seen(f'non relevant {i}|||org|||2025-01-01', relevant=False)
+    tm.mark_seen('design of building|||org|||2025-01-01')
+    with open(tm.non_relevant_seen_file, encoding='utf-8') as f:
+        assert json.load(f) == []
+
+    tm.flush_seen_keys()
+    with open(tm.non_relevant_seen_file, encoding='utf-8') as f:
+        assert len(json.load(f)) == 10
+    with open(tm.seen_keys_file, encoding='utf-8') as f:
+        assert json.load(f) == ['design of building|||org|||2025-01-01']
@@ -0,0 +1,97 @@
+"""
+Tests for the browserless HTTP scraper against a local stand-in server that
+serves recorded Bolpatra listing pages from tests/fixtures.
+"""
+
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from mini_tender import BolpatraHttpScraper, parse_listing_html
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def fixture_page(page):
+    path = os.path.join(FIXTURES, f'bolpatra_listing_page_{page}.html')
+    if not os.path.exists(path):
+        path = os.path.join(FIXTURES, 'bolpatra_listing_page_3.html')  # empty table
+    with open(path, encoding='utf-8') as f:
+        return f.read()
+
+
+class ListingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive, like the real site
+    client_ports = set()
+    requested_pages = []
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        ListingHandler.client_ports.add(self.client_address[1])
+        if parts.path != '/egp/searchOpportunity':
+            self.send_error(404)
+            return
+        page = int(parse_qs(parts.query).get('currentPageIndex', ['1'])[0])
+        ListingHandler.requested_pages.append(page)
+        body = fixture_page(page).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Set-Cookie', 'JSESSIONID=abc123; Path=/egp')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    ListingHandler.client_ports = set()
+    ListingHandler.requested_pages = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ListingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_parse_listing_html_skips_header_and_pager():
+    rows = parse_listing_html(fixture_page(1))
+    assert len(rows) == 10
+    assert all(len(r) == 9 for r in rows)
+    assert rows[0][0] == '1'
+    assert parse_listing_html(fixture_page(3)) == []
+
+
+def test_http_scraper_walks_pages_over_one_connection():
+    server = serve()
+    try:
+        scraper = BolpatraHttpScraper(base_url=f'http://127.0.0.1:{server.server_port}/egp')
+        assert scraper.init_driver()
+        tenders = list(scraper.scrape_tenders())
+        scraper.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(tenders) == 20
+    assert ListingHandler.requested_pages == [1, 2, 3]
+    assert len(ListingHandler.client_ports) == 1  # pooled keep-alive connection
+    assert scraper.session is None
+    assert tenders[0]['source'] == 'Bolpatra'
+    assert tenders[0]['ifb_no'] == parse_listing_html(fixture_page(1))[0][1]
+
+
+def test_http_scraper_single_page_and_cookies():
+    server = serve()
+    try:
+        scraper = BolpatraHttpScraper(base_url=f'http://127.0.0.1:{server.server_port}/egp')
+        scraper.init_driver()
+        tenders = list(scraper.scrape_tenders(scrape_all_pages=False))
+        cookies = dict(scraper.session.cookies)
+        scraper.close()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(tenders) == 10
+    assert cookies == {'JSESSIONID': 'abc123'}
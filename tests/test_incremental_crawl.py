@@ -0,0 +1,78 @@
+"""
+Incremental crawl: stop policies end a replayed crawl once it reaches
+listings a previous run already processed.
+"""
+
+import pytest
+
+from mini_tender import (CrawlState, ReplayScraper, StopAfterConsecutiveSeen,
+                         StopAfterFullySeenPage, StopAtHighWaterMark, TenderManager,
+                         incremental_stop_policies)
+
+
+def pages_of(rows, per_page=3):
+    return [rows[i:i + per_page] for i in range(0, len(rows), per_page)]
+
+
+class CountingReplay(ReplayScraper):
+    """Records how many rows the crawl actually pulled from the scraper."""
+
+    def scrape_tenders(self, scrape_all_pages=True):
+        self.pulled = 0
+        for tender in super().scrape_tenders(scrape_all_pages):
+            self.pulled += 1
+            yield tender
+
+
+@pytest.fixture
+def old(row):
+    """Nine listings published 01-10-2025 .. 09-10-2025, oldest first."""
+    return [row(n, f'Design of school block {n}', notice=f'{n:02d}-10-2025 10:00') for n in range(1, 10)]
+
+
+def test_second_run_stops_at_high_water_mark(archive, row, old):
+    tm = archive()
+    newest_first = list(reversed(old))
+    assert tm.scrape_bolpatra(scraper=ReplayScraper(pages_of(newest_first))) == 9
+
+    state = CrawlState('crawl_state.json')
+    assert state.newest_notice_date == '2025-10-09 10:00'
+    assert state.newest_ifb_no == 'IFB/009'
+
+    new = [row(20 + n, f'Architectural design of ward {n}', notice='15-10-2025 09:00') for n in range(2)]
+    scraper = CountingReplay(pages_of(new + newest_first))
+    added = TenderManager().scrape_bolpatra(scraper=scraper,
+                                            stop_policies=[StopAtHighWaterMark()])
+    assert added == 2
+    assert scraper.pulled == 3
+    assert CrawlState('crawl_state.json').newest_ifb_no == 'IFB/020'
+
+
+def test_consecutive_seen_policy_ignores_isolated_duplicates(tmp_path):
+    policy = StopAfterConsecutiveSeen(3)
+    policy.reset(CrawlState(str(tmp_path / 'missing.json')))
+    verdicts = [policy.check({}, 1, seen) for seen in (True, True, False, True, True, True)]
+    assert verdicts[:5] == [None] * 5
+    assert '3 consecutive' in verdicts[5]
+
+
+def test_fully_seen_page_stops_at_next_page(archive, row, old):
+    tm = archive()
+    tm.scrape_bolpatra(scraper=ReplayScraper(pages_of(old[:3])))
+
+    fresh = [row(30, 'Design of library', notice='20-10-2025 10:00')]
+    later = [row(31, 'Design of museum', notice='21-10-2025 10:00')]
+    scraper = CountingReplay([old[:3], later + fresh])
+    added = TenderManager().scrape_bolpatra(scraper=scraper,
+                                            stop_policies=[StopAfterFullySeenPage()])
+    assert added == 0
+    assert scraper.pulled == 4
+
+
+def test_without_policies_every_page_is_visited(archive, old):
+    tm = archive()
+    tm.scrape_bolpatra(scraper=ReplayScraper(pages_of(old)))
+    scraper = CountingReplay(pages_of(old))
+    assert TenderManager().scrape_bolpatra(scraper=scraper) == 0
+    assert scraper.pulled == 9
+    assert len(incremental_stop_policies()) == 3
@@ -0,0 +1,49 @@
+"""
+Tests for the append-only JSON Lines storage mode of TenderManager.
+"""
+
+import json
+import os
+
+from mini_tender import TenderManager
+
+
+def make_tender(i):
+    return {
+        'title': f'Architectural Design of Building {i}',
+        'organization': 'City Office',
+        'deadline': '2025-12-31',
+        'days_left': 30,
+        'source': 'Bolpatra',
+    }
+
+
+def test_jsonl_appends_then_compacts(archive):
+    tm = archive([make_tender(0)], storage_mode='jsonl')
+    tm.insert_tender(make_tender(1))
+    tm.insert_tender(make_tender(2))
+
+    # Snapshot untouched, new tenders only in the log
+    with open('tenders.json', encoding='utf-8') as f:
+        assert len(json.load(f)) == 1
+    with open('tenders.jsonl', encoding='utf-8') as f:
+        assert [json.loads(line)['title'] for line in f] == [
+            make_tender(1)['title'], make_tender(2)['title']]
+
+    # A fresh manager sees snapshot + log
+    assert len(TenderManager(storage_mode='json').tenders) == 3
+
+    tm.compact_log()
+    assert not os.path.exists('tenders.jsonl')
+    with open('tenders.json', encoding='utf-8') as f:
+        assert len(json.load(f)) == 3
+
+
+def test_load_from_log_only_skips_partial_line(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with open('tenders.jsonl', 'w', encoding='utf-8') as f:
+        f.write(json.dumps(make_tender(1)) + "\n")
+        f.write('{"title": "trunc')
+
+    tm = TenderManager(storage_mode='jsonl')
+    assert [t['title'] for t in tm.tenders] == [make_tender(1)['title']]
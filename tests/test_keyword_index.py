@@ -0,0 +1,39 @@
+"""
+Tests for the inverted keyword index behind search_tenders option 2.
+"""
+
+from mini_tender import InvertedIndex, parse_keyword_query
+
+
+def test_parse_keyword_query():
+    assert parse_keyword_query("design hospital") == [[("design", False), ("hospital", False)]]
+    assert parse_keyword_query("school OR archit*") == [[("school", False)], [("archit", True)]]
+    assert parse_keyword_query("  ") == []
+
+
+def test_index_and_or_prefix():
+    index = InvertedIndex()
+    index.add(0, "Architectural Design of Hospital")
+    index.add(1, "Design of school building")
+    index.add(2, "Supply of hospital beds")
+
+    assert index.search("design") == [0, 1]
+    assert index.search("design hospital") == [0]
+    assert index.search("school OR beds") == [1, 2]
+    assert index.search("archit*") == [0]
+    assert index.search("hosp* design") == [0]
+    assert index.search("missing") == []
+
+
+def test_manager_index_updates_on_insert(archive):
+    tm = archive([{'title': 'Design of Park', 'organization': 'City Office',
+                   'deadline': '2025-12-31'}])
+    assert [t['title'] for t in tm.find_by_keyword('park')] == ['Design of Park']
+
+    tm.insert_tender({'title': 'Survey of Stadium', 'organization': 'Sports Council',
+                      'deadline': '2025-12-31', 'description': 'Park and stadium survey'})
+    assert len(tm.find_by_keyword('park')) == 2
+    assert [t['title'] for t in tm.find_by_keyword('stad*')] == ['Survey of Stadium']
+
+    tm.clear_tenders()
+    assert tm.find_by_keyword('park') == []
@@ -0,0 +1,82 @@
+"""
+Checks that the precompiled KeywordMatcher gives exactly the same verdicts
+as the original substring-loop filter.
+"""
+
+import json
+import os
+
+from mini_tender import (
+    EXCLUDE_KEYWORDS,
+    INCLUDE_KEYWORDS,
+    KeywordMatcher,
+    TenderManager,
+)
+
+
+def reference_is_architecture_related(title):
+    """The original any(k in text ...) implementation."""
+    if not title:
+        return False
+    text = title.lower()
+    if not any(k in text for k in INCLUDE_KEYWORDS):
+        return False
+    if any(k in text for k in EXCLUDE_KEYWORDS):
+        return False
+    strong_contexts = ["building", "hospital", "school", "campus", "office", "complex", "hall", "housing", "facility", "center"]
+    if any(ctx in text for ctx in strong_contexts):
+        return True
+    if any(k in text for k in ["dpr", "feasibility", "master plan", "architect", "consult", "supervision", "design"]):
+        return True
+    matches = [k for k in INCLUDE_KEYWORDS if k in text]
+    return len(matches) >= 2
+
+
+def reference_is_relevant_tender(title, context=""):
+    title_text = (title or "").strip().lower()
+    context_text = (context or "").strip().lower()
+    if reference_is_architecture_related(title_text):
+        return True
+    combined = f"{title_text} {context_text}".strip()
+    if not combined:
+        return False
+    if any(ex in combined for ex in EXCLUDE_KEYWORDS):
+        return False
+    return any(inc in combined for inc in INCLUDE_KEYWORDS)
+
+
+def sample_pairs():
+    pairs = [
+        ("", ""),
+        ("", "Architectural design"),
+        ("Survey and mapping", ""),
+        ("Urban park", "City Office"),
+        ("Architectural Design for Park", ""),
+        ("Road Improvement and Structural works", "Division Road Office"),
+        ("Preparation of master", "plan for the municipality"),
+        ("Supply of water supply pipes", "Water Supply Office"),
+        ("  TERMINAL Layout  ", "  "),
+        ("Construction of Hall", "Sand and gravel"),
+        ("Layout mapping", "river"),
+    ]
+    path = os.path.join(os.path.dirname(__file__), '..', 'tenders.json')
+    with open(path, 'r', encoding='utf-8') as f:
+        for t in json.load(f):
+            pairs.append((t.get('title', ''), t.get('description', '') + ' ' + t.get('organization', '')))
+            pairs.append((t.get('title', ''), ''))
+    return pairs
+
+
+def test_matcher_matches_reference_verdicts():
+    matcher = KeywordMatcher(INCLUDE_KEYWORDS, EXCLUDE_KEYWORDS)
+    for title, context in sample_pairs():
+        assert matcher.is_architecture_related(title) == reference_is_architecture_related(title), title
+        assert matcher.is_relevant(title, context) == reference_is_relevant_tender(title, context), (title, context)
+
+
+def test_classify_many_matches_single_calls():
+    pairs = sample_pairs()
+    expected = [TenderManager.is_relevant_tender(t, c) for t, c in pairs]
+    assert TenderManager.classify_many(pairs) == expected
+    titles = [t for t, _ in pairs]
+    assert TenderManager.classify_many(titles) == [TenderManager.is_relevant_tender(t) for t in titles]
@@ -0,0 +1,18 @@
+"""
+Importing mini_tender must not pull in Selenium; scraping loads it on demand.
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_import_does_not_load_selenium():
+    code = (
+        "import sys, mini_tender\n"
+        "assert not any(m == 'selenium' or m.startswith('selenium.') for m in sys.modules)\n"
+        "assert mini_tender.TenderManager.is_relevant_tender('Design of school building')\n"
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
@@ -0,0 +1,87 @@
+"""
+Page fingerprinting: unchanged listing pages are skipped (or end the crawl)
+on a repeat run, and only fully processed pages are recorded.
+"""
+
+import json
+import os
+
+import pytest
+
+from mini_tender import ReplayScraper, TenderManager
+
+
+@pytest.fixture
+def pages(row):
+    return [
+        [row(1, 'Architectural design of ward block'), row(2, 'Supply of medicine')],
+        [row(3, 'Design and supervision of school building'), row(4, 'Supply of rice')],
+        [row(5, 'Design of park'), row(6, 'Repair of road')],
+    ]
+
+
+def crawl(tm, pages, policy='skip', workers=1, pipeline=False):
+    tm.scrape_bolpatra(scraper=ReplayScraper(pages), unchanged_pages=policy, workers=workers,
+                       pipeline=pipeline, quiet=True)
+    return tm.last_metrics.report()['counters']
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_unchanged_pages_are_skipped(archive, row, pages, workers):
+    tm = archive(storage_mode='json')
+    assert crawl(tm, pages, workers=workers)['rows'] == 6
+    with open('page_fingerprints.json', encoding='utf-8') as f:
+        assert sorted(json.load(f)) == ['1', '2', '3']
+
+    counters = crawl(tm, pages, workers=workers)
+    assert counters['pages_unchanged'] == 3
+    assert 'rows' not in counters
+
+    changed = [pages[0], [row(7, 'Design of hospital'), row(4, 'Supply of rice')], pages[2]]
+    counters = crawl(tm, changed, workers=workers)
+    assert counters['pages_unchanged'] == 2
+    assert counters['rows'] == 2
+    assert [t['title'] for t in tm.tenders][-1] == 'Design of hospital'
+
+
+def test_stop_policy_ends_crawl_at_first_unchanged_page(archive, row, pages):
+    tm = archive(storage_mode='json')
+    crawl(tm, pages, policy='stop')
+    newer = [[row(8, 'Design of library'), row(9, 'Supply of paper')]] + pages[1:]
+    counters = crawl(tm, newer, policy='stop')
+    assert counters['rows'] == 2
+    assert counters['pages_unchanged'] == 1
+
+
+def test_partly_processed_page_is_not_recorded(archive, row, pages):
+    tm = archive(storage_mode='json')
+    # days_left <= 7 ends the scrape in the middle of page 2
+    partial = [pages[0], [row(3, 'Design of hall', 3), row(4, 'Supply of rice')], pages[2]]
+    crawl(tm, partial)
+    with open('page_fingerprints.json', encoding='utf-8') as f:
+        assert sorted(json.load(f)) == ['1']
+
+
+def test_page_is_parsed_again_when_its_keys_are_no_longer_seen(archive, pages):
+    tm = archive(storage_mode='json')
+    crawl(tm, pages)
+    rice = next(k for k in tm.non_relevant_seen_keys if k.startswith('supply of rice'))
+    tm.non_relevant_seen_keys.discard(rice)
+    counters = crawl(tm, pages)
+    assert counters['pages_unchanged'] == 2  # pages 1 and 3
+    assert counters['rows'] == 2
+    assert rice in tm.non_relevant_seen_keys
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_sqlite_keys_checked_off_the_main_thread(archive, pages, workers):
+    tm = archive(storage_mode='sqlite')
+    crawl(tm, pages)
+    tm.tenders.close()
+    os.remove('seen_keys.json')  # the database still holds the relevant keys
+
+    tm = TenderManager(storage_mode='sqlite')
+    assert not tm.seen_keys
+    counters = crawl(tm, pages, workers=workers, pipeline=True)
+    assert counters['pages_unchanged'] == 3
+    assert 'rows' not in counters
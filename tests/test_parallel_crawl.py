@@ -0,0 +1,64 @@
+"""
+Tests for BolpatraScraper.scrape_tenders_parallel using fake browser workers.
+"""
+
+import threading
+import time
+
+from mini_tender import BolpatraScraper
+
+PAGES = 7
+ROWS_PER_PAGE = 3
+
+
+class FakeWorker(BolpatraScraper):
+    """Stands in for a browser: each page has a few rows, pages beyond PAGES are empty."""
+
+    started = []
+    lock = threading.Lock()
+
+    def init_driver(self):
+        with self.lock:
+            FakeWorker.started.append(self)
+        self.page = 1
+        return True
+
+    def open_listing(self):
+        self.page = 1
+
+    def go_to_next_page(self, next_page):
+        if next_page > PAGES:
+            return False
+        self.page = next_page
+        return True
+
+    def scrape_current_page(self):
+        # Later pages finish first, so results arrive out of order
+        time.sleep(0.001 * (PAGES - self.page))
+        for row in range(ROWS_PER_PAGE):
+            yield {'title': f'page {self.page} row {row}'}
+
+    def close(self):
+        pass
+
+
+def test_parallel_crawl_yields_in_page_order():
+    FakeWorker.started = []
+    titles = [t['title'] for t in FakeWorker().scrape_tenders_parallel(workers=3)]
+    assert titles == [f'page {p} row {r}' for p in range(1, PAGES + 1) for r in range(ROWS_PER_PAGE)]
+    assert len(FakeWorker.started) == 3
+
+
+def test_closing_generator_stops_workers():
+    FakeWorker.started = []
+    before = threading.active_count()
+    gen = FakeWorker().scrape_tenders_parallel(workers=2)
+    first = next(gen)
+    gen.close()
+    assert first['title'] == 'page 1 row 0'
+    assert threading.active_count() == before
+
+
+def test_single_page_mode():
+    titles = [t['title'] for t in FakeWorker().scrape_tenders_parallel(workers=2, scrape_all_pages=False)]
+    assert titles == [f'page 1 row {r}' for r in range(ROWS_PER_PAGE)]
@@ -0,0 +1,56 @@
+"""
+RelevanceCache: verdicts persisted per (title, context) hash and dropped
+automatically when the keyword lists change.
+"""
+
+import json
+
+import mini_tender
+from mini_tender import RelevanceCache, get_keyword_matcher
+
+ITEMS = [('Architectural design of ward block', ''), ('Supply of medicine', ''),
+         'Design and supervision of school building']
+
+
+def test_cached_verdicts_match_matcher_and_persist(tmp_path):
+    path = str(tmp_path / 'relevance_cache.json')
+    cache = RelevanceCache(path)
+    expected = get_keyword_matcher().classify_many(ITEMS)
+    assert cache.classify_many(ITEMS) == expected
+    assert len(cache.verdicts) == 3
+
+    reloaded = RelevanceCache(path)
+    calls = []
+    original = mini_tender.KeywordMatcher.classify_many
+    mini_tender.KeywordMatcher.classify_many = lambda self, items: calls.append(1) or original(self, items)
+    try:
+        assert reloaded.classify_many(ITEMS) == expected
+    finally:
+        mini_tender.KeywordMatcher.classify_many = original
+    assert calls == []
+
+
+def test_keyword_change_invalidates_cache(tmp_path, monkeypatch):
+    path = str(tmp_path / 'relevance_cache.json')
+    title = 'Architectural design of ward block'
+    cache = RelevanceCache(path)
+    assert cache.classify_many([title]) == [True]
+    old_version = cache.version
+
+    monkeypatch.setattr(mini_tender, 'EXCLUDE_KEYWORDS', mini_tender.EXCLUDE_KEYWORDS + ['ward'])
+    assert cache.classify_many([title]) == [False]
+    assert cache.version != old_version
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f)['version'] == cache.version
+
+    monkeypatch.undo()
+    assert RelevanceCache(path).classify_many([title]) == [True]
+
+
+def test_manager_views_use_cache(archive):
+    tenders = [{'title': 'Architectural design of ward block', 'description': ''},
+               {'title': 'Supply of medicine', 'description': ''}]
+    tm = archive(tenders, storage_mode='json')
+    assert [t['title'] for t in tm.relevant_tenders()] == ['Architectural design of ward block']
+    with open('relevance_cache.json', encoding='utf-8') as f:
+        assert len(json.load(f)['verdicts']) == 2
@@ -0,0 +1,56 @@
+"""
+Offline record/replay tests: recorded listing pages are replayed through
+scrape_current_page, parse_row_cells and the real scrape_bolpatra loop.
+"""
+
+import json
+import os
+
+from mini_tender import ReplayScraper
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def test_replay_html_pages_through_real_loop(archive):
+    pages = ReplayScraper.load_pages(FIXTURES)
+    assert [len(p) for p in pages] == [10, 10, 0]
+
+    tm = archive()
+    tm.scrape_bolpatra(scraper=ReplayScraper(FIXTURES))
+
+    seen = len(tm.seen_keys) + len(tm.non_relevant_seen_keys)
+    assert seen > 0
+    assert all(t['source'] == 'Bolpatra' for t in tm.tenders)
+    with open('tenders.json', encoding='utf-8') as f:
+        assert len(json.load(f)) == len(tm.tenders)
+
+
+def test_replay_stops_at_relevant_tender_with_few_days_left(archive, row):
+    pages = [
+        [row(1, 'Architectural Design for Building A', 45),
+         row(2, 'Supply of medicine', 3)],
+        [row(3, 'Survey and Design Study of Hospital', 3),
+         row(4, 'This should not be processed: design of hall', 30)],
+        [row(5, 'Never reached: school building design', 30)],
+    ]
+    tm = archive()
+    added = tm.scrape_bolpatra(scraper=ReplayScraper(pages))
+
+    assert added == 1
+    assert [t['title'] for t in tm.tenders] == ['Architectural Design for Building A']
+    assert len(tm.non_relevant_seen_keys) == 1
+    titles_seen = {k.split('|||')[0] for k in tm.seen_keys}
+    assert 'survey and design study of hospital' in titles_seen
+    assert not any('not be processed' in k or 'never reached' in k for k in tm.seen_keys)
+
+
+def test_record_then_replay_round_trip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    recorder = ReplayScraper(FIXTURES)
+    recorder.record_dir = str(tmp_path / 'recorded')
+    first = list(recorder.scrape_tenders())
+
+    assert sorted(os.listdir(recorder.record_dir)) == ['page_001.json', 'page_002.json']
+    replayed = list(ReplayScraper(recorder.record_dir).scrape_tenders())
+    strip = lambda ts: [{k: v for k, v in t.items() if k != 'scraped_date'} for t in ts]
+    assert strip(replayed) == strip(first)
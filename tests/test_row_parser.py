@@ -0,0 +1,47 @@
+"""
+Tests for the browser-free listing row parser (BolpatraScraper.parse_row_cells).
+"""
+
+from mini_tender import BolpatraScraper
+
+ROW = [
+    '1',
+    'NLBO-NPJ/NCB/WORKS/2082-083/01',
+    'Maintenance of Shed and Structural improvement project',
+    'National Livestock Breeding Office, Banke',
+    'Works  NCB',
+    'Published',
+    '12-11-2025 10:00',
+    '12-12-2025 12:00',
+    '29 days',
+]
+
+
+def test_parse_full_row():
+    tender = BolpatraScraper.parse_row_cells(ROW)
+    assert tender['ifb_no'] == 'NLBO-NPJ/NCB/WORKS/2082-083/01'
+    assert tender['title'] == 'Maintenance of Shed and Structural improvement project'
+    assert tender['organization'] == 'National Livestock Breeding Office, Banke'
+    assert tender['Procurement Type'] == 'works  ncb'
+    assert tender['notice date'] == '12-11-2025 10:00'
+    assert tender['deadline'] == '12-12-2025 12:00'
+    assert tender['days_left'] == 29
+    assert tender['source'] == 'Bolpatra'
+
+
+def test_parse_normalizes_dates_and_expired():
+    cells = list(ROW)
+    cells[6] = '01/11/2025'
+    cells[7] = '2025-12-01'
+    cells[8] = 'Expired'
+    tender = BolpatraScraper.parse_row_cells(cells)
+    assert tender['notice date'] == '2025-11-01'
+    assert tender['deadline'] == '2025-12-01'
+    assert tender['days_left'] == -1
+
+
+def test_rejects_incomplete_rows():
+    assert BolpatraScraper.parse_row_cells(ROW[:8]) is None
+    assert BolpatraScraper.parse_row_cells(['1', '', 'Title'] + ROW[3:]) is None
+    assert BolpatraScraper.parse_row_cells(['1', 'IFB', ''] + ROW[3:]) is None
+    assert BolpatraScraper.parse_row_cells([]) is None
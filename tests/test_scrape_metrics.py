@@ -0,0 +1,54 @@
+"""
+ScrapeMetrics: per-phase timings, counters and the JSON report written
+for every scrape_bolpatra run.
+"""
+
+import json
+import os
+
+import pytest
+
+from mini_tender import ReplayScraper, ScrapeMetrics, TenderManager
+
+
+@pytest.fixture
+def pages(row):
+    return [
+        [row(1, 'Architectural design of ward block'), row(2, 'Supply of medicine')],
+        [row(3, 'Design and supervision of school building'), row(4, 'Supply of stationery')],
+    ]
+
+
+def test_phase_accumulates_and_reports():
+    metrics = ScrapeMetrics()
+    for _ in range(3):
+        with metrics.phase('row_parse'):
+            pass
+    metrics.count('rows', 3)
+    metrics.page_rows(1, 3)
+    metrics.finish()
+    report = metrics.report()
+    assert report['phases']['row_parse']['count'] == 3
+    assert report['counters'] == {'rows': 3} and report['avg_rows_per_page'] == 3
+    json.dumps(report)
+
+
+def test_scrape_writes_report_and_quiet_skips_row_lines(archive, pages, capsys):
+    tm = archive(storage_mode='json')
+    assert tm.scrape_bolpatra(scraper=ReplayScraper(pages), quiet=True) == 2
+    out = capsys.readouterr().out
+    assert 'New relevant tender found' not in out and 'Non-relevant tender' not in out
+
+    report = tm.last_metrics.report()
+    assert report['counters'] == {'rows': 4, 'relevant': 2, 'non_relevant': 2, 'added': 2}
+    assert report['rows_per_page'] == {'1': 2, '2': 2}
+    for phase in ('driver_startup', 'page_navigation', 'table_wait', 'row_parse',
+                  'dedup_lookup', 'classification', 'persistence'):
+        assert phase in report['phases'], phase
+    [name] = os.listdir('scrape_reports')
+    with open(os.path.join('scrape_reports', name), encoding='utf-8') as f:
+        assert json.load(f)['counters']['rows'] == 4
+
+    # Second run: everything is a duplicate, and per-row lines are printed again
+    TenderManager(storage_mode='json').scrape_bolpatra(scraper=ReplayScraper(pages))
+    assert 'Duplicate tender' in capsys.readouterr().out
@@ -0,0 +1,69 @@
+"""
+Threaded producer/consumer pipeline: pipelined() ordering, backpressure,
+early stop and error propagation, and scrape_bolpatra(pipeline=True).
+"""
+
+import threading
+import time
+
+import pytest
+
+from mini_tender import ReplayScraper, pipelined
+
+
+def test_pipelined_keeps_order_through_stages():
+    out = list(pipelined(range(200), stages=[lambda x: x * 2, lambda x: x + 1], maxsize=4))
+    assert out == [x * 2 + 1 for x in range(200)]
+
+
+def test_backpressure_and_early_stop_close_the_source():
+    produced = []
+    closed = threading.Event()
+
+    def source():
+        try:
+            for i in range(1000):
+                produced.append(i)
+                yield i
+        finally:
+            closed.set()
+
+    rows = pipelined(source(), stages=[lambda x: x], maxsize=2)
+    assert next(rows) == 0
+    time.sleep(0.2)
+    # Two bounded queues plus one item held by each thread, nowhere near 1000
+    assert len(produced) <= 8
+    rows.close()
+    assert closed.is_set()
+
+
+def test_errors_reach_the_consumer():
+    def source():
+        yield 1
+        raise RuntimeError('browser crashed')
+
+    with pytest.raises(RuntimeError, match='browser crashed'):
+        list(pipelined(source()))
+    with pytest.raises(ZeroDivisionError):
+        list(pipelined([1, 0], stages=[lambda x: 1 / x]))
+
+
+@pytest.fixture
+def pages(row):
+    return [
+        [row(1, 'Architectural design of ward block'), row(2, 'Supply of medicine')],
+        [row(3, 'Design and supervision of school building'), row(4, 'Survey and design of hall', 3)],
+        [row(5, 'Never reached: design of park')],
+    ]
+
+
+@pytest.mark.parametrize('pipeline', [False, True])
+def test_scrape_results_match_serial_run(archive, pages, pipeline):
+    tm = archive(storage_mode='json')
+    added = tm.scrape_bolpatra(scraper=ReplayScraper(pages), pipeline=pipeline, queue_size=1)
+
+    assert added == 2
+    assert [t['title'] for t in tm.tenders] == ['Architectural design of ward block',
+                                               'Design and supervision of school building']
+    assert not any('never reached' in k for k in tm.seen_keys)
+    assert tm.last_metrics.report()['counters']['stopped_early'] == 1
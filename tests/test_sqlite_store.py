@@ -0,0 +1,107 @@
+"""
+Tests for the SQLite storage mode (indexed search, dedup and insert).
+"""
+
+import json
+from datetime import datetime
+
+from mini_tender import ReplayScraper, SQLiteTenderStore, TenderManager
+
+
+SAMPLES = [
+    {
+        'ifb_no': 'IFB/001',
+        'title': 'Architectural Design of Hospital Building',
+        'organization': 'Health Office, Kaski',
+        'deadline': '12-12-2025 12:00',
+        'Procurement Type': 'consultancy ncb',
+        'notice date': '12-11-2025 10:00',
+        'province': 'Gandaki',
+        'source': 'Bolpatra',
+        'days_left': 29,
+        'scraped_date': '2025-11-13',
+    },
+    {
+        'title': 'Master plan for school campus',
+        'organization': 'Urban Dev Office',
+        'amount': 500000,
+        'deadline': '2025-02-15',
+        'category': 'Consultancy',
+        'description': 'Design services for community center',
+        'source': 'Manual',
+        'scraped_date': '2025-01-10',
+    },
+]
+
+
+def test_imports_json_and_queries_with_sql(archive):
+    tm = archive(SAMPLES, storage_mode='sqlite')
+    assert isinstance(tm.tenders, SQLiteTenderStore)
+    assert len(tm.tenders) == 2
+    assert list(tm.tenders) == SAMPLES
+
+    assert [t['ifb_no'] for t in tm.find_by_province('gandaki')] == ['IFB/001']
+    assert [t['title'] for t in tm.find_by_keyword('community')] == [SAMPLES[1]['title']]
+    assert len(tm.find_by_organization('office')) == 2
+    assert [t['title'] for t in tm.find_by_amount(1000, 600000)] == [SAMPLES[1]['title']]
+    assert [t['ifb_no'] for t in tm.find_by_deadline_after(datetime(2025, 12, 1))] == ['IFB/001']
+    assert len(tm.find_by_category('consult')) == 1
+
+
+def test_insert_dedups_by_key_and_ifb(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tm = TenderManager(storage_mode='sqlite')
+    before = len(tm.tenders)
+
+    assert tm.insert_tender(dict(SAMPLES[0])) is True
+    assert tm.insert_tender(dict(SAMPLES[0])) is False
+    assert len(tm.tenders) == before + 1
+    assert tm.tenders.contains_ifb('IFB/001')
+
+    key = tm._make_key(SAMPLES[0]['title'], SAMPLES[0]['organization'], SAMPLES[0]['notice date'])
+    assert tm.is_seen(key)
+
+    # Persisted across managers without any JSON snapshot
+    assert len(TenderManager(storage_mode='sqlite').tenders) == before + 1
+
+
+def test_scrape_counts_only_rows_the_database_kept(archive, row):
+    stored = {'ifb_no': 'IFB/001', 'title': 'Architectural design of ward block (amended)',
+              'organization': 'City Office', 'source': 'Bolpatra'}
+    tm = archive([stored], storage_mode='sqlite')
+    pages = [[row(1, 'Architectural design of ward block'), row(2, 'Design of hospital building')]]
+    assert tm.scrape_bolpatra(scraper=ReplayScraper(pages), quiet=True) == 1
+    counters = tm.last_metrics.report()['counters']
+    assert counters['added'] == 1
+    assert counters['duplicates'] == 1
+    assert [t['ifb_no'] for t in tm.tenders] == ['IFB/001', 'IFB/002']
+
+
+def test_keyword_search_matches_json_mode(archive):
+    json_tm = archive(SAMPLES + [
+        {'title': 'Design of town hall', 'organization': 'Municipality', 'description': None},
+        {'title': 'Survey of Hallway Lighting', 'organization': 'Municipality'},
+    ], storage_mode='json')
+    sqlite_tm = TenderManager(storage_mode='sqlite')
+    for query in ['hall', 'hall*', 'design', 'design OR survey', 'arch* hospital', 'none']:
+        assert sqlite_tm.find_by_keyword(query) == json_tm.find_by_keyword(query), query
+    assert [t['title'] for t in sqlite_tm.find_by_keyword('hall')] == ['Design of town hall']
+
+
+def test_keywords_column_added_to_existing_database(tmp_path):
+    import sqlite3
+    path = str(tmp_path / 'old.db')
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE tenders (id INTEGER PRIMARY KEY, tender_key TEXT UNIQUE NOT NULL, "
+                 "ifb_no TEXT UNIQUE, title TEXT NOT NULL, organization TEXT NOT NULL, deadline TEXT, "
+                 "procurement_type TEXT, notice_date TEXT, province TEXT, source TEXT NOT NULL DEFAULT 'Manual', "
+                 "days_left INTEGER, scraped_date TEXT, marked_relevant INTEGER DEFAULT 0, amount REAL, "
+                 "category TEXT, description TEXT, data TEXT NOT NULL, created_at TEXT, updated_at TEXT)")
+    conn.execute("INSERT INTO tenders (tender_key, title, organization, data) VALUES ('k', ?, 'o', ?)",
+                 (SAMPLES[1]['title'], json.dumps(SAMPLES[1])))
+    conn.commit()
+    conn.close()
+
+    store = SQLiteTenderStore(path, lambda title, org, date=None: f'{title}|||{org}|||{date}')
+    assert store.search_keywords('community') == [SAMPLES[1]]
+    store.close()
@@ -0,0 +1,75 @@
+"""
+Streaming exporter: fixed-schema CSV / NDJSON (optionally gzipped) and
+the export-since-last-time watermark.
+"""
+
+import csv
+import gzip
+import json
+import os
+
+from mini_tender import EXPORT_FIELDS, TenderExporter, TenderManager
+
+
+def tender(n, title='Architectural design of ward block'):
+    return {'title': f'{title} {n}', 'organization': 'City Office', 'notice date': f'{n:02d}-11-2025 10:00',
+            'deadline': '31-12-2025 12:00', 'days_left': 30, 'source': 'Bolpatra', 'extra': 'dropped'}
+
+
+def test_exporter_streams_generator_in_every_format(tmp_path):
+    produced = []
+
+    def rows():
+        for n in range(1, 4):
+            produced.append(n)
+            yield tender(n)
+
+    path = str(tmp_path / 'out.csv.gz')
+    assert TenderExporter().write(rows(), path) == 3
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        assert reader.fieldnames == EXPORT_FIELDS
+        assert [r['title'] for r in reader][-1].endswith('3')
+
+    path = str(tmp_path / 'out.ndjson')
+    TenderExporter().write((tender(n) for n in range(2)), path)
+    with open(path, encoding='utf-8') as f:
+        lines = [json.loads(line) for line in f]
+    assert len(lines) == 2 and list(lines[0]) == EXPORT_FIELDS and 'extra' not in lines[0]
+
+
+def test_since_last_export_uses_watermark(archive):
+    tm = archive([tender(1), tender(2, 'Supply of medicine')], storage_mode='json')
+
+    assert tm.export_to_csv(fmt='ndjson', since_last=True, filename='first.ndjson') == 1
+    assert tm.export_to_csv(fmt='ndjson', since_last=True, filename='none.ndjson') == 0
+
+    tm.insert_tender(tender(3))
+    tm.insert_tender(tender(4, 'Supply of medicine'))
+    assert tm.export_to_csv(fmt='ndjson', since_last=True, filename='second.ndjson') == 1
+    with open('second.ndjson', encoding='utf-8') as f:
+        assert json.loads(f.readline())['title'].endswith('3')
+
+    # A different format keeps its own watermark; a cleared archive starts over
+    assert tm.export_to_csv(fmt='csv', since_last=True, filename='all.csv') == 2
+    tm.clear_tenders()
+    tm.insert_tender(tender(5))
+    assert tm.export_to_csv(fmt='ndjson', since_last=True, filename='after_clear.ndjson') == 1
+
+
+def test_csv_snapshot_keeps_every_field(archive):
+    enriched = dict(tender(1), url='https://example.org/1', marked_relevant=True,
+                    detail_url='https://example.org/d/1',
+                    documents=[{'name': 'Bid', 'url': 'https://example.org/bid.pdf'}])
+    tm = archive([enriched, dict(tender(2), amount=250000.0)], storage_mode='json')
+    tm.save_to_csv()
+
+    [first, second] = tm.load_from_csv()
+    assert first['documents'] == enriched['documents']
+    assert (first['url'], first['detail_url'], first['extra']) == (
+        enriched['url'], enriched['detail_url'], 'dropped')
+    assert first['amount'] is None and second['amount'] == 250000.0
+
+    os.remove('tenders.json')  # the CSV is now the archive
+    from_csv = TenderManager(storage_mode='json')
+    assert [t['title'] for t in from_csv.find_by_amount(0, 300000)] == [second['title']]
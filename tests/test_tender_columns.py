@@ -0,0 +1,44 @@
+"""
+TenderColumns: NumPy columnar view with vectorized filters and group-bys.
+"""
+
+from datetime import datetime
+
+import pytest
+
+np = pytest.importorskip('numpy')
+from mini_tender import TenderColumns  # noqa: E402
+
+TENDERS = [
+    {'title': 'Design of hall', 'organization': 'City Office', 'amount': 500000,
+     'days_left': 3, 'deadline': '31-12-2025 12:00', 'source': 'Bolpatra',
+     'Procurement Type': 'consultancy  ncb'},
+    {'title': 'Design of park', 'organization': 'Ward 4', 'amount': '1,200,000',
+     'days_left': 20, 'deadline': '2025-11-20', 'source': 'Manual', 'category': 'Consultancy'},
+    {'title': 'Design of ward', 'organization': 'City Office', 'days_left': None,
+     'deadline': 'Not specified', 'source': 'Bolpatra', 'Procurement Type': 'works  ncb'},
+]
+
+
+def test_numeric_filters_and_group_bys():
+    cols = TenderColumns(TENDERS)
+    assert np.isnan(cols.amount[2]) and cols.amount[1] == 1200000
+    assert [t['title'] for t in cols.select(cols.between('amount', 400000, 600000))] == ['Design of hall']
+    assert cols.select(cols.deadline_between(after=datetime(2025, 12, 1)))[0]['title'] == 'Design of hall'
+
+    bolpatra = cols.equals('source', 'Bolpatra')
+    assert cols.counts('organization') == {'City Office': 2, 'Ward 4': 1}
+    assert cols.counts('procurement_type', bolpatra) == {'consultancy  ncb': 1, 'works  ncb': 1}
+    assert not cols.equals('source', 'Elsewhere').any()
+    assert cols.days_left_buckets() == {'1-5 days': 1, '16-30 days': 1, 'Unknown': 1}
+
+
+def test_manager_amount_search_uses_columns(archive):
+    tm = archive(TENDERS, storage_mode='json')
+    first = tm.columns()
+    assert len(first) == 3 and tm.columns() is first
+    assert [t['title'] for t in tm.find_by_amount(1000000, 2000000)] == ['Design of park']
+
+    tm.insert_tender(dict(TENDERS[0], title='Design of gate', amount=1500000))
+    assert tm.columns() is not first
+    assert len(tm.find_by_amount(1000000, 2000000)) == 2
@@ -0,0 +1,58 @@
+"""
+TenderStats: counters maintained on insert/clear and the stats snapshot
+shared with the frontend's StatisticsPage.
+"""
+
+import json
+
+from mini_tender import TenderStats, days_left_bucket
+
+
+def tender(title, source='Bolpatra', days_left=10, org='City Office', ptype='consultancy  ncb'):
+    return {'title': title, 'organization': org, 'source': source, 'days_left': days_left,
+            'Procurement Type': ptype, 'province': 'Bagmati', 'description': ''}
+
+
+def test_counters_and_snapshot_shape():
+    stats = TenderStats()
+    stats.add(tender('Architectural design of ward block', days_left=3), True)
+    stats.add(tender('Supply of medicine', source='Manual', days_left=40, ptype=''), False)
+    stats.add(tender('Design of park', days_left=None), True)
+
+    snap = stats.snapshot()
+    assert (snap['totalTenders'], snap['relevantTenders'], snap['urgentTenders']) == (3, 2, 1)
+    assert snap['avgDaysLeft'] == round(43 / 2)
+    assert snap['sourceCounts'] == {'Bolpatra': 2, 'Manual': 1}
+    assert snap['typeCounts'] == {'consultancy  ncb': 2, 'Unknown': 1}
+    assert {'daysLeft': '1-5 days', 'count': 1, 'source': 'Bolpatra'} in snap['daysLeftDistribution']
+    assert {'keyword': 'design', 'count': 2} in snap['keywordCounts']
+    assert not any(k['keyword'] == 'of' for k in snap['keywordCounts'])
+    assert [days_left_bucket(d) for d in (0, 5, 6, 30, 31, None)] == [
+        '0 days', '1-5 days', '6-15 days', '16-30 days', '30+ days', 'Unknown']
+
+
+def test_manager_keeps_stats_current_and_writes_snapshot(archive):
+    tm = archive([tender('Architectural design of ward block')], storage_mode='json')
+    assert (tm.stats.total, tm.stats.relevant) == (1, 1)
+
+    tm.insert_tender(tender('Supply of medicine', source='Manual'))
+    assert (tm.stats.total, tm.stats.relevant) == (2, 1)
+    tm.save_data(format='json')
+    with open('stats_snapshot.json', encoding='utf-8') as f:
+        assert json.load(f)['sourceCounts'] == {'Bolpatra': 1, 'Manual': 1}
+
+    tm.clear_tenders()
+    assert tm.stats.total == 0 and not tm.stats.by_source
+
+
+def test_sqlite_mode_counts_imported_tenders(archive):
+    titles = [f'Design of ward block {i}' for i in range(3)] + ['Supply of medicine']
+    tm = archive([tender(t) for t in titles], storage_mode='sqlite')
+    assert (tm.stats.total, tm.stats.relevant) == (4, 3)
+
+    tm.insert_tender(tender(titles[0]))  # already stored: not counted twice
+    tm.insert_tender(tender('Design of park'))
+    assert tm.stats.total == 5
+    tm.save_stats_snapshot()
+    with open('stats_snapshot.json', encoding='utf-8') as f:
+        assert json.load(f)['totalTenders'] == 5
@@ -0,0 +1,125 @@
+"""
+Tests for the write-ahead logs and atomic snapshot writes (crash recovery).
+"""
+
+import json
+import os
+from contextlib import contextmanager
+
+import pytest
+
+import mini_tender
+from mini_tender import TenderManager, WriteAheadLog, atomic_path
+
+
+def test_wal_skips_partial_last_line(tmp_path):
+    log = WriteAheadLog(str(tmp_path / 'x.wal'))
+    log.append({'a': 1})
+    log.append({'a': 2})
+    log.close()
+    with open(log.filename, 'a', encoding='utf-8') as f:
+        f.write('{"a": 3')  # crash mid-append
+    assert list(log.records()) == [{'a': 1}, {'a': 2}]
+
+    # After a restart the next append must not run into the torn line
+    log = WriteAheadLog(log.filename)
+    log.append({'a': 4})
+    log.close()
+    assert list(WriteAheadLog(log.filename).records()) == [{'a': 1}, {'a': 2}, {'a': 4}]
+    log.clear()
+    assert not log.exists()
+
+
+def test_atomic_path_keeps_old_file_on_failure(tmp_path):
+    target = tmp_path / 'data.json'
+    target.write_text('old', encoding='utf-8')
+    with pytest.raises(RuntimeError):
+        with atomic_path(str(target)) as tmp, open(tmp, 'w', encoding='utf-8') as f:
+            f.write('half written')
+            raise RuntimeError('crash')
+    assert target.read_text(encoding='utf-8') == 'old'
+    assert os.listdir(tmp_path) == ['data.json']
+
+    with atomic_path(str(target)) as tmp, open(tmp, 'w', encoding='utf-8') as f:
+        f.write('new')
+    assert target.read_text(encoding='utf-8') == 'new'
+
+
+def test_seen_keys_survive_crash_before_checkpoint(archive):
+    tm = archive()
+    tm.mark_seen('design of building|||org|||2025-01-01')
+    tm.mark_seen('supply of rice|||org|||2025-01-01', relevant=False)
+    tm.seen_log.close()  # crash: no flush_seen_keys()
+
+    tm = TenderManager()
+    assert 'design of building|||org|||2025-01-01' in tm.seen_keys
+    assert 'supply of rice|||org|||2025-01-01' in tm.non_relevant_seen_keys
+    # Replay checkpoints into the key files and drops the log
+    assert not os.path.exists('seen_keys.wal')
+    with open(tm.seen_keys_file, encoding='utf-8') as f:
+        assert json.load(f) == ['design of building|||org|||2025-01-01']
+
+
+def test_logged_tenders_replayed_once(archive):
+    tender = {'title': 'Design of hospital', 'organization': 'org', 'notice_date': '2025-01-01'}
+    tm = archive()
+    tm.append_to_log(tender)
+    tm.tenders.append(tender)
+    tm.save_to_json()
+    # Simulate a crash between writing the snapshot and dropping the log
+    tm.append_to_log(tender)
+    tm.tender_log.close()
+
+    tm = TenderManager()
+    assert len(tm.tenders) == 1
+
+
+def test_seen_log_kept_when_a_snapshot_write_fails(archive, monkeypatch):
+    tm = archive()
+    tm.mark_seen('design of building|||org|||2025-01-01')
+
+    @contextmanager
+    def failing_atomic_path(filename):
+        raise OSError('disk full')
+        yield
+
+    with monkeypatch.context() as m:
+        m.setattr(mini_tender, 'atomic_path', failing_atomic_path)
+        tm.flush_seen_keys()
+    assert os.path.exists('seen_keys.wal')
+    tm.seen_log.close()
+
+    assert 'design of building|||org|||2025-01-01' in TenderManager().seen_keys
+    assert not os.path.exists('seen_keys.wal')
+
+
+def test_json_mode_logs_inserts_and_snapshots_in_batches(archive):
+    tm = archive(storage_mode='json')
+    tm.snapshot_commit.max_pending = 3
+    for n in range(2):
+        tm.insert_tender({'title': f'Design of hall {n}', 'organization': 'org'})
+    with open('tenders.json', encoding='utf-8') as f:
+        assert json.load(f) == []  # not rewritten per insert...
+    tm.tender_log.close()
+    assert len(TenderManager(storage_mode='json').tenders) == 2  # ...but recoverable
+
+    tm.insert_tender({'title': 'Design of hall 2', 'organization': 'org'})
+    with open('tenders.json', encoding='utf-8') as f:
+        assert len(json.load(f)) == 3
+    assert not tm.tender_log.exists()
+
+
+def test_insert_after_crash_mid_append_survives_reload(archive):
+    tm = archive(storage_mode='jsonl')
+    for hall in 'AB':
+        tm.insert_tender({'title': f'Design of hall {hall}', 'organization': 'org'})
+    tm.tender_log.close()
+    with open('tenders.jsonl', 'a', encoding='utf-8') as f:
+        f.write('{"title": "Design of hall C", "organiz')  # crash mid-append
+
+    tm = TenderManager(storage_mode='jsonl')
+    tm.insert_tender({'title': 'Design of hall D', 'organization': 'org'})
+    tm.tender_log.close()
+
+    titles = [t['title'] for t in TenderManager(storage_mode='jsonl').tenders]
+    assert titles == ['Design of hall A', 'Design of hall B', 'Design of hall D']